@@ -0,0 +1,88 @@
+"""tenant-scoped composite and partial indexes
+
+Revision ID: 0009
+Revises: 72dd65a116dc
+Create Date: 2026-10-16
+
+Restores the per-tenant indexes that a7f12884ef02 dropped (the models did not declare
+them, so autogenerate removed them) and adds composite/partial ones matching the list
+endpoints: tenant_id first, then the filter or sort column. Partial indexes cover only
+live rows (is_archived = false / is_active = true).
+
+Built CONCURRENTLY so production tables stay writable while the migration runs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0009"
+down_revision: Union[str, None] = "72dd65a116dc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ARCHIVED = sa.text("is_archived = false")
+_ACTIVE = sa.text("is_active = true")
+
+# (name, table, columns, partial predicate, schema)
+INDEXES = [
+    ("ix_item_types_tenant_code", "item_types", ["tenant_id", "code"], None, None),
+    ("ix_item_types_tenant_live", "item_types", ["tenant_id", "code"], _ARCHIVED, None),
+    ("ix_skus_tenant_code", "skus", ["tenant_id", "sku_code"], None, None),
+    ("ix_skus_tenant_live", "skus", ["tenant_id", "sku_code"], _ARCHIVED, None),
+    ("ix_skus_item_type_id", "skus", ["item_type_id"], None, None),
+    ("ix_warehouses_tenant_code", "warehouses", ["tenant_id", "code"], None, None),
+    ("ix_warehouses_tenant_active", "warehouses", ["tenant_id", "code"], _ACTIVE, None),
+    ("ix_stock_ledger_tenant_sku_warehouse", "stock_ledger", ["tenant_id", "sku_id", "warehouse_id"], None, None),
+    ("ix_stock_ledger_tenant_created", "stock_ledger", ["tenant_id", "created_at", "id"], None, None),
+    ("ix_stock_ledger_reference_id", "stock_ledger", ["reference_id"], None, None),
+    ("ix_locations_tenant_warehouse_code", "locations", ["tenant_id", "warehouse_id", "code"], None, None),
+    ("ix_locations_parent_id", "locations", ["parent_id"], None, None),
+    ("ix_transfer_orders_tenant_created", "transfer_orders", ["tenant_id", "created_at"], None, None),
+    ("ix_transfer_orders_tenant_status", "transfer_orders", ["tenant_id", "status"], None, None),
+    ("ix_transfer_order_lines_transfer_order_id", "transfer_order_lines", ["transfer_order_id"], None, None),
+    ("ix_purchase_orders_tenant_created", "purchase_orders", ["tenant_id", "created_at"], None, None),
+    ("ix_purchase_orders_tenant_status", "purchase_orders", ["tenant_id", "status"], None, None),
+    ("ix_purchase_order_lines_po_id", "purchase_order_lines", ["po_id"], None, None),
+    ("ix_sales_orders_tenant_status", "sales_orders", ["tenant_id", "status"], None, None),
+    ("ix_sales_order_lines_sales_order_id", "sales_order_lines", ["sales_order_id"], None, None),
+    ("ix_boms_tenant_finished_sku", "boms", ["tenant_id", "finished_sku_id"], None, None),
+    ("ix_bom_lines_bom_id", "bom_lines", ["bom_id"], None, None),
+    ("ix_assembly_orders_tenant_started", "assembly_orders", ["tenant_id", "started_at"], None, None),
+    ("ix_assembly_orders_tenant_status", "assembly_orders", ["tenant_id", "status"], None, None),
+    ("ix_serial_numbers_tenant_sku_status", "serial_numbers", ["tenant_id", "sku_id", "status"], None, None),
+    ("ix_serial_numbers_tenant_status", "serial_numbers", ["tenant_id", "status"], None, None),
+    ("ix_invitation_tokens_tenant_email", "invitation_tokens", ["tenant_id", "email"], None, None),
+    ("ix_api_keys_tenant_active", "api_keys", ["tenant_id", "created_at"], _ACTIVE, None),
+    ("ix_audit_log_tenant_created", "audit_log", ["tenant_id", "created_at"], None, None),
+    ("ix_users_tenant_email", "users", ["tenant_id", "email"], None, None),
+    ("ix_users_tenant_created", "users", ["tenant_id", "created_at"], None, None),
+    ("ix_webhooks_tenant_active", "webhooks", ["tenant_id"], _ACTIVE, None),
+    ("ix_module_installs_tenant_slug_active", "module_installs", ["tenant_id", "module_slug"], _ACTIVE, "public"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where, schema in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema=schema,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _where, schema in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema=schema,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,49 @@
+"""jsonb_path_ops GIN indexes for containment lookups
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+
+Replaces the default-opclass idx_skus_attributes (jsonb_ops, dropped by a7f12884ef02) with
+a jsonb_path_ops index, and indexes webhooks.events for subscriber lookups by event type.
+jsonb_path_ops only supports @>, which is the only JSONB operator these columns are
+filtered with; write-heavy payload columns (audit_log, webhook_deliveries) are left
+unindexed since nothing queries into them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("idx_skus_attributes", table_name="skus", postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            "ix_skus_attributes_gin",
+            "skus",
+            ["attributes"],
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_webhooks_events_gin",
+            "webhooks",
+            ["events"],
+            postgresql_using="gin",
+            postgresql_ops={"events": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_webhooks_events_gin", table_name="webhooks", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_skus_attributes_gin", table_name="skus", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,38 @@
+"""unique (tenant_id, serial_number, sku_id) on serial_numbers
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+
+Backs scanner lookups by serial code with a B-tree and lets the engine reject duplicate
+registrations (previously a SELECT-then-INSERT pre-check). The unique index is built
+CONCURRENTLY, then attached as a constraint.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_serial_numbers_tenant_serial_sku",
+            "serial_numbers",
+            ["tenant_id", "serial_number", "sku_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.execute(
+        "ALTER TABLE serial_numbers ADD CONSTRAINT uq_serial_numbers_tenant_serial_sku "
+        "UNIQUE USING INDEX uq_serial_numbers_tenant_serial_sku"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_serial_numbers_tenant_serial_sku", "serial_numbers", type_="unique")
@@ -0,0 +1,62 @@
+"""generate UUID primary keys in the database
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+
+Models now declare server_default=gen_random_uuid() on every id column instead of a
+Python-side uuid.uuid4 default; the ORM reads the key back via INSERT ... RETURNING.
+gen_random_uuid() is built in since PostgreSQL 13, so no pgcrypto extension is needed.
+Setting a column default is a catalog-only change.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "tenants",
+    "users",
+    "user_roles",
+    "item_types",
+    "skus",
+    "warehouses",
+    "stock_ledger",
+    "locations",
+    "transfer_orders",
+    "transfer_order_lines",
+    "invitation_tokens",
+    "api_keys",
+    "audit_log",
+    "boms",
+    "bom_lines",
+    "purchase_orders",
+    "purchase_order_lines",
+    "sales_orders",
+    "sales_order_lines",
+    "assembly_orders",
+    "workflows",
+    "workflow_actions",
+    "workflow_executions",
+    "webhooks",
+    "webhook_deliveries",
+    "module_installs",
+    "module_attribute_types",
+    "module_workflow_extensions",
+    "serial_numbers",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=None)
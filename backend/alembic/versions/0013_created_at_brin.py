@@ -0,0 +1,45 @@
+"""BRIN indexes on created_at for append-only tables
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+
+stock_ledger and audit_log are insert-only and written in time order (their ids are
+UUIDv7 since the previous change), so a BRIN on created_at stays selective for date
+ranges at a fraction of a B-tree's size. webhook_deliveries has no created_at column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["stock_ledger", "audit_log"]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f"ix_{table}_created_brin",
+                table,
+                ["created_at"],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                f"ix_{table}_created_brin",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
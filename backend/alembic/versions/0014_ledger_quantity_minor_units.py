@@ -0,0 +1,33 @@
+"""Store stock_ledger.quantity_delta as BIGINT minor units
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16
+
+Quantities are kept as integer ten-thousandths (the old NUMERIC(18, 4) scale), so the
+balance SUMs that every stock read and the negative-stock trigger run stay in integer
+arithmetic. check_negative_stock() only compares the sign, so it needs no change.
+The column type change rewrites the table under an ACCESS EXCLUSIVE lock.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE stock_ledger ALTER COLUMN quantity_delta TYPE bigint "
+        "USING round(quantity_delta * 10000)::bigint"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE stock_ledger ALTER COLUMN quantity_delta TYPE numeric(18, 4) "
+        "USING quantity_delta::numeric / 10000"
+    )
@@ -0,0 +1,43 @@
+"""CHECK constraints on enum-backed string columns
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+
+Pins status/role/type columns to their Python Enum values. Each constraint is added
+NOT VALID (brief lock, no scan) and validated separately, which only takes a
+SHARE UPDATE EXCLUSIVE lock while existing rows are checked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ROLES = ("ADMIN", "MANAGER", "FLOOR_ASSOCIATE")
+
+# (constraint, table, column, allowed values)
+CHECKS = [
+    ("ck_purchase_orders_status", "purchase_orders", "status", ("DRAFT", "ORDERED", "PARTIAL", "RECEIVED", "CANCELLED")),
+    ("ck_transfer_orders_status", "transfer_orders", "status", ("PENDING", "IN_TRANSIT", "RECEIVED", "CANCELLED")),
+    ("ck_serial_numbers_status", "serial_numbers", "status", ("IN_STOCK", "SHIPPED", "RETURNED", "QUARANTINED", "WRITE_OFF")),
+    ("ck_locations_location_type", "locations", "location_type", ("ZONE", "AISLE", "BIN")),
+    ("ck_users_role", "users", "role", _ROLES),
+    ("ck_invitation_tokens_role", "invitation_tokens", "role", _ROLES),
+    ("ck_module_workflow_extensions_type", "module_workflow_extensions", "extension_type", ("TRIGGER", "ACTION")),
+]
+
+
+def upgrade() -> None:
+    for name, table, column, values in CHECKS:
+        allowed = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({column} IN ({allowed})) NOT VALID")
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(CHECKS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,47 @@
+"""skus.attr_expiry_date generated from attributes->>'expiry_date'
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+
+expiry_date (contributed by the expiry-tracker module) is the attribute key SKU lists
+filter on; a stored generated column with a B-tree turns "expires before X" into an
+index range scan instead of parsing JSONB per candidate row. Adding a STORED column
+rewrites skus under an ACCESS EXCLUSIVE lock; the index is then built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE skus ADD COLUMN IF NOT EXISTS attr_expiry_date varchar "
+        "GENERATED ALWAYS AS (attributes->>'expiry_date') STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_skus_tenant_expiry",
+            "skus",
+            ["tenant_id", "attr_expiry_date"],
+            postgresql_where=sa.text("attr_expiry_date IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_skus_tenant_expiry",
+            table_name="skus",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("skus", "attr_expiry_date")
@@ -0,0 +1,122 @@
+"""range-partition stock_ledger and audit_log by month on created_at
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16
+
+Both tables are append-only and grow without bound. Monthly partitions let date-bounded
+queries prune to a few partitions, keep per-partition indexes small, and let old months
+be detached or dropped instead of DELETEd. The primary key becomes (id, created_at)
+because a partitioned table's unique constraints must include the partition key.
+
+ensure_monthly_partitions(parent, since, months_ahead) creates any missing partitions from
+``since`` up to ``months_ahead`` months past the current one; the migration calls it to
+cover existing rows and app.tasks.partition_tasks calls it daily.
+
+Each table is rebuilt (rename, create partitioned copy, INSERT ... SELECT, drop old), which
+holds an ACCESS EXCLUSIVE lock for the duration of the copy.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 2
+
+_TENANT_POLICY = "USING (tenant_id = nullif(trim(current_setting('app.tenant_id', true)), '')::uuid)"
+
+# table -> (foreign keys as (column, referenced table, on delete), index DDL)
+TABLES = {
+    "stock_ledger": (
+        [
+            ("tenant_id", "tenants", "CASCADE"),
+            ("sku_id", "skus", "RESTRICT"),
+            ("warehouse_id", "warehouses", "RESTRICT"),
+            ("location_id", "locations", "SET NULL"),
+            ("actor_id", "users", "SET NULL"),
+        ],
+        [
+            "CREATE INDEX ix_stock_ledger_tenant_sku_warehouse ON stock_ledger (tenant_id, sku_id, warehouse_id)",
+            "CREATE INDEX ix_stock_ledger_tenant_created ON stock_ledger (tenant_id, created_at, id)",
+            "CREATE INDEX ix_stock_ledger_reference_id ON stock_ledger (reference_id)",
+            "CREATE INDEX ix_stock_ledger_created_brin ON stock_ledger USING brin (created_at) WITH (pages_per_range = 32)",
+        ],
+    ),
+    "audit_log": (
+        [
+            ("tenant_id", "tenants", "CASCADE"),
+            ("actor_id", "users", "SET NULL"),
+        ],
+        [
+            "CREATE INDEX ix_audit_log_tenant_created ON audit_log (tenant_id, created_at)",
+            "CREATE INDEX ix_audit_log_created_brin ON audit_log USING brin (created_at) WITH (pages_per_range = 32)",
+        ],
+    ),
+}
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    fks, indexes = TABLES[table]
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    suffix = " PARTITION BY RANGE (created_at)" if partitioned else ""
+    op.execute(f"CREATE TABLE {table} (LIKE {table}_old INCLUDING DEFAULTS){suffix}")
+    if partitioned:
+        op.execute(
+            f"SELECT ensure_monthly_partitions('{table}', "
+            f"coalesce((SELECT min(created_at) FROM {table}_old), now()), {MONTHS_AHEAD})"
+        )
+    op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+    # Takes the old indexes, trigger and RLS policy with it; all are recreated below
+    op.execute(f"DROP TABLE {table}_old")
+
+    pk = "id, created_at" if partitioned else "id"
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({pk})")
+    for column, target, on_delete in fks:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {target} (id) ON DELETE {on_delete}"
+        )
+    for ddl in indexes:
+        op.execute(ddl)
+    op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+    op.execute(f"CREATE POLICY {table}_tenant_policy ON {table} {_TENANT_POLICY}")
+    if table == "stock_ledger":
+        op.execute(
+            "CREATE TRIGGER trg_check_negative_stock BEFORE INSERT ON stock_ledger "
+            "FOR EACH ROW EXECUTE FUNCTION check_negative_stock()"
+        )
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_monthly_partitions(parent text, since timestamptz, months_ahead int)
+        RETURNS void AS $$
+        DECLARE
+            m date := date_trunc('month', since AT TIME ZONE 'UTC')::date;
+            stop date := (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead))::date;
+        BEGIN
+            WHILE m <= stop LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    parent || to_char(m, '"_y"YYYY"m"MM'),
+                    parent,
+                    m::timestamp AT TIME ZONE 'UTC',
+                    (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in TABLES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        _rebuild(table, partitioned=False)
+    op.execute("DROP FUNCTION IF EXISTS ensure_monthly_partitions(text, timestamptz, int)")
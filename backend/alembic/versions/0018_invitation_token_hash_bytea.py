@@ -0,0 +1,31 @@
+"""invitation_tokens.token_hash as raw 32-byte bytea
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16
+
+The SHA-256 digest was stored as 64 hex characters in a varchar(255); raw bytes halve the
+column and its unique index. Existing rows are converted in place with decode(.., 'hex').
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE invitation_tokens ALTER COLUMN token_hash TYPE bytea "
+        "USING decode(token_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE invitation_tokens ALTER COLUMN token_hash TYPE varchar(255) "
+        "USING encode(token_hash, 'hex')"
+    )
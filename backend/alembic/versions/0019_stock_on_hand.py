@@ -0,0 +1,86 @@
+"""stock_on_hand: trigger-maintained current balance per tenant/SKU/warehouse
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+
+Current stock was a SUM over every ledger row of a SKU/warehouse. An AFTER INSERT trigger
+on stock_ledger now upserts the running balance into stock_on_hand and raises on a
+negative result, replacing check_negative_stock()'s full SUM. The upsert's row lock also
+serialises concurrent postings to the same SKU/warehouse, which the SUM check did not.
+quantity uses the ledger's BIGINT minor units. stock_ledger is locked against writes
+while the table is backfilled.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_on_hand",
+        sa.Column("tenant_id", UUID(as_uuid=True), sa.ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("sku_id", UUID(as_uuid=True), sa.ForeignKey("skus.id", ondelete="RESTRICT"), primary_key=True),
+        sa.Column("warehouse_id", UUID(as_uuid=True), sa.ForeignKey("warehouses.id", ondelete="RESTRICT"), primary_key=True),
+        sa.Column("quantity", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_stock_on_hand_tenant_warehouse", "stock_on_hand", ["tenant_id", "warehouse_id"])
+
+    op.execute("ALTER TABLE stock_on_hand ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        "CREATE POLICY stock_on_hand_tenant_policy ON stock_on_hand "
+        "USING (tenant_id = nullif(trim(current_setting('app.tenant_id', true)), '')::uuid)"
+    )
+
+    op.execute("LOCK TABLE stock_ledger IN SHARE MODE")
+    op.execute("""
+        INSERT INTO stock_on_hand (tenant_id, sku_id, warehouse_id, quantity)
+        SELECT tenant_id, sku_id, warehouse_id, sum(quantity_delta)
+        FROM stock_ledger
+        GROUP BY tenant_id, sku_id, warehouse_id
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION apply_stock_on_hand()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            new_balance BIGINT;
+        BEGIN
+            INSERT INTO stock_on_hand AS s (tenant_id, sku_id, warehouse_id, quantity)
+            VALUES (NEW.tenant_id, NEW.sku_id, NEW.warehouse_id, NEW.quantity_delta)
+            ON CONFLICT (tenant_id, sku_id, warehouse_id)
+            DO UPDATE SET quantity = s.quantity + EXCLUDED.quantity, updated_at = now()
+            RETURNING s.quantity INTO new_balance;
+            IF new_balance < 0 THEN
+                RAISE EXCEPTION 'Negative stock not allowed: sku_id=%, warehouse_id=%, balance would be %',
+                    NEW.sku_id, NEW.warehouse_id, new_balance::numeric / 10000;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("DROP TRIGGER IF EXISTS trg_check_negative_stock ON stock_ledger")
+    op.execute("""
+        CREATE TRIGGER trg_stock_on_hand
+        AFTER INSERT ON stock_ledger
+        FOR EACH ROW EXECUTE FUNCTION apply_stock_on_hand();
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_stock_on_hand ON stock_ledger")
+    op.execute("DROP FUNCTION IF EXISTS apply_stock_on_hand()")
+    op.execute("""
+        CREATE TRIGGER trg_check_negative_stock
+        BEFORE INSERT ON stock_ledger
+        FOR EACH ROW EXECUTE FUNCTION check_negative_stock();
+    """)
+    op.drop_table("stock_on_hand")
@@ -0,0 +1,106 @@
+"""locations.path: trigger-maintained ltree for subtree and ancestor queries
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+
+Walking zone > aisle > bin through parent_id cost one query per level. path holds the
+root-to-self chain of location ids (hyphens stripped, one ltree label each), so "all
+bins under zone X" is ``path <@ X.path`` and a location's ancestors are ``path @> its
+path``, both answered by one GiST index scan.
+
+trg_locations_path sets path on INSERT and whenever parent_id changes (including the
+SET NULL from a deleted parent) and refuses to move a location under its own subtree;
+trg_locations_path_cascade then rewrites the moved subtree's prefix.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS ltree")
+    op.execute("ALTER TABLE locations ADD COLUMN IF NOT EXISTS path ltree")
+    op.execute("""
+        WITH RECURSIVE tree AS (
+            SELECT id, text2ltree(replace(id::text, '-', '')) AS path
+            FROM locations WHERE parent_id IS NULL
+            UNION ALL
+            SELECT l.id, tree.path || replace(l.id::text, '-', '')
+            FROM locations l JOIN tree ON l.parent_id = tree.id
+        )
+        UPDATE locations SET path = tree.path FROM tree WHERE locations.id = tree.id
+    """)
+    op.execute("ALTER TABLE locations ALTER COLUMN path SET NOT NULL")
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_location_path()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            parent_path ltree;
+        BEGIN
+            IF NEW.parent_id IS NULL THEN
+                NEW.path := text2ltree(replace(NEW.id::text, '-', ''));
+            ELSE
+                SELECT path INTO parent_path FROM locations WHERE id = NEW.parent_id;
+                IF TG_OP = 'UPDATE' AND parent_path <@ OLD.path THEN
+                    RAISE EXCEPTION 'Location % cannot be moved under its own subtree', NEW.id;
+                END IF;
+                NEW.path := parent_path || replace(NEW.id::text, '-', '');
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION cascade_location_path()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE locations
+            SET path = NEW.path || subpath(path, nlevel(OLD.path))
+            WHERE path <@ OLD.path AND id <> NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_locations_path
+        BEFORE INSERT OR UPDATE OF parent_id ON locations
+        FOR EACH ROW EXECUTE FUNCTION set_location_path();
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_locations_path_cascade
+        AFTER UPDATE OF parent_id ON locations
+        FOR EACH ROW WHEN (OLD.path IS DISTINCT FROM NEW.path)
+        EXECUTE FUNCTION cascade_location_path();
+    """)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_locations_path_gist",
+            "locations",
+            ["path"],
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_locations_path_gist",
+            table_name="locations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS trg_locations_path_cascade ON locations")
+    op.execute("DROP TRIGGER IF EXISTS trg_locations_path ON locations")
+    op.execute("DROP FUNCTION IF EXISTS cascade_location_path()")
+    op.execute("DROP FUNCTION IF EXISTS set_location_path()")
+    op.drop_column("locations", "path")
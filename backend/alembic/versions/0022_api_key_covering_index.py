@@ -0,0 +1,46 @@
+"""covering partial index for the API key auth lookup
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-16
+
+Every X-API-Key request that misses the Redis identity cache looks its key up by
+key_prefix among active keys. ix_api_keys_key_prefix was dropped by a7f12884ef02, so
+that lookup scanned the table. The new index is keyed on key_prefix for is_active rows
+and INCLUDEs every column the lookup reads (key_hash, id, tenant_id, created_by), so it
+is answered by an index-only scan with no heap fetch once the visibility map is current.
+
+Built CONCURRENTLY so api_keys stays writable while the migration runs.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0022"
+down_revision: Union[str, None] = "0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_api_keys_prefix_active_covering",
+            "api_keys",
+            ["key_prefix"],
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_include=["key_hash", "id", "tenant_id", "created_by"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_api_keys_prefix_active_covering",
+            table_name="api_keys",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
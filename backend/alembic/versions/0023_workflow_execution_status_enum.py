@@ -0,0 +1,34 @@
+"""workflow_executions.status as a native ENUM
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-16
+
+workflow_executions gets a row per dispatched workflow and is never pruned. Its status
+values are a closed set written only by the workflow task, so a 4-byte enum replaces the
+varchar. The type change rewrites the table under an ACCESS EXCLUSIVE lock.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = ("PENDING", "RUNNING", "SUCCESS", "FAILED", "SKIPPED")
+
+
+def upgrade() -> None:
+    values = ", ".join(f"'{v}'" for v in STATUSES)
+    op.execute(f"CREATE TYPE workflow_execution_status AS ENUM ({values})")
+    op.execute(
+        "ALTER TABLE workflow_executions ALTER COLUMN status TYPE workflow_execution_status "
+        "USING status::workflow_execution_status"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE workflow_executions ALTER COLUMN status TYPE varchar(50) USING status::text")
+    op.execute("DROP TYPE workflow_execution_status")
@@ -0,0 +1,41 @@
+"""partial (tenant_id, trigger_type) index for workflow dispatch
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-16
+
+WorkflowEngine.evaluate looks up active workflows by tenant and trigger type on every
+ledger event, and workflows had no index beyond its primary key. Inactive workflows are
+left out of the index. Built CONCURRENTLY so workflows stays writable.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workflows_dispatch",
+            "workflows",
+            ["tenant_id", "trigger_type"],
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_workflows_dispatch",
+            table_name="workflows",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
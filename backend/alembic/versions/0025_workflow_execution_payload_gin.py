@@ -0,0 +1,42 @@
+"""GIN (jsonb_path_ops) index on workflow_executions.trigger_payload
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-16
+
+The executions listing can filter on trigger_payload @> {"sku_id": ...}; without an
+index each candidate row's JSONB is detoasted and scanned. jsonb_path_ops only serves
+containment, which is the only payload operator used. Built CONCURRENTLY so the
+workflow task can keep inserting executions.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0025"
+down_revision: Union[str, None] = "0024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workflow_executions_payload_gin",
+            "workflow_executions",
+            ["trigger_payload"],
+            postgresql_using="gin",
+            postgresql_ops={"trigger_payload": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_workflow_executions_payload_gin",
+            table_name="workflow_executions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,39 @@
+"""(workflow_id, sequence_order) index on workflow_actions
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-16
+
+workflow_actions had no index on its foreign key, so loading one workflow's actions
+scanned the table and sorted. Both loaders filter on workflow_id and order by
+sequence_order, which this index returns presorted. Built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workflow_actions_workflow_seq",
+            "workflow_actions",
+            ["workflow_id", "sequence_order"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_workflow_actions_workflow_seq",
+            table_name="workflow_actions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
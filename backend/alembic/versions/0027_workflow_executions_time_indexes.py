@@ -0,0 +1,50 @@
+"""time indexes on workflow_executions
+
+Revision ID: 0027
+Revises: 0026
+Create Date: 2026-10-16
+
+workflow_executions gains a row per dispatch and is never pruned. The execution history
+endpoint reads one workflow's newest runs, served by (workflow_id, started_at). Rows are
+inserted in started_at order, so a BRIN on started_at covers time-window scans (retention,
+dashboards) at a fraction of a B-tree's size. Built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0027"
+down_revision: Union[str, None] = "0026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workflow_executions_workflow_started",
+            "workflow_executions",
+            ["workflow_id", "started_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_workflow_executions_started_brin",
+            "workflow_executions",
+            ["started_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in ("ix_workflow_executions_started_brin", "ix_workflow_executions_workflow_started"):
+            op.drop_index(
+                name,
+                table_name="workflow_executions",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
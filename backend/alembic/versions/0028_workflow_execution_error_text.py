@@ -0,0 +1,35 @@
+"""workflow_executions.error_message as text with a length cap
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-16
+
+The execute_workflow task now records the failing action's error on the execution,
+truncated to 16384 characters; the CHECK keeps a pathological message from bloating
+the table. varchar to text is binary-compatible, so the type change does not rewrite
+the table. The constraint is added NOT VALID and validated separately.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ERROR_MESSAGE_MAX_LEN = 16384
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE workflow_executions ALTER COLUMN error_message TYPE text")
+    op.execute(
+        "ALTER TABLE workflow_executions ADD CONSTRAINT ck_workflow_executions_error_message_length "
+        f"CHECK (length(error_message) <= {ERROR_MESSAGE_MAX_LEN}) NOT VALID"
+    )
+    op.execute("ALTER TABLE workflow_executions VALIDATE CONSTRAINT ck_workflow_executions_error_message_length")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_workflow_executions_error_message_length", "workflow_executions", type_="check")
+    op.execute("ALTER TABLE workflow_executions ALTER COLUMN error_message TYPE varchar")
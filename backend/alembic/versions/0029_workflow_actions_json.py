@@ -0,0 +1,81 @@
+"""workflows.actions_json: trigger-maintained copy of the workflow's actions
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-10-16
+
+Actions are written once with their workflow and always read together with it. The
+execute_workflow task now reads the ordered action list from the workflow row instead
+of querying workflow_actions, which stays the source of truth for the API.
+trg_workflow_actions_json rebuilds the array on any change to a workflow's actions, so
+every writer keeps the copy in sync. ix_workflows_actions_gin (jsonb_path_ops) answers
+"workflows using action_type X" containment queries.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0029"
+down_revision: Union[str, None] = "0028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ACTIONS_JSON = """
+    coalesce((
+        SELECT jsonb_agg(jsonb_build_object(
+            'id', a.id,
+            'sequence_order', a.sequence_order,
+            'action_type', a.action_type,
+            'action_config', a.action_config
+        ) ORDER BY a.sequence_order)
+        FROM workflow_actions a WHERE a.workflow_id = workflows.id
+    ), '[]'::jsonb)
+"""
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE workflows ADD COLUMN IF NOT EXISTS actions_json jsonb NOT NULL DEFAULT '[]'::jsonb")
+    op.execute(f"UPDATE workflows SET actions_json = {_ACTIONS_JSON}")
+
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION sync_workflow_actions_json()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE workflows SET actions_json = {_ACTIONS_JSON}
+            WHERE id IN (
+                CASE WHEN TG_OP <> 'INSERT' THEN OLD.workflow_id END,
+                CASE WHEN TG_OP <> 'DELETE' THEN NEW.workflow_id END
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_workflow_actions_json
+        AFTER INSERT OR UPDATE OR DELETE ON workflow_actions
+        FOR EACH ROW EXECUTE FUNCTION sync_workflow_actions_json();
+    """)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_workflows_actions_gin",
+            "workflows",
+            ["actions_json"],
+            postgresql_using="gin",
+            postgresql_ops={"actions_json": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_workflows_actions_gin",
+            table_name="workflows",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS trg_workflow_actions_json ON workflow_actions")
+    op.execute("DROP FUNCTION IF EXISTS sync_workflow_actions_json()")
+    op.drop_column("workflows", "actions_json")
@@ -0,0 +1,113 @@
+"""DEFAULT partitions for stock_ledger and audit_log
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-10-16
+
+Monthly partitions are created ahead of time by the daily ensure_partitions task. If that
+task stops running for longer than the lead time, a row whose created_at has no partition
+would fail to insert, and a failed ledger insert is a failed stock movement. The DEFAULT
+partition catches those rows instead.
+
+ensure_monthly_partitions() is redefined to cope with that. Postgres refuses to create a
+range partition while the default partition holds rows in that range, so for such a month
+the function builds the table standalone, moves the rows out of the default partition and
+then ATTACHes it. Only INSERT triggers exist on these tables, so the move neither re-runs
+the stock checks nor touches stock_on_hand.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0030"
+down_revision: Union[str, None] = "0029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("stock_ledger", "audit_log")
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_monthly_partitions(parent text, since timestamptz, months_ahead int)
+        RETURNS void AS $$
+        DECLARE
+            m date := date_trunc('month', since AT TIME ZONE 'UTC')::date;
+            stop date := (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead))::date;
+            part text;
+            lo timestamptz;
+            hi timestamptz;
+            stranded boolean;
+        BEGIN
+            WHILE m <= stop LOOP
+                part := parent || to_char(m, '"_y"YYYY"m"MM');
+                lo := m::timestamp AT TIME ZONE 'UTC';
+                hi := (m + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+                IF to_regclass(part) IS NULL THEN
+                    stranded := false;
+                    IF to_regclass(parent || '_default') IS NOT NULL THEN
+                        EXECUTE format(
+                            'SELECT EXISTS (SELECT 1 FROM %I WHERE created_at >= %L AND created_at < %L)',
+                            parent || '_default', lo, hi
+                        ) INTO stranded;
+                    END IF;
+                    IF stranded THEN
+                        EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', part, parent);
+                        EXECUTE format(
+                            'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                            'INSERT INTO %I SELECT * FROM moved',
+                            parent || '_default', lo, hi, part
+                        );
+                        EXECUTE format(
+                            'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                            parent, part, lo, hi
+                        );
+                    ELSE
+                        EXECUTE format(
+                            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                            part, parent, lo, hi
+                        );
+                    END IF;
+                END IF;
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    for table in TABLES:
+        op.execute(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        # Rows in a default partition have no monthly home yet; refuse rather than drop them
+        op.execute(f"""
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1 FROM {table}_default) THEN
+                    RAISE EXCEPTION '{table}_default is not empty; run ensure_monthly_partitions first';
+                END IF;
+            END;
+            $$
+        """)
+        op.execute(f"DROP TABLE IF EXISTS {table}_default")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_monthly_partitions(parent text, since timestamptz, months_ahead int)
+        RETURNS void AS $$
+        DECLARE
+            m date := date_trunc('month', since AT TIME ZONE 'UTC')::date;
+            stop date := (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead))::date;
+        BEGIN
+            WHILE m <= stop LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    parent || to_char(m, '"_y"YYYY"m"MM'),
+                    parent,
+                    m::timestamp AT TIME ZONE 'UTC',
+                    (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
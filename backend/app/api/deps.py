@@ -1,11 +1,14 @@
 """NEXUS IMS — FastAPI dependencies (auth, DB, permissions) — Block 4."""
-from typing import Annotated
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Annotated, TypeVar
 from uuid import UUID
 
+import msgspec
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, tenant_session
 
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
@@ -59,23 +62,17 @@ PERMISSION_MATRIX: dict[str, set[str]] = {
 }
 
 
+@dataclass(slots=True, frozen=True)
 class CurrentUser:
-    """User identity from JWT or API key — set on request.state by middleware."""
-
-    def __init__(
-        self,
-        id: UUID,
-        email: str,
-        tenant_id: UUID,
-        role: str,
-        warehouse_scope: list[str] | None = None,
-    ):
-        self.id = id
-        self.email = email
-        self.tenant_id = tenant_id
-        self.role = role
-        # None = all warehouses; list of UUID strings = restricted warehouses
-        self.warehouse_scope: list[str] | None = warehouse_scope
+    """User identity from JWT or API key — set on request.state by middleware.
+    Frozen: the auth middleware shares one instance across requests for the same token."""
+
+    id: UUID
+    email: str
+    tenant_id: UUID
+    role: str
+    # None = all warehouses; list of UUID strings = restricted warehouses
+    warehouse_scope: list[str] | None = None
 
     def has_permission(self, permission: str) -> bool:
         return permission in PERMISSION_MATRIX.get(self.role, set())
@@ -86,26 +83,66 @@ async def get_current_user(request: Request) -> CurrentUser | None:
     return getattr(request.state, "user", None)
 
 
-async def require_auth(request: Request) -> CurrentUser:
-    """Require authenticated user. Raise 401 if not logged in."""
+def _authorize(request: Request, permission: str | None = None) -> CurrentUser:
+    """Return the authenticated user, raising 401/403 when missing or lacking ``permission``."""
     user = getattr(request.state, "user", None)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
+    if permission is not None and not user.has_permission(permission):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied: '{permission}' required. Your role: {user.role}",
+        )
     return user
 
 
+async def require_auth(request: Request) -> CurrentUser:
+    """Require authenticated user. Raise 401 if not logged in."""
+    return _authorize(request)
+
+
 def require_permission(permission: str):
     """Dependency factory: require specific RBAC permission."""
 
-    async def _check(user: CurrentUser = Depends(require_auth)) -> CurrentUser:
-        if not user.has_permission(permission):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied: '{permission}' required. Your role: {user.role}",
-            )
-        return user
+    async def _check(request: Request) -> CurrentUser:
+        return _authorize(request, permission)
 
     return _check
+
+
+def authed_db(permission: str | None = None):
+    """
+    Dependency factory: authorize the caller and open the tenant session in one step.
+    Replaces the require_auth/require_permission + get_db pair with a single resolved
+    dependency; auth failures are raised before a DB connection is checked out.
+    """
+
+    async def _dep(request: Request) -> AsyncGenerator[tuple[AsyncSession, CurrentUser], None]:
+        user = _authorize(request, permission)
+        async with tenant_session(request.scope["state"].get("tenant_id")) as session:
+            yield session, user
+
+    return _dep
+
+
+AuthedDb = Annotated[tuple[AsyncSession, CurrentUser], Depends(authed_db())]
+
+_T = TypeVar("_T")
+
+
+def msgspec_body(tp: type[_T]):
+    """
+    Dependency factory: decode the raw request body straight into a msgspec.Struct.
+    Bypasses FastAPI's Pydantic body parsing; decode/validation errors map to 422.
+    """
+
+    async def _dep(request: Request) -> _T:
+        try:
+            return msgspec.json.decode(await request.body(), type=tp)
+        except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    return _dep
@@ -119,4 +119,6 @@ async def revoke_api_key(
         target_id=key_id,
     )
     await db.commit()
+    # After the commit, so a concurrent miss cannot re-cache the key from a stale read
+    await APIKeyService.invalidate_cached_identity(key_id)
     return {"data": {"id": str(key_id), "revoked": True}, "error": None, "meta": {}}
@@ -5,18 +5,21 @@ POST /auth/login, /auth/refresh, /auth/logout, GET /auth/me
 
 from uuid import UUID
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, get_db, require_auth
 from app.config import get_settings
+from app.core.auth_middleware import forget_user
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    forget_token,
     verify_password,
 )
 from app.models.tenant import User
@@ -54,9 +57,8 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ) -> TokenResponse:
 
-    # Disable RLS temporarily for login lookup
-    await db.execute(text("SELECT set_config('app.tenant_id', '', true)"))
-
+    # get_db runs without a tenant here, so app.tenant_id is '' for the login lookup
+    # scalar_one_or_none, not scalar: a duplicate active email must fail, not pick a row
     result = await db.execute(
         select(User).where(
             User.email == form_data.username,
@@ -71,7 +73,7 @@ async def login(
             detail="Invalid credentials"
         )
 
-    if not verify_password(form_data.password, user.hashed_password):
+    if not await anyio.to_thread.run_sync(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -126,13 +128,12 @@ async def refresh(
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    result = await db.execute(
+    user = await db.scalar(
         select(User).where(
             User.id == UUID(user_id),
             User.is_active == True
         )
     )
-    user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
@@ -168,7 +169,12 @@ async def refresh(
 # =========================
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(request: Request, response: Response):
+    auth = request.headers.get("Authorization", "")
+    if auth.startswith("Bearer "):
+        token = auth[7:].strip()
+        forget_token(token)
+        forget_user(token)
     response.delete_cookie("refresh_token")
     return {"message": "Logged out"}
 
@@ -2,9 +2,11 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, DbSession, get_db, require_auth
+from app.models.location import Location, LocationType
 from app.schemas.common import ApiResponse
 from app.schemas.location import LocationCreate, LocationResponse
 from app.services.location_service import LocationService
@@ -41,12 +43,9 @@ async def create_location(
     if not wh:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Warehouse not found")
     # Check code uniqueness per warehouse
-    from sqlalchemy import select
-    from app.models.location import Location as Loc
-    result = await db.execute(
-        select(Loc).where(Loc.warehouse_id == body.warehouse_id, Loc.code == body.code)
-    )
-    if result.scalar_one_or_none():
+    if await db.scalar(
+        select(Location).where(Location.warehouse_id == body.warehouse_id, Location.code == body.code)
+    ):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Location code already exists")
     loc = await LocationService.create(
         db, user.tenant_id, body.warehouse_id,
@@ -65,3 +64,20 @@ async def get_location_path(
     """Get full path (Zone > Aisle > Bin) for location."""
     path = await LocationService.get_location_path(db, id, user.tenant_id)
     return ApiResponse(data=path)
+
+
+@router.get("/{id}/descendants", response_model=ApiResponse[list[LocationResponse]])
+async def list_location_descendants(
+    id: UUID,
+    db: AsyncSession = Depends(get_db),
+    location_type: LocationType | None = Query(None, description="e.g. BIN for every bin under a zone"),
+    include_inactive: bool = False,
+    user: CurrentUser = Depends(require_auth),
+):
+    """List every location below this one at any depth."""
+    items = await LocationService.list_descendants(
+        db, user.tenant_id, id,
+        location_type=location_type.value if location_type else None,
+        include_inactive=include_inactive,
+    )
+    return ApiResponse(data=[LocationResponse.model_validate(i) for i in items])
@@ -25,14 +25,13 @@ class ExpiredSKUResponse(BaseModel):
 
 async def _check_module_active(db: AsyncSession, tenant_id: uuid.UUID) -> None:
     """Helper to verify the tracking module is actually installed and active."""
-    result = await db.execute(
+    if not await db.scalar(
         select(ModuleInstall).where(
             ModuleInstall.tenant_id == tenant_id,
             ModuleInstall.module_slug == "expiry-tracker",
             ModuleInstall.is_active == True
         )
-    )
-    if not result.scalar_one_or_none():
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The 'expiry-tracker' module is not installed or active."
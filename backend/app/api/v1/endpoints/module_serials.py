@@ -5,11 +5,12 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, get_db, require_auth
 from app.models.item_type import SKU
-from app.models.serial import SerialNumber, SerialStatus
+from app.models.serial import SERIAL_UNIQUE_CONSTRAINT, SerialNumber, SerialStatus
 from app.models.module import ModuleInstall
 
 router = APIRouter()
@@ -38,14 +39,13 @@ class UpdateSerialStatusRequest(BaseModel):
 
 async def _check_module_active(db: AsyncSession, tenant_id: uuid.UUID) -> None:
     """Helper to verify the module is actually installed and active."""
-    result = await db.execute(
+    if not await db.scalar(
         select(ModuleInstall).where(
             ModuleInstall.tenant_id == tenant_id,
             ModuleInstall.module_slug == "serial-numbers",
             ModuleInstall.is_active == True
         )
-    )
-    if not result.scalar_one_or_none():
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The 'serial-numbers' module is not installed or active."
@@ -62,8 +62,7 @@ async def register_serial_number(
     await _check_module_active(db, user.tenant_id)
 
     # Verify SKU exists and has is_serialized attribute
-    result = await db.execute(select(SKU).where(SKU.id == req.sku_id, SKU.tenant_id == user.tenant_id))
-    sku = result.scalar_one_or_none()
+    sku = await db.scalar(select(SKU).where(SKU.id == req.sku_id, SKU.tenant_id == user.tenant_id))
     
     if not sku:
         raise HTTPException(status_code=404, detail="SKU not found.")
@@ -74,17 +73,6 @@ async def register_serial_number(
             detail="Cannot register serial number: This SKU does not have the 'is_serialized' attribute set to true."
         )
 
-    # Check for duplicate serial on this SKU
-    dup_check = await db.execute(
-        select(SerialNumber).where(
-            SerialNumber.tenant_id == user.tenant_id,
-            SerialNumber.sku_id == req.sku_id,
-            SerialNumber.serial_number == req.serial_number
-        )
-    )
-    if dup_check.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Serial number already exists for this SKU.")
-
     serial = SerialNumber(
         tenant_id=user.tenant_id,
         sku_id=req.sku_id,
@@ -93,7 +81,14 @@ async def register_serial_number(
         status=SerialStatus.IN_STOCK.value
     )
     db.add(serial)
-    await db.commit()
+    # Duplicates are rejected by the unique constraint rather than a SELECT pre-check
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        await db.rollback()
+        if SERIAL_UNIQUE_CONSTRAINT in str(exc.orig):
+            raise HTTPException(status_code=400, detail="Serial number already exists for this SKU.")
+        raise
     await db.refresh(serial)
     return serial
 
@@ -133,13 +128,12 @@ async def update_serial_status(
     """Update the status of a specific serial number."""
     await _check_module_active(db, user.tenant_id)
     
-    result = await db.execute(
+    serial = await db.scalar(
         select(SerialNumber).where(
             SerialNumber.id == serial_id,
             SerialNumber.tenant_id == user.tenant_id
         )
     )
-    serial = result.scalar_one_or_none()
     if not serial:
         raise HTTPException(status_code=404, detail="Serial number not found.")
         
@@ -1,3 +1,4 @@
+import importlib
 import uuid
 from typing import Any
 
@@ -52,7 +53,6 @@ async def install_module(
         )
         
     try:
-        import importlib
         module_path, class_name = req.module_class_path.rsplit('.', 1)
         mod = importlib.import_module(module_path)
         module_class = getattr(mod, class_name)
@@ -82,7 +82,6 @@ async def uninstall_module(
     service = ModuleService(db)
 
     try:
-        import importlib
         module_path, class_name = module_class_path.rsplit('.', 1)
         mod = importlib.import_module(module_path)
         module_class = getattr(mod, class_name)
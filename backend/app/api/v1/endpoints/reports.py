@@ -106,7 +106,7 @@ async def get_accuracy(
             StockLedger.event_type == StockEventType.COUNT_CORRECT.value,
         )
     )
-    total = (await db.execute(count_q)).scalar_one()
+    total = await db.scalar(count_q)
     q = q.order_by(StockLedger.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
     result = await db.execute(q)
     rows = list(result.scalars().all())
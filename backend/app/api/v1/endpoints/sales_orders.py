@@ -1,8 +1,8 @@
 """NEXUS IMS — Sales Orders API endpoints (Block 8)."""
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from app.api.deps import CurrentUser, get_db, require_auth
 from app.schemas.common import ApiResponse
@@ -11,31 +11,43 @@ from app.schemas.sales_order import (
     SalesOrderAllocateRequest,
     SalesOrderCreate,
     SalesOrderResponse,
+    SalesOrderResponseLite,
     SalesOrderShipRequest,
     SalesOrderCancelRequest,
 )
 from app.services.fulfillment_service import FulfillmentService
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.sales_order import SalesOrder
+from sqlalchemy.orm import selectinload
+from app.models.sales_order import SalesOrder, SalesOrderLine
 
 router = APIRouter()
 
 
-@router.get("", response_model=ApiResponse[list[SalesOrderResponse]])
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": ApiResponse[list[SalesOrderResponseLite]]}},
+)
 async def list_sales_orders(
+    expand: Literal["sku"] | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: CurrentUser = Depends(require_auth),
-) -> Any:
-    """List all sales orders for the current tenant."""
-    # Simplified list
+) -> Response:
+    """List all sales orders for the current tenant. Lines carry their SKU only with ?expand=sku."""
     stmt = select(SalesOrder).where(SalesOrder.tenant_id == current_user.tenant_id).order_by(SalesOrder.created_at.desc())
+    if expand == "sku":
+        stmt = stmt.options(selectinload(SalesOrder.lines).selectinload(SalesOrderLine.sku))
+        schema = SalesOrderResponse
+    else:
+        schema = SalesOrderResponseLite
     result = await db.execute(stmt)
     orders = result.scalars().all()
-    
-    # We don't eager load lines here for list view performance, 
-    # but the frontend might just want a top-level list.
-    return ApiResponse(data=list(orders))
+
+    # Lines are selectin-loaded with the orders. Validated once here and serialized as-is: no
+    # response_model, which would re-validate the page against a union and pick the SKU variant.
+    body = ApiResponse(data=[schema.model_validate(o) for o in orders])
+    return Response(body.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{order_id}", response_model=ApiResponse[SalesOrderResponse])
@@ -8,14 +8,17 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
-    CurrentUser, get_db, require_auth, require_permission,
+    AuthedDb, CurrentUser, authed_db,
     PERM_TRANSACTIONS_RECEIVE, PERM_TRANSACTIONS_PICK, PERM_TRANSACTIONS_ADJUST,
 )
+from app.core.responses import ORJSONResponse
 from app.models.item_type import SKU
 from app.models.warehouse import StockLedger, StockEventType
+from app.schemas.common import JsonNumber
 from app.services.ledger_service import LedgerService
+from app.services.sku_bloom_service import SKUBloomService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ── Request / Response schemas ───────────────────────────────────────────────
@@ -29,9 +32,9 @@ class ScanLookupResponse(BaseModel):
     sku_id: str
     sku_code: str
     sku_name: str
-    unit_cost: float | None
-    current_stock: float
-    reorder_point: float | None
+    unit_cost: JsonNumber | None
+    current_stock: JsonNumber
+    reorder_point: JsonNumber | None
     warehouse_id: str
 
 
@@ -62,8 +65,8 @@ class ScanConfirmation(BaseModel):
     event_type: str
     sku_code: str
     sku_name: str
-    quantity: float
-    new_balance: float
+    quantity: JsonNumber
+    new_balance: JsonNumber
     message: str
 
 
@@ -71,29 +74,28 @@ class ScanConfirmation(BaseModel):
 
 async def _resolve_sku(db: AsyncSession, barcode: str, tenant_id: UUID) -> SKU:
     """Resolve barcode to SKU: try sku_code first, then UUID."""
-    # Try sku_code (most common for scanners)
-    result = await db.execute(
-        select(SKU).where(
-            SKU.tenant_id == tenant_id,
-            SKU.sku_code == barcode,
-            SKU.is_archived == False,
+    # Try sku_code (most common for scanners); the Bloom filter rejects misreads without a query
+    if await SKUBloomService.might_exist(db, tenant_id, barcode):
+        sku = await db.scalar(
+            select(SKU).where(
+                SKU.tenant_id == tenant_id,
+                SKU.sku_code == barcode,
+                SKU.is_archived == False,
+            )
         )
-    )
-    sku = result.scalar_one_or_none()
-    if sku:
-        return sku
+        if sku:
+            return sku
 
     # Try as UUID
     try:
         sku_uuid = UUID(barcode)
-        result = await db.execute(
+        sku = await db.scalar(
             select(SKU).where(
                 SKU.tenant_id == tenant_id,
                 SKU.id == sku_uuid,
                 SKU.is_archived == False,
             )
         )
-        sku = result.scalar_one_or_none()
         if sku:
             return sku
     except ValueError:
@@ -110,10 +112,10 @@ async def _resolve_sku(db: AsyncSession, barcode: str, tenant_id: UUID) -> SKU:
 @router.post("/lookup", response_model=ScanLookupResponse)
 async def scan_lookup(
     body: ScanLookupRequest,
-    user: CurrentUser = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedDb,
 ):
     """Barcode → SKU info + current stock. Optimized for scanner speed."""
+    db, user = ctx
     sku = await _resolve_sku(db, body.barcode, user.tenant_id)
     stock = await LedgerService.get_stock_level(db, user.tenant_id, sku.id, body.warehouse_id)
 
@@ -121,9 +123,9 @@ async def scan_lookup(
         sku_id=str(sku.id),
         sku_code=sku.sku_code,
         sku_name=sku.name,
-        unit_cost=float(sku.unit_cost) if sku.unit_cost else None,
-        current_stock=float(stock),
-        reorder_point=float(sku.reorder_point) if sku.reorder_point else None,
+        unit_cost=sku.unit_cost,
+        current_stock=stock,
+        reorder_point=sku.reorder_point,
         warehouse_id=str(body.warehouse_id),
     )
 
@@ -131,10 +133,10 @@ async def scan_lookup(
 @router.post("/receive", response_model=ScanConfirmation)
 async def scan_receive(
     body: ScanReceiveRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_RECEIVE)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_RECEIVE)),
 ):
     """Scan-to-receive: barcode + qty → RECEIVE ledger event."""
+    db, user = ctx
     sku = await _resolve_sku(db, body.barcode, user.tenant_id)
 
     try:
@@ -147,15 +149,15 @@ async def scan_receive(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    new_balance = await LedgerService.get_stock_level(db, user.tenant_id, sku.id, body.warehouse_id)
+    new_balance = event.balance_after
 
     return ScanConfirmation(
         success=True,
         event_type="RECEIVE",
         sku_code=sku.sku_code,
         sku_name=sku.name,
-        quantity=float(body.quantity),
-        new_balance=float(new_balance),
+        quantity=body.quantity,
+        new_balance=new_balance,
         message=f"Received {body.quantity} × {sku.sku_code}",
     )
 
@@ -163,10 +165,10 @@ async def scan_receive(
 @router.post("/pick", response_model=ScanConfirmation)
 async def scan_pick(
     body: ScanPickRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_PICK)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_PICK)),
 ):
     """Scan-to-pick: barcode → PICK ledger event."""
+    db, user = ctx
     sku = await _resolve_sku(db, body.barcode, user.tenant_id)
 
     try:
@@ -179,15 +181,15 @@ async def scan_pick(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    new_balance = await LedgerService.get_stock_level(db, user.tenant_id, sku.id, body.warehouse_id)
+    new_balance = event.balance_after
 
     return ScanConfirmation(
         success=True,
         event_type="PICK",
         sku_code=sku.sku_code,
         sku_name=sku.name,
-        quantity=float(body.quantity),
-        new_balance=float(new_balance),
+        quantity=body.quantity,
+        new_balance=new_balance,
         message=f"Picked {body.quantity} × {sku.sku_code}",
     )
 
@@ -195,10 +197,10 @@ async def scan_pick(
 @router.post("/adjust", response_model=ScanConfirmation)
 async def scan_adjust(
     body: ScanAdjustRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_ADJUST)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_ADJUST)),
 ):
     """Scan-to-adjust: barcode + delta + reason → ADJUST ledger event."""
+    db, user = ctx
     sku = await _resolve_sku(db, body.barcode, user.tenant_id)
 
     try:
@@ -211,14 +213,14 @@ async def scan_adjust(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    new_balance = await LedgerService.get_stock_level(db, user.tenant_id, sku.id, body.warehouse_id)
+    new_balance = event.balance_after
 
     return ScanConfirmation(
         success=True,
         event_type="ADJUST",
         sku_code=sku.sku_code,
         sku_name=sku.name,
-        quantity=float(body.quantity_delta),
-        new_balance=float(new_balance),
+        quantity=body.quantity_delta,
+        new_balance=new_balance,
         message=f"Adjusted {sku.sku_code} by {body.quantity_delta} ({body.reason_code})",
     )
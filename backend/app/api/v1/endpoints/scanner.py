@@ -7,8 +7,10 @@ WS message protocol:
 """
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import time
 from decimal import Decimal
 from uuid import UUID
 
@@ -16,19 +18,83 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.redis import get_redis
+from app.api.deps import (
+    PERMISSION_MATRIX,
+    PERM_TRANSACTIONS_ADJUST,
+    PERM_TRANSACTIONS_PICK,
+    PERM_TRANSACTIONS_RECEIVE,
+)
+from app.core.redis import WS_TOKEN_CACHE_TTL, get_redis, ws_token_cache_key
+from app.core.responses import dumps
 from app.core.security import decode_token
 from app.db.session import async_session_maker
 from app.models.item_type import SKU
 from app.models.warehouse import StockEventType
 from app.services.ledger_service import LedgerService
+from app.services.sku_bloom_service import SKUBloomService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# One bit per scanner action; LOOKUP is read-only and open to every role.
+_EVENT_BITS = {"RECEIVE": 0, "PICK": 1, "ADJUST": 2, "RETURN": 3, "LOOKUP": 4}
+_LOOKUP_MASK = 1 << _EVENT_BITS["LOOKUP"]
+_EVENT_PERMISSIONS = {
+    "RECEIVE": PERM_TRANSACTIONS_RECEIVE,
+    "PICK": PERM_TRANSACTIONS_PICK,
+    "ADJUST": PERM_TRANSACTIONS_ADJUST,
+    "RETURN": PERM_TRANSACTIONS_RECEIVE,
+}
+_EVENT_TYPES = {
+    "RECEIVE": StockEventType.RECEIVE,
+    "PICK": StockEventType.PICK,
+    "ADJUST": StockEventType.ADJUST,
+    "RETURN": StockEventType.RETURN,
+}
+# Role -> allowed-events bitmask, derived once from the RBAC matrix
+_ROLE_EVENT_MASKS = {
+    role: _LOOKUP_MASK | sum(
+        1 << _EVENT_BITS[event] for event, perm in _EVENT_PERMISSIONS.items() if perm in perms
+    )
+    for role, perms in PERMISSION_MATRIX.items()
+}
+
+
+async def _send(websocket: WebSocket, payload: dict) -> None:
+    """Send a JSON text frame encoded by orjson. Quantities must already be floats (JSON numbers)."""
+    await websocket.send_text(dumps(payload).decode())
+
+
+async def _decode_ws_token(token: str) -> dict | None:
+    """
+    Decode a scanner access token, caching the verified claims in Redis.
+    Reconnect storms then cost a GET instead of a full JWT verify per connection.
+    """
+    key = ws_token_cache_key(hashlib.sha256(token.encode()).hexdigest()[:32])
+    r = await get_redis()
+    cached = await r.get(key)
+    if cached is not None:
+        return json.loads(cached)
+
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return None
+    claims = {
+        "sub": payload["sub"],
+        "tenant_id": payload["tenant_id"],
+        "role": payload.get("role", "FLOOR_ASSOCIATE"),
+        "type": "access",
+    }
+    ttl = min(int(payload["exp"] - time.time()), WS_TOKEN_CACHE_TTL)
+    if ttl > 0:
+        await r.setex(key, ttl, json.dumps(claims))
+    return claims
+
 
 async def _lookup_sku_by_code(db: AsyncSession, tenant_id: UUID, barcode: str) -> SKU | None:
-    """Find SKU by sku_code (barcode)."""
+    """Find SKU by sku_code (barcode). Misreads are rejected by the Bloom filter without a query."""
+    if not await SKUBloomService.might_exist(db, tenant_id, barcode):
+        return None
     result = await db.execute(
         select(SKU).where(
             SKU.tenant_id == tenant_id,
@@ -50,19 +116,23 @@ async def ws_scan(websocket: WebSocket):
     # ── Authenticate from query param ────────────────────────────────────
     token = websocket.query_params.get("token")
     if not token:
-        await websocket.send_json({"status": "error", "message": "Missing token query param"})
+        await _send(websocket, {"status": "error", "message": "Missing token query param"})
         await websocket.close(code=4001)
         return
 
-    payload = decode_token(token)
-    if not payload or payload.get("type") != "access":
-        await websocket.send_json({"status": "error", "message": "Invalid or expired token"})
+    payload = await _decode_ws_token(token)
+    if not payload:
+        await _send(websocket, {"status": "error", "message": "Invalid or expired token"})
         await websocket.close(code=4001)
         return
 
     user_id = UUID(payload["sub"])
     tenant_id = UUID(payload["tenant_id"])
     user_role = payload.get("role", "FLOOR_ASSOCIATE")
+    allowed_events = _ROLE_EVENT_MASKS.get(user_role, _LOOKUP_MASK)
+    # A scanner session nearly always stays on one warehouse; reuse its parsed UUID
+    last_warehouse_str: str | None = None
+    warehouse_id: UUID | None = None
 
     try:
         while True:
@@ -70,7 +140,7 @@ async def ws_scan(websocket: WebSocket):
             try:
                 msg = json.loads(raw)
             except json.JSONDecodeError:
-                await websocket.send_json({"status": "error", "message": "Invalid JSON"})
+                await _send(websocket, {"status": "error", "message": "Invalid JSON"})
                 continue
 
             barcode = msg.get("barcode", "").strip()
@@ -82,77 +152,62 @@ async def ws_scan(websocket: WebSocket):
 
             # Validate required fields
             if not barcode:
-                await websocket.send_json({"status": "error", "message": "barcode is required"})
+                await _send(websocket, {"status": "error", "message": "barcode is required"})
                 continue
             if not warehouse_id_str:
-                await websocket.send_json({"status": "error", "message": "warehouse_id is required"})
+                await _send(websocket, {"status": "error", "message": "warehouse_id is required"})
                 continue
 
-            warehouse_id = UUID(warehouse_id_str)
+            if warehouse_id_str != last_warehouse_str:
+                warehouse_id = UUID(warehouse_id_str)
+                last_warehouse_str = warehouse_id_str
             location_id = UUID(location_id_str) if location_id_str else None
 
+            ev_bit = _EVENT_BITS.get(event_type_str)
+            if ev_bit is None:
+                await _send(websocket, {"status": "error", "message": f"Invalid event_type: {event_type_str}"})
+                continue
+            if not (allowed_events >> ev_bit) & 1:
+                await _send(websocket, {"status": "error", "message": f"Role {user_role} cannot perform {event_type_str}"})
+                continue
+
             # ── Lookup mode: just look up the SKU without posting an event ──
             if event_type_str == "LOOKUP":
-                async with async_session_maker() as db:
-                    from sqlalchemy import text
-                    await db.execute(
-                        text("SELECT set_config('app.tenant_id', :tid, true)"),
-                        {"tid": str(tenant_id)},
-                    )
+                async with async_session_maker(info={"tenant_id": str(tenant_id)}) as db:
                     sku = await _lookup_sku_by_code(db, tenant_id, barcode)
                     if not sku:
-                        await websocket.send_json({"status": "error", "message": f"SKU '{barcode}' not found"})
+                        await _send(websocket, {"status": "error", "message": f"SKU '{barcode}' not found"})
                         continue
                     stock = await LedgerService.get_stock_level(db, tenant_id, sku.id, warehouse_id)
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "status": "ok",
                         "action": "LOOKUP",
                         "sku": {
                             "id": str(sku.id),
                             "sku_code": sku.sku_code,
                             "name": sku.name,
-                            "unit_cost": float(sku.unit_cost) if sku.unit_cost else None,
+                            "unit_cost": float(sku.unit_cost) if sku.unit_cost is not None else None,
                         },
                         "stock": float(stock),
                     })
                     continue
 
             # ── Transaction mode: post ledger event ─────────────────────────
-            if event_type_str not in ("RECEIVE", "PICK", "ADJUST", "RETURN"):
-                await websocket.send_json({"status": "error", "message": f"Invalid event_type: {event_type_str}"})
-                continue
             if quantity is None:
-                await websocket.send_json({"status": "error", "message": "quantity is required"})
-                continue
-
-            # RBAC check for ADJUST
-            if event_type_str == "ADJUST" and user_role == "FLOOR_ASSOCIATE":
-                await websocket.send_json({"status": "error", "message": "Floor associates cannot adjust stock"})
+                await _send(websocket, {"status": "error", "message": "quantity is required"})
                 continue
 
-            # Map to StockEventType
-            event_map = {
-                "RECEIVE": StockEventType.RECEIVE,
-                "PICK": StockEventType.PICK,
-                "ADJUST": StockEventType.ADJUST,
-                "RETURN": StockEventType.RETURN,
-            }
-            event_type = event_map[event_type_str]
+            event_type = _EVENT_TYPES[event_type_str]
 
             # Determine quantity delta sign
             qty = Decimal(str(abs(quantity)))
             if event_type_str == "PICK":
                 qty = -qty
 
-            async with async_session_maker() as db:
-                from sqlalchemy import text
-                await db.execute(
-                    text("SELECT set_config('app.tenant_id', :tid, true)"),
-                    {"tid": str(tenant_id)},
-                )
+            async with async_session_maker(info={"tenant_id": str(tenant_id)}) as db:
                 sku = await _lookup_sku_by_code(db, tenant_id, barcode)
                 if not sku:
-                    await websocket.send_json({"status": "error", "message": f"SKU '{barcode}' not found"})
+                    await _send(websocket, {"status": "error", "message": f"SKU '{barcode}' not found"})
                     continue
 
                 try:
@@ -165,10 +220,9 @@ async def ws_scan(websocket: WebSocket):
                         notes=f"Scanner: {event_type_str}",
                     )
                     await db.commit()
+                    stock = ev.balance_after
 
-                    stock = await LedgerService.get_stock_level(db, tenant_id, sku.id, warehouse_id)
-
-                    await websocket.send_json({
+                    await _send(websocket, {
                         "status": "ok",
                         "action": event_type_str,
                         "sku": {
@@ -184,10 +238,10 @@ async def ws_scan(websocket: WebSocket):
                         "stock": float(stock),
                     })
                 except ValueError as e:
-                    await websocket.send_json({"status": "error", "message": str(e)})
+                    await _send(websocket, {"status": "error", "message": str(e)})
                 except Exception as e:
                     logger.exception("Scanner event error")
-                    await websocket.send_json({"status": "error", "message": "Internal error"})
+                    await _send(websocket, {"status": "error", "message": "Internal error"})
 
     except WebSocketDisconnect:
         logger.info("Scanner client disconnected: user=%s", user_id)
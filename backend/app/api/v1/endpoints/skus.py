@@ -1,36 +1,39 @@
 """NEXUS IMS — SKU endpoints (Block 1.3). GET /skus, POST, GET/{id}, PUT, DELETE."""
+from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, Query, status
 
-from app.api.deps import CurrentUser, DbSession, get_db, require_auth
+from app.api.deps import AuthedDb
+from app.core.responses import ORJSONResponse
 from app.schemas.common import ApiResponse, Meta
 from app.schemas.sku import SKUCreate, SKUResponse, SKUUpdate
 from app.services.attribute_validator import AttributeValidationError
 from app.services.sku_service import SKUService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("", response_model=ApiResponse[list[SKUResponse]])
 async def list_skus(
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedDb,
     item_type_id: UUID | None = None,
     search: str | None = None,
     low_stock: bool | None = None,
+    expires_before: date | None = None,
     include_archived: bool = False,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
-    user: CurrentUser = Depends(require_auth),
 ):
     """List SKUs with filters."""
+    db, user = ctx
     items, total = await SKUService.get_skus(
         db,
         user.tenant_id,
         item_type_id=item_type_id,
         search=search,
         low_stock=low_stock,
+        expires_before=expires_before,
         include_archived=include_archived,
         page=page,
         page_size=page_size,
@@ -44,10 +47,10 @@ async def list_skus(
 @router.post("", response_model=ApiResponse[SKUResponse], status_code=status.HTTP_201_CREATED)
 async def create_sku(
     body: SKUCreate,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """Create SKU. Validates attributes against item_type.attribute_schema."""
+    db, user = ctx
     existing = await SKUService.get_by_code(db, user.tenant_id, body.sku_code)
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="SKU code already exists")
@@ -72,10 +75,10 @@ async def create_sku(
 @router.get("/{id}", response_model=ApiResponse[SKUResponse])
 async def get_sku(
     id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """Get SKU by ID."""
+    db, user = ctx
     sku = await SKUService.get_by_id(db, id, user.tenant_id)
     if not sku:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -86,10 +89,10 @@ async def get_sku(
 async def update_sku(
     id: UUID,
     body: SKUUpdate,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """Update SKU."""
+    db, user = ctx
     try:
         sku = await SKUService.update_sku(
             db,
@@ -112,11 +115,11 @@ async def update_sku(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def archive_sku(
     id: UUID,
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedDb,
     force: bool = False,
-    user: CurrentUser = Depends(require_auth),
 ):
     """Soft-archive SKU. Blocked if stock > 0 unless force (Block 2)."""
+    db, user = ctx
     ok = await SKUService.archive_sku(db, id, user.tenant_id, force=force)
     if not ok:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
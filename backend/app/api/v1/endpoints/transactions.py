@@ -1,21 +1,32 @@
-"""NEXUS IMS — Transaction endpoints (Block 2). POST receive/pick/adjust/return, GET transactions."""
+"""NEXUS IMS — Transaction endpoints (Block 2). POST receive/pick/adjust/return/import, GET transactions."""
+import asyncio
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
-    CurrentUser, get_db, require_auth, require_permission,
+    AuthedDb, CurrentUser, authed_db, msgspec_body, require_auth,
     PERM_TRANSACTIONS_RECEIVE, PERM_TRANSACTIONS_PICK, PERM_TRANSACTIONS_ADJUST,
 )
+from app.core.responses import ORJSONResponse
+from app.db.session import tenant_session
 from app.models.warehouse import StockEventType
-from app.schemas.common import ApiResponse, Meta
+from app.schemas.common import ApiResponse, JsonNumber
+from app.schemas.msgspec_bodies import LedgerImportMsg
 from app.schemas.warehouse import AdjustRequest, PickRequest, ReceiveRequest, ReturnRequest
 from app.services.ledger_service import LedgerService
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_TX_KEYS = (
+    "id", "sku_id", "warehouse_id", "event_type", "quantity_delta", "reference_id",
+    "actor_id", "notes", "reason_code", "created_at", "running_balance",
+)
 
 
 class LedgerEventResponse(BaseModel):
@@ -23,13 +34,13 @@ class LedgerEventResponse(BaseModel):
     sku_id: UUID
     warehouse_id: UUID
     event_type: str
-    quantity_delta: Decimal
+    quantity_delta: JsonNumber
     reference_id: UUID | None
     actor_id: UUID | None
     notes: str | None
     reason_code: str | None
     created_at: str
-    running_balance: Decimal | None = None
+    running_balance: JsonNumber | None = None
 
     class Config:
         from_attributes = True
@@ -38,10 +49,10 @@ class LedgerEventResponse(BaseModel):
 @router.post("/receive", response_model=ApiResponse[LedgerEventResponse])
 async def receive(
     body: ReceiveRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_RECEIVE)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_RECEIVE)),
 ):
     """Post RECEIVE event (inbound). quantity is positive."""
+    db, user = ctx
     try:
         ev = await LedgerService.post_event(
             db, user.tenant_id, body.sku_id, body.warehouse_id,
@@ -63,10 +74,10 @@ async def receive(
 @router.post("/pick", response_model=ApiResponse[LedgerEventResponse])
 async def pick(
     body: PickRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_PICK)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_PICK)),
 ):
     """Post PICK event (outbound). quantity is negative."""
+    db, user = ctx
     qty = -abs(body.quantity)
     try:
         ev = await LedgerService.post_event(
@@ -89,10 +100,10 @@ async def pick(
 @router.post("/adjust", response_model=ApiResponse[LedgerEventResponse])
 async def adjust(
     body: AdjustRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_ADJUST)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_ADJUST)),
 ):
     """Post ADJUST event. quantity can be positive or negative. Requires reason_code."""
+    db, user = ctx
     try:
         ev = await LedgerService.post_event(
             db, user.tenant_id, body.sku_id, body.warehouse_id,
@@ -114,10 +125,10 @@ async def adjust(
 @router.post("/return", response_model=ApiResponse[LedgerEventResponse])
 async def return_event(
     body: ReturnRequest,
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_RECEIVE)),
-    db: AsyncSession = Depends(get_db),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_RECEIVE)),
 ):
     """Post RETURN event (inbound). quantity positive."""
+    db, user = ctx
     try:
         ev = await LedgerService.post_event(
             db, user.tenant_id, body.sku_id, body.warehouse_id,
@@ -135,44 +146,112 @@ async def return_event(
     ))
 
 
+@router.post("/import", response_model=ApiResponse[dict])
+async def import_events(
+    body: LedgerImportMsg = Depends(msgspec_body(LedgerImportMsg)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_ADJUST)),
+):
+    """Bulk-post ADJUST events (opening balances, inventory sync). All or nothing; no workflows."""
+    db, user = ctx
+    events = [
+        {
+            "sku_id": e.sku_id, "warehouse_id": e.warehouse_id, "quantity_delta": e.quantity_delta,
+            "location_id": e.location_id, "notes": e.notes, "reason_code": body.reason_code,
+        }
+        for e in body.events
+    ]
+    try:
+        count = await LedgerService.append_events(
+            db, user.tenant_id, StockEventType.ADJUST, events, actor_id=user.id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ApiResponse(data={"imported": count})
+
+
 @router.get("/stock", response_model=ApiResponse[dict])
 async def get_stock(
     sku_id: UUID,
     warehouse_id: UUID,
-    user: CurrentUser = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    ctx: AuthedDb,
 ):
     """Get current stock level for SKU at warehouse (Redis cache-aside)."""
+    db, user = ctx
     level = await LedgerService.get_stock_level(db, user.tenant_id, sku_id, warehouse_id)
     return ApiResponse(data={"sku_id": str(sku_id), "warehouse_id": str(warehouse_id), "quantity": float(level)})
 
 
+@router.get("/export")
+async def export_transactions(
+    sku_id: UUID | None = None,
+    warehouse_id: UUID | None = None,
+    event_type: str | None = None,
+    user: CurrentUser = Depends(require_auth),
+):
+    """Stream the full transaction history as CSV (Postgres COPY, no ORM or pagination)."""
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=64)
+
+    async def _copy() -> None:
+        # Own session: generator dependencies are torn down before a streamed body is sent
+        try:
+            async with tenant_session(str(user.tenant_id)) as db:
+                await LedgerService.copy_history_csv(
+                    db, user.tenant_id, queue.put,
+                    sku_id=sku_id, warehouse_id=warehouse_id, event_type=event_type,
+                )
+        finally:
+            if not asyncio.current_task().cancelling():
+                await queue.put(None)
+
+    async def _body():
+        task = asyncio.create_task(_copy())
+        try:
+            while (chunk := await queue.get()) is not None:
+                yield chunk
+            await task
+        finally:
+            task.cancel()
+
+    return StreamingResponse(
+        _body(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="transactions.csv"'},
+    )
+
+
 @router.get("", response_model=ApiResponse[list])
 async def list_transactions(
+    ctx: AuthedDb,
     sku_id: UUID | None = None,
     warehouse_id: UUID | None = None,
     event_type: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
-    user: CurrentUser = Depends(require_auth),
-    db: AsyncSession = Depends(get_db),
+    before_created_at: datetime | None = None,
+    before_id: UUID | None = None,
 ):
-    """List transaction history with running balance."""
+    """List transaction history with running balance.
+
+    Pass the created_at/id of the last row seen as before_created_at/before_id to page by
+    keyset instead of offset.
+    """
+    db, user = ctx
+    before = (before_created_at, before_id) if before_created_at and before_id else None
     rows, total = await LedgerService.get_transaction_history(
         db, user.tenant_id,
         sku_id=sku_id, warehouse_id=warehouse_id, event_type=event_type,
-        page=page, page_size=page_size,
+        page=page, page_size=page_size, before=before,
     )
+    # UUIDs and datetimes stay native for orjson; quantities go out as JSON numbers
     data = [
-        {
-            "id": str(r.id), "sku_id": str(r.sku_id), "warehouse_id": str(r.warehouse_id),
-            "event_type": r.event_type, "quantity_delta": float(r.quantity_delta),
-            "reference_id": str(r.reference_id) if r.reference_id else None,
-            "actor_id": str(r.actor_id) if r.actor_id else None,
-            "notes": r.notes, "reason_code": r.reason_code,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-            "running_balance": float(bal),
-        }
+        dict(zip(_TX_KEYS, (
+            r.id, r.sku_id, r.warehouse_id, r.event_type, float(r.quantity_delta), r.reference_id,
+            r.actor_id, r.notes, r.reason_code, r.created_at, float(bal),
+        )))
         for r, bal in rows
     ]
-    return ApiResponse(data=data, meta=Meta(page=page, page_size=page_size, total_count=total))
+    return ORJSONResponse({
+        "data": data,
+        "error": None,
+        "meta": {"page": page, "page_size": page_size, "total_count": total},
+    })
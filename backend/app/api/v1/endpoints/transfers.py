@@ -1,27 +1,42 @@
 """NEXUS IMS — Transfer order endpoints (Block 3)."""
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
-    CurrentUser, DbSession, get_db, require_permission,
+    CurrentUser, authed_db, msgspec_body, require_permission,
     PERM_WAREHOUSES_MANAGE, PERM_TRANSACTIONS_RECEIVE,
 )
+from app.core.responses import EnvelopeResponse, stream_envelope
+from app.db.session import tenant_session
+from app.models.location import TransferOrderLine
 from app.schemas.common import ApiResponse
-from app.schemas.location import TransferCreate, TransferReceiveRequest, TransferResponse, TransferLineResponse
+from app.schemas.location import TransferReceiveRequest, TransferResponse
+from app.schemas.msgspec_bodies import TransferCreateMsg
 from app.services.transfer_service import TransferService
 
 router = APIRouter()
 
 
-@router.post("", response_model=ApiResponse[TransferResponse], status_code=status.HTTP_201_CREATED)
+def _line_row(l: TransferOrderLine) -> dict:
+    # Quantities are JSON numbers for the client; nothing received yet is null, not 0
+    return {
+        "id": l.id, "sku_id": l.sku_id,
+        "quantity_requested": float(l.quantity_requested),
+        "quantity_received": float(l.quantity_received) if l.quantity_received else None,
+    }
+
+
+@router.post("", response_model=None, responses={201: {"model": ApiResponse[TransferResponse]}}, status_code=status.HTTP_201_CREATED)
 async def create_transfer(
-    body: TransferCreate,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_permission(PERM_WAREHOUSES_MANAGE)),
+    body: TransferCreateMsg = Depends(msgspec_body(TransferCreateMsg)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_WAREHOUSES_MANAGE)),
 ):
     """Create transfer order. Posts TRANSFER_OUT on source immediately."""
+    db, user = ctx
     if not body.lines:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one line required")
     try:
@@ -33,66 +48,72 @@ async def create_transfer(
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    lines = [TransferLineResponse(id=l.id, sku_id=l.sku_id, quantity_requested=l.quantity_requested, quantity_received=l.quantity_received) for l in order.lines]
-    return ApiResponse(data=TransferResponse(
-        id=order.id, tenant_id=order.tenant_id,
-        from_warehouse_id=order.from_warehouse_id, to_warehouse_id=order.to_warehouse_id,
-        status=order.status,
-        created_at=order.created_at.isoformat() if order.created_at else None,
-        received_at=order.received_at.isoformat() if order.received_at else None,
-        lines=lines,
-    ))
+    # Datetimes and None go to orjson as-is; it emits the same ISO 8601 text as isoformat()
+    return EnvelopeResponse({
+        "id": order.id, "tenant_id": order.tenant_id,
+        "from_warehouse_id": order.from_warehouse_id, "to_warehouse_id": order.to_warehouse_id,
+        "status": order.status,
+        "created_at": order.created_at,
+        "received_at": order.received_at,
+        "lines": [_line_row(l) for l in order.lines],
+    }, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("", response_model=ApiResponse[list])
+@router.get("", response_model=None)
 async def list_transfers(
-    db: AsyncSession = Depends(get_db),
     status: str | None = Query(None, description="PENDING|IN_TRANSIT|RECEIVED|CANCELLED"),
     warehouse_id: UUID | None = None,
     user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_RECEIVE)),
-):
+) -> StreamingResponse:
     """List transfer orders."""
-    orders = await TransferService.list_transfers(db, user.tenant_id, status=status, warehouse_id=warehouse_id)
-    data = []
-    for o in orders:
-        lines = [{"id": str(l.id), "sku_id": str(l.sku_id), "quantity_requested": float(l.quantity_requested), "quantity_received": float(l.quantity_received) if l.quantity_received else None} for l in o.lines]
-        data.append({
-            "id": str(o.id),
-            "from_warehouse_id": str(o.from_warehouse_id),
-            "to_warehouse_id": str(o.to_warehouse_id),
-            "status": o.status,
-            "created_at": o.created_at.isoformat() if o.created_at else None,
-            "received_at": o.received_at.isoformat() if o.received_at else None,
-            "lines": lines,
-        })
-    return ApiResponse(data=data)
+    return await stream_envelope(_transfer_batches(user.tenant_id, status, warehouse_id))
 
 
-@router.post("/{id}/receive", response_model=ApiResponse[dict])
+async def _transfer_batches(
+    tenant_id: UUID, status: str | None, warehouse_id: UUID | None
+) -> AsyncIterator[list[dict]]:
+    # Owns its session: the response body is produced after request dependencies exit
+    async with tenant_session(tenant_id) as db:
+        async for orders in TransferService.iter_transfers(
+            db, tenant_id, status=status, warehouse_id=warehouse_id
+        ):
+            yield [
+                {
+                    "id": o.id,
+                    "from_warehouse_id": o.from_warehouse_id,
+                    "to_warehouse_id": o.to_warehouse_id,
+                    "status": o.status,
+                    "created_at": o.created_at,
+                    "received_at": o.received_at,
+                    "lines": [_line_row(l) for l in o.lines],
+                }
+                for o in orders
+            ]
+
+
+@router.post("/{id}/receive", response_model=None, responses={200: {"model": ApiResponse[dict]}})
 async def receive_transfer(
     id: UUID,
     body: TransferReceiveRequest,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_permission(PERM_TRANSACTIONS_RECEIVE)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_TRANSACTIONS_RECEIVE)),
 ):
     """Confirm receipt. Posts TRANSFER_IN on destination. Can be partial."""
-    line_qty: dict | None = None
-    if body.line_quantities:
-        from decimal import Decimal
-        line_qty = {UUID(k): Decimal(str(v)) for k, v in body.line_quantities.items()}
-    order = await TransferService.confirm_receipt(db, id, user.tenant_id, line_quantities=line_qty)
+    db, user = ctx
+    order = await TransferService.confirm_receipt(
+        db, id, user.tenant_id, line_quantities=body.line_quantities or None
+    )
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return ApiResponse(data={"id": str(order.id), "status": order.status})
 
 
-@router.post("/{id}/cancel", response_model=ApiResponse[dict])
+@router.post("/{id}/cancel", response_model=None, responses={200: {"model": ApiResponse[dict]}})
 async def cancel_transfer(
     id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_permission(PERM_WAREHOUSES_MANAGE)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_WAREHOUSES_MANAGE)),
 ):
     """Cancel transfer. Reverses TRANSFER_OUT by posting TRANSFER_IN on source."""
+    db, user = ctx
     order = await TransferService.cancel_transfer_order(db, id, user.tenant_id)
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
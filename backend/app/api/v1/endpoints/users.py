@@ -1,16 +1,28 @@
 """NEXUS IMS — Users endpoints (Block 4)."""
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import TypedDict  # pydantic needs this one below Python 3.12
 
 from app.api.deps import (
     CurrentUser,
+    authed_db,
     get_db,
-    require_auth,
     require_permission,
     PERM_USERS_MANAGE,
+    msgspec_body,
+)
+from app.core.responses import EnvelopeResponse, ORJSONResponse, stream_envelope
+from app.db.session import tenant_session
+from app.models.tenant import User
+from app.schemas.common import ApiResponse
+from app.schemas.msgspec_bodies import (
+    AcceptInvitationRequestMsg,
+    InviteRequestMsg,
+    UpdateRoleRequestMsg,
 )
 from app.services.audit_service import (
     ACTION_USER_DEACTIVATED,
@@ -20,29 +32,13 @@ from app.services.audit_service import (
 )
 from app.services.user_service import UserService
 
-router = APIRouter()
-
-
-# ── Pydantic schemas ─────────────────────────────────────────────────────────
-
-class InviteRequest(BaseModel):
-    email: EmailStr
-    role: str  # ADMIN | MANAGER | FLOOR_ASSOCIATE
-    warehouse_scope: list[str] | None = None  # list of warehouse UUID strings
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-class AcceptInvitationRequest(BaseModel):
-    token: str
-    password: str
-    full_name: str | None = None
-
-
-class UpdateRoleRequest(BaseModel):
-    role: str
-    warehouse_scope: list[str] | None = None
-
+# ── Response shapes ──────────────────────────────────────────────────────────
 
-class UserResponse(BaseModel):
+class UserResponse(TypedDict):
+    """Row shape of user payloads; built from ORM attributes, no per-row validation."""
     id: UUID
     email: str
     full_name: str | None
@@ -50,19 +46,31 @@ class UserResponse(BaseModel):
     warehouse_scope: list[str] | None
     is_active: bool
 
-    class Config:
-        from_attributes = True
+
+def _user_to_dict(u: User) -> UserResponse:
+    """UserResponse fields straight off the ORM row (already DB-validated)."""
+    return {
+        "id": u.id, "email": u.email, "full_name": u.full_name, "role": u.role,
+        "warehouse_scope": u.warehouse_scope, "is_active": u.is_active,
+    }
+
+
+async def _user_batches(tenant_id: UUID, include_inactive: bool) -> AsyncIterator[list[UserResponse]]:
+    # Owns its session: the response body is produced after request dependencies exit
+    async with tenant_session(tenant_id) as db:
+        async for users in UserService.iter_users(db, tenant_id, include_inactive=include_inactive):
+            yield [_user_to_dict(u) for u in users]
 
 
 # ── Endpoints ─────────────────────────────────────────────────────────────────
 
-@router.post("/invite", status_code=status.HTTP_201_CREATED)
+@router.post("/invite", status_code=status.HTTP_201_CREATED, response_model=None)
 async def invite_user(
-    body: InviteRequest,
-    db: AsyncSession = Depends(get_db),
-    actor: CurrentUser = Depends(require_permission(PERM_USERS_MANAGE)),
-) -> dict:
+    body: InviteRequestMsg = Depends(msgspec_body(InviteRequestMsg)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_USERS_MANAGE)),
+) -> EnvelopeResponse:
     """Invite a new user to this tenant. Token logged to console (email stub)."""
+    db, actor = ctx
     valid_roles = {"ADMIN", "MANAGER", "FLOOR_ASSOCIATE"}
     if body.role not in valid_roles:
         raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of {valid_roles}")
@@ -82,18 +90,21 @@ async def invite_user(
         payload={"email": body.email, "role": body.role},
     )
     await db.commit()
-    return {
-        "data": {
+    return EnvelopeResponse(
+        {
             "message": f"Invitation sent to {body.email}",
             "dev_token": raw_token,  # DEVELOPMENT ONLY — remove when email is wired
         },
-        "error": None,
-        "meta": {},
-    }
+        meta={},
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.post("/accept-invitation", status_code=status.HTTP_201_CREATED)
-async def accept_invitation(body: AcceptInvitationRequest, db: AsyncSession = Depends(get_db)) -> dict:
+@router.post("/accept-invitation", status_code=status.HTTP_201_CREATED, response_model=None)
+async def accept_invitation(
+    body: AcceptInvitationRequestMsg = Depends(msgspec_body(AcceptInvitationRequestMsg)),
+    db: AsyncSession = Depends(get_db),
+) -> EnvelopeResponse:
     """Accept an invitation and set password. Creates the user account."""
     try:
         user = await UserService.accept_invitation(
@@ -102,36 +113,28 @@ async def accept_invitation(body: AcceptInvitationRequest, db: AsyncSession = De
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     await db.commit()
-    return {
-        "data": UserResponse.model_validate(user).model_dump(),
-        "error": None,
-        "meta": {},
-    }
+    return EnvelopeResponse(_user_to_dict(user), meta={}, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=None, responses={200: {"model": ApiResponse[list[UserResponse]]}})
 async def list_users(
-    db: AsyncSession = Depends(get_db),
     include_inactive: bool = False,
     actor: CurrentUser = Depends(require_permission(PERM_USERS_MANAGE)),
-) -> dict:
+) -> StreamingResponse:
     """List all users in the tenant. Admin only."""
-    users = await UserService.list_users(db, actor.tenant_id, include_inactive=include_inactive)
-    return {
-        "data": [UserResponse.model_validate(u).model_dump() for u in users],
-        "error": None,
-        "meta": {"total_count": len(users)},
-    }
+    return await stream_envelope(
+        _user_batches(actor.tenant_id, include_inactive), count_key="total_count"
+    )
 
 
-@router.put("/{user_id}/role", response_model=dict)
+@router.put("/{user_id}/role", response_model=None)
 async def update_user_role(
     user_id: UUID,
-    body: UpdateRoleRequest,
-    db: AsyncSession = Depends(get_db),
-    actor: CurrentUser = Depends(require_permission(PERM_USERS_MANAGE)),
-) -> dict:
+    body: UpdateRoleRequestMsg = Depends(msgspec_body(UpdateRoleRequestMsg)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_USERS_MANAGE)),
+) -> EnvelopeResponse:
     """Update a user's role and warehouse scope. Admin only."""
+    db, actor = ctx
     valid_roles = {"ADMIN", "MANAGER", "FLOOR_ASSOCIATE"}
     if body.role not in valid_roles:
         raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of {valid_roles}")
@@ -150,16 +153,16 @@ async def update_user_role(
         payload={"new_role": body.role},
     )
     await db.commit()
-    return {"data": UserResponse.model_validate(user).model_dump(), "error": None, "meta": {}}
+    return EnvelopeResponse(_user_to_dict(user), meta={})
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_200_OK)
+@router.delete("/{user_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def deactivate_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    actor: CurrentUser = Depends(require_permission(PERM_USERS_MANAGE)),
-) -> dict:
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_USERS_MANAGE)),
+) -> EnvelopeResponse:
     """Soft-deactivate a user. Admin only."""
+    db, actor = ctx
     if actor.id == user_id:
         raise HTTPException(status_code=400, detail="Cannot deactivate yourself")
 
@@ -174,4 +177,4 @@ async def deactivate_user(
         target_id=user_id,
     )
     await db.commit()
-    return {"data": {"id": str(user_id), "is_active": False}, "error": None, "meta": {}}
+    return EnvelopeResponse({"id": user_id, "is_active": False}, meta={})
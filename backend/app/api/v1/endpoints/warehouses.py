@@ -2,9 +2,11 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import CurrentUser, DbSession, get_db, require_auth, require_permission, PERM_WAREHOUSES_MANAGE
+from app.api.deps import AuthedDb, CurrentUser, authed_db, PERM_WAREHOUSES_MANAGE
+from app.core.responses import ORJSONResponse
 from app.models.warehouse import Warehouse
 from app.schemas.common import ApiResponse
 from app.schemas.warehouse import WarehouseCreate, WarehouseResponse, WarehouseUpdate
@@ -12,31 +14,41 @@ from app.services.warehouse_service import WarehouseService
 
 router = APIRouter()
 
+# Code-uniqueness probe built once at import; the lambda cache keeps its compiled SQL.
+_WH_CODE_TAKEN = lambda_stmt(
+    lambda: select(Warehouse.id).where(
+        Warehouse.tenant_id == bindparam("tid"), Warehouse.code == bindparam("code")
+    )
+)
+
+
+def _wh_to_dict(wh: Warehouse) -> dict:
+    """WarehouseResponse fields straight off the ORM row (already DB-validated)."""
+    return {
+        "id": wh.id, "tenant_id": wh.tenant_id, "name": wh.name, "code": wh.code,
+        "address": wh.address, "timezone": wh.timezone, "is_active": wh.is_active,
+    }
 
-@router.get("", response_model=ApiResponse[list[WarehouseResponse]])
+
+@router.get("", response_model=None, responses={200: {"model": ApiResponse[list[WarehouseResponse]]}})
 async def list_warehouses(
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """List active warehouses."""
+    db, user = ctx
     items = await WarehouseService.list_active(db, user.tenant_id)
-    return ApiResponse(data=[WarehouseResponse.model_validate(i) for i in items])
+    return ORJSONResponse({"data": [_wh_to_dict(i) for i in items], "error": None, "meta": None})
 
 
-@router.post("", response_model=ApiResponse[WarehouseResponse], status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=None, responses={201: {"model": ApiResponse[WarehouseResponse]}}, status_code=status.HTTP_201_CREATED)
 async def create_warehouse(
     body: WarehouseCreate,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_permission(PERM_WAREHOUSES_MANAGE)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_WAREHOUSES_MANAGE)),
 ):
     """Create warehouse."""
+    db, user = ctx
     # Check code uniqueness per tenant
-    from sqlalchemy import select
-    from app.models.warehouse import Warehouse as WH
-    result = await db.execute(
-        select(WH).where(WH.tenant_id == user.tenant_id, WH.code == body.code)
-    )
-    if result.scalar_one_or_none():
+    if await db.scalar(_WH_CODE_TAKEN, {"tid": user.tenant_id, "code": body.code}):
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Warehouse code already exists")
     wh = Warehouse(
         tenant_id=user.tenant_id,
@@ -48,30 +60,30 @@ async def create_warehouse(
     db.add(wh)
     await db.flush()
     await db.refresh(wh)
-    return ApiResponse(data=WarehouseResponse.model_validate(wh))
+    return ApiResponse(data=WarehouseResponse.model_construct(**_wh_to_dict(wh)))
 
 
-@router.get("/{id}", response_model=ApiResponse[WarehouseResponse])
+@router.get("/{id}", response_model=None, responses={200: {"model": ApiResponse[WarehouseResponse]}})
 async def get_warehouse(
     id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """Get warehouse by ID."""
+    db, user = ctx
     wh = await WarehouseService.get_by_id(db, id, user.tenant_id)
     if not wh:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-    return ApiResponse(data=WarehouseResponse.model_validate(wh))
+    return ApiResponse(data=WarehouseResponse.model_construct(**_wh_to_dict(wh)))
 
 
-@router.put("/{id}", response_model=ApiResponse[WarehouseResponse])
+@router.put("/{id}", response_model=None, responses={200: {"model": ApiResponse[WarehouseResponse]}})
 async def update_warehouse(
     id: UUID,
     body: WarehouseUpdate,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_permission(PERM_WAREHOUSES_MANAGE)),
+    ctx: tuple[AsyncSession, CurrentUser] = Depends(authed_db(PERM_WAREHOUSES_MANAGE)),
 ):
     """Update warehouse."""
+    db, user = ctx
     wh = await WarehouseService.get_by_id(db, id, user.tenant_id)
     if not wh:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
@@ -83,16 +95,16 @@ async def update_warehouse(
         wh.timezone = body.timezone
     await db.flush()
     await db.refresh(wh)
-    return ApiResponse(data=WarehouseResponse.model_validate(wh))
+    return ApiResponse(data=WarehouseResponse.model_construct(**_wh_to_dict(wh)))
 
 
-@router.get("/{id}/stock", response_model=ApiResponse[list])
+@router.get("/{id}/stock", response_model=None, responses={200: {"model": ApiResponse[list]}})
 async def get_warehouse_stock(
     id: UUID,
-    db: AsyncSession = Depends(get_db),
-    user: CurrentUser = Depends(require_auth),
+    ctx: AuthedDb,
 ):
     """Get stock summary for warehouse (sku_id, quantity)."""
+    db, user = ctx
     wh = await WarehouseService.get_by_id(db, id, user.tenant_id)
     if not wh:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
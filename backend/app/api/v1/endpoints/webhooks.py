@@ -2,42 +2,59 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+import anyio
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import Text, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_current_user, get_db
-from app.models.tenant import User
+from app.api.deps import AuthedDb
+from app.core.responses import EnvelopeResponse, ORJSONResponse, RawEnvelopeResponse
 from app.models.webhook import Webhook, WebhookDelivery
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-@router.get("/")
+def _webhook_row(w: Webhook) -> dict[str, Any]:
+    # The signing secret is write-only and never listed
+    return {
+        "id": w.id, "tenant_id": w.tenant_id, "url": w.url, "events": w.events,
+        "is_active": w.is_active, "created_by": w.created_by, "created_at": w.created_at,
+    }
+
+
+_DELIVERY_FIELDS = (
+    "id", "webhook_id", "event_type", "payload", "status", "response_code", "response_body",
+    "attempts", "last_attempt_at", "delivered_at",
+)
+
+# One delivery as a JSON object, built by Postgres. Keys are inlined literals: as bind
+# params their type could not be inferred through jsonb_build_object's VARIADIC "any".
+_delivery_json = func.jsonb_build_object(*(
+    arg for name in _DELIVERY_FIELDS for arg in (literal_column(f"'{name}'"), getattr(WebhookDelivery, name))
+))
+
+
+@router.get("/", response_model=None)
 async def list_webhooks(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """List webhooks for the tenant."""
+    db, current_user = ctx
     stmt = select(Webhook).where(Webhook.tenant_id == current_user.tenant_id).order_by(Webhook.created_at.desc())
     result = await db.execute(stmt)
     webhooks = result.scalars().all()
 
-    return {
-        "data": webhooks,
-        "error": None,
-        "meta": {"count": len(webhooks)}
-    }
+    return EnvelopeResponse([_webhook_row(w) for w in webhooks], meta={"count": len(webhooks)})
 
 
-@router.post("/")
+@router.post("/", response_model=None)
 async def create_webhook(
     payload: dict,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """Create a new webhook."""
+    db, current_user = ctx
     url = payload.get("url")
     secret = payload.get("secret")
     events = payload.get("events", [])
@@ -57,16 +74,16 @@ async def create_webhook(
     await db.commit()
     await db.refresh(webhook)
 
-    return {"data": webhook, "error": None, "meta": None}
+    return EnvelopeResponse(_webhook_row(webhook))
 
 
-@router.delete("/{webhook_id}")
+@router.delete("/{webhook_id}", response_model=None)
 async def delete_webhook(
     webhook_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """Delete a webhook."""
+    db, current_user = ctx
     webhook = await db.get(Webhook, webhook_id)
     if not webhook or webhook.tenant_id != current_user.tenant_id:
         raise HTTPException(status_code=404, detail="Webhook not found")
@@ -74,42 +91,54 @@ async def delete_webhook(
     await db.delete(webhook)
     await db.commit()
 
-    return {"data": {"success": True}, "error": None, "meta": None}
+    return EnvelopeResponse({"success": True})
 
 
-@router.get("/{webhook_id}/deliveries")
+@router.get("/{webhook_id}/deliveries", response_model=None)
 async def list_webhook_deliveries(
     webhook_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """List delivery logs for a webhook."""
-    webhook = await db.get(Webhook, webhook_id)
-    if not webhook or webhook.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=404, detail="Webhook not found")
-
-    stmt = select(WebhookDelivery).where(
-        WebhookDelivery.webhook_id == webhook_id
-    ).order_by(WebhookDelivery.last_attempt_at.desc().nulls_last()).limit(100)
-    
-    result = await db.execute(stmt)
-    deliveries = result.scalars().all()
-
-    return {
-        "data": deliveries,
-        "error": None,
-        "meta": {"count": len(deliveries)}
-    }
-
-
-@router.post("/{webhook_id}/deliveries/{delivery_id}/retry")
+    db, current_user = ctx
+    # Tenant check rides on the join; only an empty page needs a second query for the 404.
+    # Postgres renders the JSON array itself, so rows never become ORM objects or dicts.
+    page = (
+        select(_delivery_json.label("doc"), WebhookDelivery.last_attempt_at)
+        .join(Webhook, Webhook.id == WebhookDelivery.webhook_id)
+        .where(Webhook.id == webhook_id, Webhook.tenant_id == current_user.tenant_id)
+        .order_by(WebhookDelivery.last_attempt_at.desc().nulls_last())
+        .limit(100)
+        .subquery()
+    )
+    ordered = aggregate_order_by(page.c.doc, page.c.last_attempt_at.desc().nulls_last())
+    doc, count = (await db.execute(
+        select(func.jsonb_agg(ordered).cast(Text), func.count()).select_from(page)
+    )).one()
+    if not count:
+        exists = await db.scalar(
+            select(Webhook.id).where(
+                Webhook.id == webhook_id, Webhook.tenant_id == current_user.tenant_id
+            )
+        )
+        if exists is None:
+            raise HTTPException(status_code=404, detail="Webhook not found")
+
+    return RawEnvelopeResponse(doc or "[]", meta={"count": count})
+
+
+@router.post(
+    "/{webhook_id}/deliveries/{delivery_id}/retry",
+    response_model=None,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def retry_delivery(
     webhook_id: UUID,
     delivery_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """Manually retry a failed webhook delivery."""
+    db, current_user = ctx
     webhook = await db.get(Webhook, webhook_id)
     if not webhook or webhook.tenant_id != current_user.tenant_id:
         raise HTTPException(status_code=404, detail="Webhook not found")
@@ -118,12 +147,9 @@ async def retry_delivery(
     if not delivery or delivery.webhook_id != webhook_id:
         raise HTTPException(status_code=404, detail="Delivery not found")
 
-    # Enqueue a new celery task instance
+    # Enqueue a new celery task instance. .delay() is a blocking broker round-trip, so it
+    # runs on a worker thread; awaiting it keeps a broker failure from being reported as 202.
     from app.tasks.webhook_tasks import deliver_webhook
-    deliver_webhook.delay(str(delivery.id))
+    await anyio.to_thread.run_sync(deliver_webhook.delay, str(delivery.id))
 
-    return {
-        "data": {"status": "Retry enqueued"},
-        "error": None,
-        "meta": None
-    }
+    return EnvelopeResponse({"status": "Retry enqueued"}, status_code=status.HTTP_202_ACCEPTED)
@@ -1,46 +1,67 @@
 """NEXUS IMS — Workflows API (Block 9)."""
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_current_user, get_db
-from app.models.tenant import User
+from app.api.deps import AuthedDb
+from app.core.responses import EnvelopeResponse
 from app.models.workflow import Workflow, WorkflowAction, WorkflowExecution
 from app.services.workflow_engine import ConditionEvaluator
 
 router = APIRouter()
 
 
-@router.get("/")
+def _workflow_row(w: Workflow) -> dict[str, Any]:
+    return {
+        "id": w.id, "tenant_id": w.tenant_id, "name": w.name, "trigger_type": w.trigger_type,
+        "trigger_config": w.trigger_config, "is_active": w.is_active, "created_by": w.created_by,
+        "created_at": w.created_at, "updated_at": w.updated_at,
+        "actions": [
+            {
+                "id": a.id, "workflow_id": a.workflow_id, "sequence_order": a.sequence_order,
+                "action_type": a.action_type, "action_config": a.action_config,
+                "created_at": a.created_at,
+            }
+            for a in w.actions
+        ],
+    }
+
+
+def _execution_row(e: WorkflowExecution) -> dict[str, Any]:
+    return {
+        "id": e.id, "workflow_id": e.workflow_id, "trigger_event_id": e.trigger_event_id,
+        "status": e.status, "trigger_payload": e.trigger_payload,
+        "conditions_result": e.conditions_result, "actions_results": e.actions_results,
+        "error_message": e.error_message, "started_at": e.started_at, "completed_at": e.completed_at,
+    }
+
+
+@router.get("/", response_model=None)
 async def list_workflows(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """List all workflows for the tenant."""
+    db, current_user = ctx
     stmt = select(Workflow).options(selectinload(Workflow.actions)).where(
         Workflow.tenant_id == current_user.tenant_id
     ).order_by(Workflow.created_at.desc())
     result = await db.execute(stmt)
     workflows = result.scalars().all()
-    
-    return {
-        "data": workflows,
-        "error": None,
-        "meta": {"count": len(workflows)}
-    }
+
+    return EnvelopeResponse([_workflow_row(w) for w in workflows], meta={"count": len(workflows)})
 
 
-@router.post("/")
+@router.post("/", response_model=None)
 async def create_workflow(
     payload: dict,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """Create a new workflow with actions."""
+    db, current_user = ctx
     name = payload.get("name")
     trigger_type = payload.get("trigger_type")
     trigger_config = payload.get("trigger_config", {})
@@ -49,82 +70,88 @@ async def create_workflow(
     if not name or not trigger_type:
         raise HTTPException(status_code=422, detail="name and trigger_type are required")
 
+    # Timestamps are set client-side and actions attached in memory, so the commit flush
+    # inserts everything and the response is built without refresh or reload queries.
+    now = datetime.now(timezone.utc)
     workflow = Workflow(
         tenant_id=current_user.tenant_id,
         name=name,
         trigger_type=trigger_type,
         trigger_config=trigger_config,
         is_active=payload.get("is_active", True),
-        created_by=current_user.id
+        created_by=current_user.id,
+        created_at=now,
+        updated_at=now,
+        actions=[
+            WorkflowAction(
+                sequence_order=idx,
+                action_type=act.get("action_type"),
+                action_config=act.get("action_config", {}),
+                created_at=now,
+            )
+            for idx, act in enumerate(actions_payload)
+        ],
     )
     db.add(workflow)
-    await db.flush()
-
-    # Add actions
-    for idx, act in enumerate(actions_payload):
-        action = WorkflowAction(
-            workflow_id=workflow.id,
-            sequence_order=idx,
-            action_type=act.get("action_type"),
-            action_config=act.get("action_config", {})
-        )
-        db.add(action)
-
     await db.commit()
-    await db.refresh(workflow)
-    
-    # Reload with actions to return
-    stmt = select(Workflow).options(selectinload(Workflow.actions)).where(Workflow.id == workflow.id)
-    workflow_full = (await db.execute(stmt)).scalar_one()
 
-    return {"data": workflow_full, "error": None, "meta": None}
+    return EnvelopeResponse(_workflow_row(workflow))
 
 
-@router.post("/{workflow_id}/test")
+@router.post("/{workflow_id}/test", response_model=None)
 async def test_workflow(
     workflow_id: UUID,
     payload: dict,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
+    ctx: AuthedDb,
+) -> EnvelopeResponse:
     """Dry-run test a workflow trigger against a synthetic payload."""
+    db, current_user = ctx
     workflow = await db.get(Workflow, workflow_id)
     if not workflow or workflow.tenant_id != current_user.tenant_id:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
-    passed = ConditionEvaluator.evaluate(workflow.trigger_config, payload)
+    passed = ConditionEvaluator.for_workflow(workflow)(payload)
     
-    return {
-        "data": {
-            "workflow_id": workflow_id,
-            "conditions_passed": passed,
-            "simulated_payload": payload,
-            "would_trigger": passed and workflow.is_active
-        },
-        "error": None,
-        "meta": None
-    }
+    return EnvelopeResponse({
+        "workflow_id": workflow_id,
+        "conditions_passed": passed,
+        "simulated_payload": payload,
+        "would_trigger": passed and workflow.is_active
+    })
 
 
-@router.get("/{workflow_id}/executions")
+@router.get("/{workflow_id}/executions", response_model=None)
 async def list_executions(
     workflow_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> dict[str, Any]:
-    """List execution history for a workflow."""
-    workflow = await db.get(Workflow, workflow_id)
-    if not workflow or workflow.tenant_id != current_user.tenant_id:
-        raise HTTPException(status_code=404, detail="Workflow not found")
-
-    stmt = select(WorkflowExecution).where(
-        WorkflowExecution.workflow_id == workflow_id
-    ).order_by(WorkflowExecution.started_at.desc()).limit(100)
+    ctx: AuthedDb,
+    sku_id: UUID | None = None,
+    warehouse_id: UUID | None = None,
+) -> EnvelopeResponse:
+    """List execution history for a workflow, optionally only runs triggered for a SKU/warehouse."""
+    db, current_user = ctx
+    # Tenant check rides on the join; only an empty page needs a second query for the 404.
+    stmt = (
+        select(WorkflowExecution)
+        .join(Workflow, Workflow.id == WorkflowExecution.workflow_id)
+        .where(Workflow.id == workflow_id, Workflow.tenant_id == current_user.tenant_id)
+        .order_by(WorkflowExecution.started_at.desc())
+        .limit(100)
+    )
+    # Containment on the trigger payload is served by ix_workflow_executions_payload_gin
+    match = {k: str(v) for k, v in (("sku_id", sku_id), ("warehouse_id", warehouse_id)) if v is not None}
+    if match:
+        stmt = stmt.where(WorkflowExecution.trigger_payload.contains(match))
     result = await db.execute(stmt)
     executions = result.scalars().all()
+    if not executions:
+        exists = await db.scalar(
+            select(Workflow.id).where(
+                Workflow.id == workflow_id, Workflow.tenant_id == current_user.tenant_id
+            )
+        )
+        if exists is None:
+            raise HTTPException(status_code=404, detail="Workflow not found")
 
-    return {
-        "data": executions,
-        "error": None,
-        "meta": {"count": len(executions)}
-    }
+    return EnvelopeResponse(
+        [_execution_row(e) for e in executions], meta={"count": len(executions)}
+    )
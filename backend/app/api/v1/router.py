@@ -50,3 +50,17 @@ api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"]
 api_router.include_router(modules.router, prefix="/modules", tags=["modules"])
 api_router.include_router(module_serials.router, prefix="/modules/serial-numbers", tags=["module_serial_numbers"])
 api_router.include_router(module_expiry.router, prefix="/modules/expiry-tracker", tags=["module_expiry_tracker"])
+
+
+def _assert_unique_routes(router: APIRouter) -> None:
+    """Fail at import if two endpoints register the same (method, path)."""
+    seen: set[tuple[str, str]] = set()
+    for route in router.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+
+_assert_unique_routes(api_router)
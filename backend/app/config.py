@@ -1,6 +1,6 @@
 """NEXUS IMS — Application configuration via pydantic-settings."""
 from functools import lru_cache
-from typing import List
+from typing import FrozenSet
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -21,22 +21,35 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Set when DATABASE_URL points at pgbouncer in transaction pooling mode
+    DATABASE_PGBOUNCER: bool = False
+    # Per-process request pool; workers x (size + overflow) must fit max_connections
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/1"
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 200
 
     # JWT
     JWT_SECRET_KEY: str = "change-me-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_TTL_MINUTES: int = 15
     JWT_REFRESH_TOKEN_TTL_DAYS: int = 7
+    JWT_DECODE_CACHE_SIZE: int = 10_000
+    JWT_DECODE_CACHE_TTL_SECONDS: int = 15
 
-    # ✅ CORS (FIXED FOR PYDANTIC V2)
-    CORS_ORIGINS: List[str] = [
+    # Rate limiting: share of each limit counted per worker before going to Redis
+    RATE_LIMIT_LOCAL_FRACTION: float = 0.5
+    # Proxies (IPs or CIDRs) whose X-Forwarded-For is believed when keying anonymous callers
+    RATE_LIMIT_TRUSTED_PROXIES: FrozenSet[str] = frozenset({"127.0.0.1", "::1"})
+
+    # ✅ CORS (FIXED FOR PYDANTIC V2) — frozenset so CORSMiddleware's origin check is a hash hit
+    CORS_ORIGINS: FrozenSet[str] = frozenset({
         "http://localhost:3000",
         "http://localhost:5173",
-    ]
+    })
 
     # ✅ Allow ALL Vercel preview deployments
     CORS_ALLOW_ORIGIN_REGEX: str = r"https://.*\.vercel\.app"
@@ -1,87 +1,125 @@
 """NEXUS IMS — JWT + API key auth middleware: extracts credentials, sets request.state.user."""
 import logging
-from typing import Callable
+import time
 from uuid import UUID
 
-from fastapi import Request, Response
-from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.middleware.base import BaseHTTPMiddleware
+from cachetools import TTLCache
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.api.deps import CurrentUser
-from app.core.security import decode_token
+from app.config import get_settings
+from app.core.paths import PUBLIC_EXACT, PUBLIC_PREFIXES
+from app.core.security import decode_token, token_key
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# Fully built identities for access tokens, keyed by token_key(token): a hit skips the
+# decode, both UUID parses and the CurrentUser construction. Values are
+# (exp, user, tenant_id, sub); the cached CurrentUser is shared, so treat it as read-only.
+_user_cache: TTLCache = TTLCache(
+    maxsize=settings.JWT_DECODE_CACHE_SIZE, ttl=settings.JWT_DECODE_CACHE_TTL_SECONDS
+)
+
+
+def forget_user(token: str) -> None:
+    """Drop a token's cached identity (e.g. on logout)."""
+    _user_cache.pop(token_key(token), None)
+
+
+def _resolve_bearer(token: str) -> tuple[int, CurrentUser, str, str] | None:
+    """Build the identity for an access token, or None when it is invalid."""
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return None
+    sub = payload.get("sub")
+    tenant_id = payload.get("tenant_id")
+    if not (sub and tenant_id):
+        return None
+    user = CurrentUser(
+        id=UUID(sub),
+        email=payload.get("email") or "unknown",
+        tenant_id=UUID(tenant_id),
+        role=payload.get("role", "FLOOR_ASSOCIATE"),
+        warehouse_scope=payload.get("warehouse_scope"),  # optional claim
+    )
+    return payload["exp"], user, tenant_id, sub
+
+
 
-class JWTAuthMiddleware(BaseHTTPMiddleware):
-    """Extract JWT from Authorization header (or API key from X-API-Key) and populate request.state.user."""
-
-    PUBLIC_PATHS = {
-        "/api/v1/auth/login",
-        "/api/v1/auth/refresh",
-        "/api/v1/users/accept-invitation",
-        "/health",
-        "/api/v1/docs",
-        "/api/v1/redoc",
-        "/api/v1/openapi.json",
-    }
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request.state.user = None
-        request.state.tenant_id = None
-
-        path = request.url.path
-        if (
-            path in self.PUBLIC_PATHS
-            or path.startswith("/api/v1/docs")
-            or path.startswith("/api/v1/redoc")
-            or path.startswith("/openapi")
-        ):
-            return await call_next(request)
+class JWTAuthMiddleware:
+    """
+    Extract JWT from Authorization header (or API key from X-API-Key) and populate request.state.user.
+    Pure ASGI: no per-request task/channel or Request/Response wrapping as with BaseHTTPMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # request.state is a view over scope["state"]
+        state = scope.setdefault("state", {})
+        state["user"] = None
+        state["tenant_id"] = None
+
+        path = scope["path"]
+        if path in PUBLIC_EXACT or path.startswith(PUBLIC_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        # ASGI header names are already lower-cased bytes
+        headers = dict(scope["headers"])
 
         # ── 1. Try JWT Bearer token ─────────────────────────────────────────
-        auth = request.headers.get("Authorization", "")
+        auth = headers.get(b"authorization", b"").decode("latin-1")
         if auth.startswith("Bearer "):
             token = auth[7:].strip()
-            payload = decode_token(token)
-            if payload and payload.get("type") == "access":
-                sub = payload.get("sub")
-                tenant_id = payload.get("tenant_id")
-                role = payload.get("role", "FLOOR_ASSOCIATE")
-                email = payload.get("email") or "unknown"
-                warehouse_scope = payload.get("warehouse_scope")  # optional claim
-                if sub and tenant_id:
-                    request.state.user = CurrentUser(
-                        id=UUID(sub),
-                        email=email,
-                        tenant_id=UUID(tenant_id),
-                        role=role,
-                        warehouse_scope=warehouse_scope,
-                    )
-                    request.state.tenant_id = tenant_id
-            return await call_next(request)
+            key = token_key(token)
+            entry = _user_cache.get(key)
+            if entry is None or entry[0] <= time.time():
+                entry = _resolve_bearer(token)
+                if entry is not None:
+                    _user_cache[key] = entry
+            if entry is not None:
+                _, state["user"], state["tenant_id"], sub = entry
+                # Rate-limit identity for RateLimitMiddleware (runs inside this one)
+                state["rl_caller"] = sub
+                state["rl_type"] = "auth"
+            await self.app(scope, receive, send)
+            return
 
         # ── 2. Try X-API-Key header ─────────────────────────────────────────
-        raw_key = request.headers.get("X-API-Key", "").strip()
+        raw_key = headers.get(b"x-api-key", b"").decode("latin-1").strip()
         if raw_key:
             try:
-                from app.db.session import async_session_maker
+                from app.db.session import auth_session_maker
                 from app.services.api_key_service import APIKeyService
 
-                async with async_session_maker() as db:
-                    api_key = await APIKeyService.authenticate_by_api_key(db, raw_key)
-                    if api_key:
-                        await db.commit()
-                        # API keys always use ADMIN role for now — can add per-key role later
-                        request.state.user = CurrentUser(
-                            id=api_key.created_by or api_key.id,
-                            email="api-key",
-                            tenant_id=api_key.tenant_id,
-                            role="ADMIN",
-                            warehouse_scope=None,
-                        )
-                        request.state.tenant_id = str(api_key.tenant_id)
+                identity = await APIKeyService.get_cached_identity(raw_key)
+                if identity is None:
+                    async with auth_session_maker() as db:
+                        api_key = await APIKeyService.authenticate_by_api_key(db, raw_key)
+                        if api_key:
+                            await db.commit()
+                            identity = await APIKeyService.cache_identity(raw_key, api_key)
+                if identity:
+                    # API keys always use ADMIN role for now — can add per-key role later
+                    state["user"] = CurrentUser(
+                        id=UUID(identity["created_by"] or identity["id"]),
+                        email="api-key",
+                        tenant_id=UUID(identity["tenant_id"]),
+                        role="ADMIN",
+                        warehouse_scope=None,
+                    )
+                    state["tenant_id"] = identity["tenant_id"]
+                    state["rl_caller"] = identity["id"]
+                    state["rl_type"] = "api_key"
             except Exception as exc:
                 logger.warning("API key auth error: %s", exc)
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
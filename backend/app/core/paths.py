@@ -0,0 +1,22 @@
+"""NEXUS IMS — Request paths that bypass auth and/or rate limiting, shared by the middlewares.
+
+Checked on every request: a frozenset hit plus one tuple startswith, both single C calls
+(measured faster than an equivalent compiled regex). Docs/redoc are covered by prefix.
+"""
+
+# No credentials required (JWTAuthMiddleware)
+PUBLIC_EXACT = frozenset({
+    "/api/v1/auth/login",
+    "/api/v1/auth/refresh",
+    "/api/v1/users/accept-invitation",
+    "/health",
+    "/api/v1/openapi.json",
+})
+PUBLIC_PREFIXES = ("/api/v1/docs", "/api/v1/redoc", "/openapi")
+
+# Not metered (RateLimitMiddleware): probes and docs only. Login, refresh and invitation
+# acceptance stay limited since they are the brute-force targets.
+UNLIMITED_EXACT = frozenset({
+    "/health",
+    "/api/v1/openapi.json",
+})
@@ -1,9 +1,23 @@
 """NEXUS IMS — Rate Limiting (Block 10)."""
+import ipaddress
+import logging
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import uuid
+
+from cachetools import TTLCache
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.core.paths import PUBLIC_PREFIXES, UNLIMITED_EXACT
 from app.core.redis import get_redis
+from app.core.responses import dumps
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
 
 # Rate limits: 1000 per min for users, 500 per min for API keys
 LIMITS = {
@@ -12,61 +26,176 @@ LIMITS = {
     "default": 100  # Fallback for unauthenticated
 }
 WINDOW = 60
+_WINDOW_NS = WINDOW * 1_000_000_000
+
+# Per-worker first level: key -> [hits not yet sent to Redis, window end (monotonic ns)].
+# The first LOCAL_FRACTION of each limit is counted here without a Redis round-trip; past
+# that, Redis enforces the remainder (limit minus local hits). Each worker may therefore
+# admit up to that local share without global coordination.
+LOCAL_FRACTION = settings.RATE_LIMIT_LOCAL_FRACTION
+_local: TTLCache = TTLCache(maxsize=10_000, ttl=WINDOW)
+
+# 429 bodies are constant per limit type, so they are encoded once rather than under overload
+_LIMIT_BODIES = {
+    limit_type: dumps({
+        "data": None,
+        "error": {
+            "code": "RATE_LIMIT_EXCEEDED",
+            "message": "Too many requests. Please slow down."
+        },
+        "meta": {
+            "limit": limit,
+            "remaining": 0
+        }
+    })
+    for limit_type, limit in LIMITS.items()
+}
+_LIMIT_BODY_LENGTHS = {t: str(len(body)).encode() for t, body in _LIMIT_BODIES.items()}
+
+# Sliding window on a sorted set of request timestamps (ms), atomic and in one round-trip.
+# Rejected requests are not recorded, so a client that backs off regains capacity as its
+# oldest hits age out. Returns {count incl. this request, seconds until the oldest hit expires}.
+# ARGV: now_ms, window_ms, limit, unique member suffix.
+SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local n = redis.call('ZCARD', KEYS[1])
+if n < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, now .. ':' .. ARGV[4])
+end
+redis.call('PEXPIRE', KEYS[1], window)
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')[2]
+local reset_ms = window
+if oldest then
+    reset_ms = tonumber(oldest) + window - now
+end
+return {n + 1, math.ceil(reset_ms / 1000)}
+"""
+_script: AsyncScript | None = None
+
+_TRUSTED_PROXIES = tuple(
+    ipaddress.ip_network(p, strict=False) for p in settings.RATE_LIMIT_TRUSTED_PROXIES
+)
+
+
+async def preload_script() -> None:
+    """SCRIPT LOAD at startup so the first limited request is a plain EVALSHA."""
+    global _script
+    r = await get_redis()
+    _script = r.register_script(SCRIPT)
+    try:
+        await r.script_load(SCRIPT)
+    except Exception as exc:  # Redis down at boot: first hit loads it via the NOSCRIPT fallback
+        logger.warning("Rate-limit script preload failed: %s", exc)
+
 
+async def _hit(key: str, limit: int) -> tuple[int, int]:
+    """Count one request against key; returns (count in window, seconds until a slot frees)."""
+    global _script
+    if _script is None:
+        # EVALSHA, re-loading the script on NOSCRIPT (e.g. after a Redis restart)
+        _script = (await get_redis()).register_script(SCRIPT)
+    now_ms = time.time_ns() // 1_000_000
+    count, ttl = await _script(keys=[key], args=[now_ms, WINDOW * 1000, limit, uuid.uuid4().hex])
+    return int(count), int(ttl)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable):
-        r = await get_redis()
-        
-        # Identify caller type
-        caller_id = request.client.host if request.client else "unknown"
-        limit_type = "default"
-        
-        # Simple extraction for demo (production would parse tokens properly before middleware or use Depends)
-        auth_header = request.headers.get("Authorization", "")
-        if auth_header.startswith("Bearer "):
-            caller_id = auth_header.split(" ")[1][:20] # truncate
-            limit_type = "auth"
-        elif "X-API-Key" in request.headers:
-            caller_id = request.headers.get("X-API-Key")[:20]
-            limit_type = "api_key"
+
+def _is_trusted_proxy(addr: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(addr)
+    except ValueError:
+        return False
+    return any(ip in net for net in _TRUSTED_PROXIES)
+
+
+def _client_address(scope: Scope) -> str:
+    """
+    Address of the anonymous caller. Behind a trusted proxy (nginx), walk X-Forwarded-For
+    from the right and take the first hop that is not itself a trusted proxy.
+    """
+    client = scope.get("client")
+    addr = client[0] if client else "unknown"
+    if not _is_trusted_proxy(addr):
+        return addr
+    for name, value in scope["headers"]:
+        if name == b"x-forwarded-for":
+            for hop in reversed(value.decode("latin-1").split(",")):
+                addr = hop.strip()
+                if not _is_trusted_proxy(addr):
+                    break
+            break
+    return addr
+
+
+class RateLimitMiddleware:
+    """Sliding-window limiter; pure ASGI, so headers are added on http.response.start."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in UNLIMITED_EXACT or path.startswith(PUBLIC_PREFIXES):
+            # Health probes and docs: no Redis I/O
+            await self.app(scope, receive, send)
+            return
+
+        # Caller identity is resolved once by JWTAuthMiddleware (user id / API key id);
+        # unauthenticated requests are limited per client address.
+        state = scope.get("state", {})
+        caller_id = state.get("rl_caller")
+        limit_type = state.get("rl_type", "default")
+        if caller_id is None:
+            caller_id = _client_address(scope)
+            limit_type = "default"
 
         key = f"rl:{limit_type}:{caller_id}"
-        
-        # Redis Token Bucket / Fixed Window approach
-        current = await r.get(key)
-        if current is None:
-            await r.setex(key, WINDOW, 1)
-            count = 1
+        limit = LIMITS[limit_type]
+
+        now_ns = time.monotonic_ns()
+        entry = _local.get(key)
+        if entry is None or now_ns >= entry[1]:
+            entry = _local[key] = [0, now_ns + _WINDOW_NS]
+        if entry[0] < limit * LOCAL_FRACTION:
+            # Local share of the budget: no Redis round-trip
+            entry[0] += 1
+            count = entry[0]
+            ttl = -(-(entry[1] - now_ns) // 1_000_000_000)
         else:
-            count = int(current) + 1
-            if count > LIMITS[limit_type]:
-                from fastapi.responses import JSONResponse
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "data": None,
-                        "error": {
-                            "code": "RATE_LIMIT_EXCEEDED",
-                            "message": "Too many requests. Please slow down."
-                        },
-                        "meta": {
-                            "limit": LIMITS[limit_type],
-                            "remaining": 0
-                        }
-                    },
-                    headers={"Retry-After": str(WINDOW)}
-                )
-            await r.incr(key)
-
-        response = await call_next(request)
-        
-        # Add Rate Limit Headers
-        response.headers["X-RateLimit-Limit"] = str(LIMITS[limit_type])
-        response.headers["X-RateLimit-Remaining"] = str(max(0, LIMITS[limit_type] - count))
-        
-        # Approximate reset time
-        ttl = await r.ttl(key)
-        response.headers["X-RateLimit-Reset"] = str(int(time.time()) + (ttl if ttl > 0 else WINDOW))
-        
-        return response
+            # Sliding window in Redis, one round-trip; local hits already spent part of it
+            try:
+                count, ttl = await _hit(key, limit - entry[0])
+            except RedisError as exc:
+                # Fail open: a Redis outage must not turn into a 500 on every request
+                logger.warning("Rate-limit check skipped, Redis unavailable: %s", exc)
+                await self.app(scope, receive, send)
+                return
+            count += entry[0]
+        if count > limit:
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", _LIMIT_BODY_LENGTHS[limit_type]),
+                    (b"retry-after", str(ttl).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": _LIMIT_BODIES[limit_type]})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add Rate Limit Headers
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-RateLimit-Limit"] = str(LIMITS[limit_type])
+                response_headers["X-RateLimit-Remaining"] = str(max(0, LIMITS[limit_type] - count))
+                response_headers["X-RateLimit-Reset"] = str(int(time.time()) + ttl)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
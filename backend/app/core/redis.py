@@ -1,4 +1,5 @@
 """NEXUS IMS — Redis client for cache (Block 2)."""
+import socket
 from typing import Optional
 
 import redis.asyncio as redis
@@ -9,17 +10,76 @@ _settings = get_settings()
 _redis: Optional[redis.Redis] = None
 
 
+def _keepalive_options() -> dict[int, int]:
+    # Probe idle connections after 30s so dead peers are found before a request hits them
+    opts = {}
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):  # Linux names; absent on some platforms
+            opts[getattr(socket, name)] = value
+    return opts
+
+
+def _create_client() -> redis.Redis:
+    pool = redis.ConnectionPool.from_url(
+        _settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=_settings.REDIS_MAX_CONNECTIONS,
+        socket_keepalive=True,
+        socket_keepalive_options=_keepalive_options(),
+        health_check_interval=30,
+    )
+    # from_pool: the client owns the pool, so aclose() also disconnects it
+    return redis.Redis.from_pool(pool)
+
+
 async def get_redis() -> redis.Redis:
-    """Get Redis connection (application cache DB 1)."""
+    """Get Redis connection (application cache DB 1). Created in the app lifespan; lazily elsewhere."""
     global _redis
     if _redis is None:
-        _redis = redis.from_url(_settings.REDIS_URL, decode_responses=True)
+        _redis = _create_client()
     return _redis
 
 
+async def close_redis() -> None:
+    """Close the shared client and its pool (app shutdown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
 def stock_cache_key(tenant_id: str, sku_id: str, warehouse_id: str) -> str:
     """Cache key for stock level: stock:{tid}:{sku}:{wh}"""
     return f"stock:{tenant_id}:{sku_id}:{warehouse_id}"
 
 
 STOCK_CACHE_TTL = 30
+
+
+def ws_token_cache_key(token_digest: str) -> str:
+    """Cache key for decoded WebSocket JWT claims: wsauth:{sha256(token) prefix}"""
+    return f"wsauth:{token_digest}"
+
+
+WS_TOKEN_CACHE_TTL = 300
+
+
+def sku_bloom_key(tenant_id: str) -> str:
+    """Bitmap key for the tenant's sku_code Bloom filter: skubloom:{tid}"""
+    return f"skubloom:{tenant_id}"
+
+
+SKU_BLOOM_TTL = 86400
+
+
+def api_key_cache_key(key_digest: str) -> str:
+    """Cached API-key identity: apikey:{sha256(raw key)}"""
+    return f"apikey:{key_digest}"
+
+
+def api_key_index_key(key_id: str) -> str:
+    """Reverse index for revocation: apikey_id:{key id} -> sha256(raw key)"""
+    return f"apikey_id:{key_id}"
+
+
+API_KEY_CACHE_TTL = 60
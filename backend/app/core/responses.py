@@ -1,5 +1,10 @@
 """NEXUS IMS — API Response Helpers (Block 10)."""
+from collections.abc import AsyncIterator
+from decimal import Decimal
 from typing import Any, Generic, TypeVar
+
+import orjson
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
@@ -12,6 +17,89 @@ class APIResponse(BaseModel, Generic[T]):
     meta: dict[str, Any] | None = None
 
 
+def orjson_default(obj: Any) -> Any:
+    """orjson fallback for types it has no native encoder for."""
+    if isinstance(obj, Decimal):
+        # Exact string, matching how Pydantic emits Decimal fields
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize with orjson; UUID and datetime are native, Decimal goes through orjson_default."""
+    return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+_ENVELOPE_HEAD = b'{"data":'
+_ENVELOPE_TAIL = b',"error":null,"meta":null}'
+_ENVELOPE_META = b',"error":null,"meta":'
+
+
+class EnvelopeResponse(Response):
+    """
+    Success envelope {"data", "error": null, "meta"} with the constant framing pre-encoded;
+    only data (and meta, when given) go through orjson.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, data: Any, meta: dict | None = None, status_code: int = 200) -> None:
+        self.meta = meta
+        super().__init__(data, status_code=status_code)
+
+    def render(self, content: Any) -> bytes:
+        if self.meta is None:
+            return _ENVELOPE_HEAD + dumps(content) + _ENVELOPE_TAIL
+        return _ENVELOPE_HEAD + dumps(content) + _ENVELOPE_META + dumps(self.meta) + b"}"
+
+
+class RawEnvelopeResponse(EnvelopeResponse):
+    """EnvelopeResponse whose data is already JSON text (e.g. built by Postgres); not re-encoded."""
+
+    def render(self, content: bytes | str) -> bytes:
+        if isinstance(content, str):
+            content = content.encode()
+        if self.meta is None:
+            return _ENVELOPE_HEAD + content + _ENVELOPE_TAIL
+        return _ENVELOPE_HEAD + content + _ENVELOPE_META + dumps(self.meta) + b"}"
+
+
+async def _envelope_chunks(
+    first: list, rest: AsyncIterator[list], count_key: str | None
+) -> AsyncIterator[bytes]:
+    count = len(first)
+    yield _ENVELOPE_HEAD + b"[" + dumps(first)[1:-1]
+    sep = b"," if first else b""
+    async for batch in rest:
+        if batch:
+            yield sep + dumps(batch)[1:-1]
+            sep = b","
+            count += len(batch)
+    meta = {count_key: count} if count_key else None
+    yield b"]" + _ENVELOPE_META + dumps(meta) + b"}"
+
+
+async def stream_envelope(
+    batches: AsyncIterator[list], count_key: str | None = None
+) -> StreamingResponse:
+    """
+    Stream the {"data", "error", "meta"} envelope from batches of row dicts, one orjson
+    chunk per batch. The first batch is awaited here so query errors still surface as a
+    normal error response; meta carries the row count under count_key once it is known.
+    """
+    first = await anext(batches, [])
+    return StreamingResponse(
+        _envelope_chunks(first, batches, count_key), media_type="application/json"
+    )
+
+
 def success_response(data: Any, meta: dict | None = None) -> dict:
     return {"data": data, "error": None, "meta": meta}
 
@@ -1,32 +1,72 @@
 """NEXUS IMS — Password hashing (bcrypt) and JWT tokens."""
-from datetime import datetime, timedelta, timezone
+import binascii
+import hashlib
+import hmac
+import threading
+import time
 from typing import Any
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
+from jwt.utils import base64url_decode, base64url_encode
 
 from app.config import get_settings
 
 settings = get_settings()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
+BCRYPT_ROUNDS = 10
 
+# Verified payloads keyed by sha256(token) — the raw token is never held. Entries live for
+# a few seconds at most, so a revoked or rotated secret takes effect within that window.
+_decode_cache: TTLCache = TTLCache(
+    maxsize=settings.JWT_DECODE_CACHE_SIZE, ttl=settings.JWT_DECODE_CACHE_TTL_SECONDS
+)
+_decode_lock = threading.Lock()
 
+# HS256 fast path: every token we issue carries exactly this header segment, so it is
+# matched as a string rather than decoded, and the HMAC key is encoded once.
+_HS256_HEADER = base64url_encode(b'{"alg":"HS256","typ":"JWT"}').decode()
+_key_bytes = settings.JWT_SECRET_KEY.encode()
+# Signing side of the same fast path: header prefix and keyed HMAC state built once, copied per token
+_HS256_PREFIX = _HS256_HEADER.encode() + b"."
+_hmac_template = hmac.new(_key_bytes, _HS256_PREFIX, hashlib.sha256)
+
+# Token lifetimes in seconds; exp/iat are written as integer epoch seconds.
+_ACCESS_TTL_SEC = settings.JWT_ACCESS_TOKEN_TTL_MINUTES * 60
+_REFRESH_TTL_SEC = settings.JWT_REFRESH_TOKEN_TTL_DAYS * 86400
+
+
+# bcrypt directly (no passlib CryptContext dispatch); existing $2b$ hashes verify unchanged.
+# Both are CPU-bound for tens of ms — call them via anyio.to_thread from async code.
 def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+    try:
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+    except ValueError:  # malformed stored hash
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+def _encode(payload: dict) -> str:
+    """Sign payload as HS256 without PyJWT (header matches _HS256_HEADER); other algorithms use jwt.encode."""
+    if settings.JWT_ALGORITHM != "HS256":
+        return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    body = base64url_encode(orjson.dumps(payload))
+    mac = _hmac_template.copy()
+    mac.update(body)
+    return (_HS256_PREFIX + body + b"." + base64url_encode(mac.digest())).decode()
 
 
 def create_access_token(subject: str | Any, tenant_id: str, extra_claims: dict | None = None, email: str | None = None) -> str:
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_TTL_MINUTES)
+    now = int(time.time())
     payload = {
         "sub": str(subject),
         "tenant_id": str(tenant_id),
-        "exp": expire,
+        "exp": now + _ACCESS_TTL_SEC,
         "iat": now,
         "type": "access",
     }
@@ -34,18 +74,78 @@ def create_access_token(subject: str | Any, tenant_id: str, extra_claims: dict |
         payload["email"] = email
     if extra_claims:
         payload.update(extra_claims)
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    return _encode(payload)
 
 
 def create_refresh_token(subject: str | Any) -> str:
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(days=settings.JWT_REFRESH_TOKEN_TTL_DAYS)
-    payload = {"sub": str(subject), "exp": expire, "iat": now, "type": "refresh"}
-    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    now = int(time.time())
+    payload = {"sub": str(subject), "exp": now + _REFRESH_TTL_SEC, "iat": now, "type": "refresh"}
+    return _encode(payload)
 
 
-def decode_token(token: str) -> dict | None:
+def token_key(token: str) -> bytes:
+    """Cache key for a bearer token: its sha256 digest, so raw tokens are never held."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+_FAST_PATH_FALLBACK = object()
+
+
+def _decode_hs256(token: str) -> dict | None | object:
+    """
+    Verify one of our own HS256 tokens with a bare HMAC + orjson, no PyJWT parsing.
+    Returns _FAST_PATH_FALLBACK for anything outside that shape (other header, aud/nbf
+    claims, non-integer timestamps) so jwt.decode applies its full rules instead.
+    """
+    header, sep, rest = token.partition(".")
+    if header != _HS256_HEADER or settings.JWT_ALGORITHM != "HS256":
+        return _FAST_PATH_FALLBACK
+    body, sep2, sig = rest.partition(".")
+    if not sep or not sep2 or "." in sig:
+        return None
     try:
-        return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-    except JWTError:
+        expected = hmac.new(_key_bytes, f"{header}.{body}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, base64url_decode(sig)):
+            return None
+        payload = orjson.loads(base64url_decode(body))
+    except (binascii.Error, ValueError, UnicodeEncodeError):
+        return None
+    if not isinstance(payload, dict) or "aud" in payload or "nbf" in payload:
+        return _FAST_PATH_FALLBACK
+    exp, iat, sub = payload.get("exp"), payload.get("iat"), payload.get("sub")
+    if type(exp) is not int or type(iat) is not int or not isinstance(sub, str):
+        return _FAST_PATH_FALLBACK
+    now = time.time()
+    if exp <= now or iat > now:
         return None
+    return payload
+
+
+def decode_token(token: str) -> dict | None:
+    key = token_key(token)
+    with _decode_lock:
+        payload = _decode_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+    payload = _decode_hs256(token)
+    if payload is None:
+        return None
+    if payload is _FAST_PATH_FALLBACK:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM],
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.PyJWTError:
+            return None
+    with _decode_lock:
+        _decode_cache[key] = payload
+    return payload
+
+
+def forget_token(token: str) -> None:
+    """Drop a token's cached payload (e.g. on logout)."""
+    with _decode_lock:
+        _decode_cache.pop(token_key(token), None)
@@ -1,8 +1,33 @@
-"""NEXUS IMS — SQLAlchemy declarative base."""
-from sqlalchemy.orm import DeclarativeBase
+"""NEXUS IMS — SQLAlchemy declarative base and shared column mixins."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
     """Base for all models."""
 
     pass
+
+
+class TenantMixin:
+    """Owning tenant; RLS policies filter on this column."""
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+
+
+class CreatedAtMixin:
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class TimestampMixin(CreatedAtMixin):
+    """created_at plus an updated_at that the ORM bumps on every UPDATE."""
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Return the new updated_at via UPDATE ... RETURNING rather than expiring it, which
+    # would need a lazy refresh (unavailable under AsyncSession) on next access
+    __mapper_args__ = {"eager_defaults": True}
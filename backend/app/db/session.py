@@ -1,43 +1,170 @@
 """NEXUS IMS — Async SQLAlchemy session and engine."""
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import uuid4
 
+import orjson
 from fastapi import Request
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
+from app.core.responses import orjson_default
 
 settings = get_settings()
 
+_ASYNC_DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+
+# pgbouncer in transaction mode gives each transaction whichever server backend is free, so
+# named prepared statements can't be cached across checkouts and session-level SETs would
+# leak to other clients (see _apply_tenant_guc).
+_CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+} if settings.DATABASE_PGBOUNCER else {
+    # JIT compilation only pays off for long analytic queries and adds tens of ms to short
+    # OLTP ones. pgbouncer rejects unknown startup parameters; set it on the role there.
+    "server_settings": {"jit": "off"},
+}
+
+
+def _json_serializer(value: Any) -> str:
+    """JSON/JSONB bind values through orjson; non-str keys are stringified like stdlib json."""
+    return orjson.dumps(value, default=orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# The asyncpg dialect installs its own jsonb codec on connect and calls these, so JSONB
+# columns (workflow configs, trigger payloads, SKU attributes) decode with orjson.
 engine = create_async_engine(
-    settings.DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://"
-    ),
+    _ASYNC_DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    connect_args=_CONNECT_ARGS,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=settings.DEBUG,
 )
 
+# connection.info keys: the app.tenant_id committed on that pooled connection, and one set
+# in the current transaction that a rollback (including reset-on-return) would undo.
+_TENANT_GUC_KEY = "app.tenant_id"
+_TENANT_GUC_PENDING = "app.tenant_id.pending"
+
+
+class TenantSession(Session):
+    """
+    Sync session behind the request AsyncSession.
+    Reads the RLS tenant from session.info["tenant_id"]; see _apply_tenant_guc.
+    """
+
+
+@event.listens_for(TenantSession, "after_begin")
+def _apply_tenant_guc(session, transaction, connection) -> None:
+    """
+    Make app.tenant_id on the checked-out connection match session.info["tenant_id"].
+    The setting is session-level and remembered in connection.info once its transaction
+    commits, so a pooled connection that already carries this tenant costs no extra
+    round-trip on later checkouts. Behind
+    pgbouncer the backend can change per transaction, so it is set transaction-local
+    every time instead.
+    """
+    tenant_id = session.info.get("tenant_id")
+    if settings.DATABASE_PGBOUNCER:
+        connection.execute(
+            text("SELECT set_config('app.tenant_id', :tid, true)"),
+            {"tid": tenant_id or ""},
+        )
+        return
+    if connection.info.get(_TENANT_GUC_KEY) == tenant_id:
+        return
+    connection.execute(
+        text("SELECT set_config('app.tenant_id', :tid, false)"),
+        {"tid": tenant_id or ""},
+    )
+    connection.info[_TENANT_GUC_PENDING] = tenant_id
+
+
+@event.listens_for(engine.sync_engine, "commit")
+def _keep_tenant_guc_on_commit(conn) -> None:
+    """The SET made in this transaction now outlives it; later checkouts can skip it."""
+    if _TENANT_GUC_PENDING in conn.info:
+        conn.info[_TENANT_GUC_KEY] = conn.info.pop(_TENANT_GUC_PENDING)
+
+
+@event.listens_for(engine.sync_engine, "rollback")
+def _forget_tenant_guc_on_rollback(conn) -> None:
+    """A rollback reverts a SET made in that transaction to the committed value."""
+    conn.info.pop(_TENANT_GUC_PENDING, None)
+
+
+@event.listens_for(engine.sync_engine.pool, "reset")
+def _forget_tenant_guc_on_reset(dbapi_connection, connection_record, reset_state) -> None:
+    """Pool reset-on-return rolls back too, outside of any Connection; a committed SET survives it."""
+    connection_record.info.pop(_TENANT_GUC_PENDING, None)
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=TenantSession,
     expire_on_commit=False,
 )
 
+# Auth-only pool for API-key lookups in JWTAuthMiddleware (cache misses). Those run before
+# the request's own get_db session, so sharing the request pool would let auth checkouts
+# starve it. No pre-ping: the lookup is a single short statement and is retried on the
+# next request if a stale connection fails.
+auth_engine = create_async_engine(
+    _ASYNC_DATABASE_URL,
+    pool_pre_ping=False,
+    pool_size=5,
+    max_overflow=20,
+    pool_recycle=1800,
+    connect_args=_CONNECT_ARGS,
+    echo=settings.DEBUG,
+)
 
-async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+auth_session_maker = async_sessionmaker(
+    auth_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+@asynccontextmanager
+async def task_session() -> AsyncIterator[AsyncSession]:
     """
-    Dependency: yield async DB session.
-    Sets app.tenant_id for RLS when request has tenant context.
+    Session for a Celery task body, which runs under a fresh asyncio.run() loop per call.
+    asyncpg connections are bound to the loop that opened them, so the pooled engines above
+    cannot be shared across runs; this engine has no pool and is disposed with the session.
+    """
+    task_engine = create_async_engine(
+        _ASYNC_DATABASE_URL,
+        poolclass=NullPool,
+        connect_args=_CONNECT_ARGS,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        echo=settings.DEBUG,
+    )
+    try:
+        async with AsyncSession(task_engine, expire_on_commit=False) as session:
+            yield session
+    finally:
+        await task_engine.dispose()
+
+
+@asynccontextmanager
+async def tenant_session(tenant_id: str | None) -> AsyncIterator[AsyncSession]:
     """
-    tenant_id = getattr(request.state, "tenant_id", None)
-    async with async_session_maker() as session:
-        if tenant_id:
-            await session.execute(
-                text("SELECT set_config('app.tenant_id', :tid, true)"),
-                {"tid": str(tenant_id)},
-            )
+    Open a session scoped to one unit of work.
+    Scopes app.tenant_id for RLS, commits on success and rolls back on error.
+    """
+    async with async_session_maker(info={"tenant_id": str(tenant_id) if tenant_id else None}) as session:
         try:
             yield session
             await session.commit()
@@ -46,3 +173,13 @@ async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency: yield async DB session.
+    Sets app.tenant_id for RLS when request has tenant context.
+    """
+    # Read scope["state"] directly rather than through the request.state wrapper
+    async with tenant_session(request.scope["state"].get("tenant_id")) as session:
+        yield session
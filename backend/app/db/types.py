@@ -0,0 +1,58 @@
+"""NEXUS IMS — custom column types."""
+from decimal import Decimal
+from enum import Enum
+
+from sqlalchemy import BigInteger, CheckConstraint, Numeric, cast, literal
+from sqlalchemy.types import Boolean, TypeDecorator, UserDefinedType
+
+QUANTITY_SCALE = 4
+QUANTITY_FACTOR = 10**QUANTITY_SCALE
+
+
+class MinorUnits(TypeDecorator):
+    """
+    Decimal quantity stored as a BIGINT count of 1/10000 units.
+    SUM over BIGINT stays in integer arithmetic; Python still sees 4-place Decimals.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(Decimal(str(value)).scaleb(QUANTITY_SCALE).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-QUANTITY_SCALE)
+
+
+class Ltree(UserDefinedType):
+    """Postgres ltree label path (extension ``ltree``); values are dot-separated label strings."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "LTREE"
+
+    class comparator_factory(UserDefinedType.Comparator):  # noqa: N801
+        def descendant_of(self, other):
+            """``path <@ other``: this path is ``other`` or below it."""
+            return self.op("<@", return_type=Boolean)(other)
+
+        def ancestor_of(self, other):
+            """``path @> other``: this path is ``other`` or above it."""
+            return self.op("@>", return_type=Boolean)(other)
+
+
+def from_minor(expr):
+    """Scale a minor-unit SQL expression (e.g. a SUM) back to NUMERIC(18, 4) for SQL-side math."""
+    return cast(cast(expr, Numeric) / literal(QUANTITY_FACTOR), Numeric(18, 4))
+
+
+def enum_check(column: str, enum: type[Enum], name: str) -> CheckConstraint:
+    """CHECK constraint pinning a String column to the values of a str Enum."""
+    values = ", ".join(f"'{member.value}'" for member in enum)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
@@ -8,7 +8,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.auth_middleware import JWTAuthMiddleware
-from app.core.rate_limit import RateLimitMiddleware
+from app.core.rate_limit import RateLimitMiddleware, preload_script
+from app.core.redis import close_redis, get_redis
+from app.core.responses import ORJSONResponse
 from app.config import get_settings
 
 settings = get_settings()
@@ -18,10 +20,12 @@ from app.api.v1.router import api_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan — Redis pool, startup/shutdown."""
-    # Startup: init Redis connection pool (used in lifespan or dependency)
+    # Startup: create the shared Redis client/pool up front rather than on the first request
+    await get_redis()
+    await preload_script()
     yield
     # Shutdown: close connections
-    pass
+    await close_redis()
 
 
 app = FastAPI(
@@ -32,16 +36,17 @@ app = FastAPI(
     redoc_url="/api/v1/redoc",
     openapi_url="/api/v1/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
-# app.add_middleware(RateLimitMiddleware)
+# Added first so it sits inside JWTAuthMiddleware and can key on the resolved caller
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(JWTAuthMiddleware)
+# Added last so it is outermost: preflight OPTIONS requests are answered here and never
+# reach auth or rate limiting.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-    ],
-    allow_origin_regex=r"https://.*\.vercel\.app",
+    allow_origins=settings.CORS_ORIGINS,
+    allow_origin_regex=settings.CORS_ALLOW_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
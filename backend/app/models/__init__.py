@@ -5,7 +5,7 @@ from app.models.location import Location, TransferOrder, TransferOrderLine, Tran
 from app.models.purchase_order import POStatus, PurchaseOrder, PurchaseOrderLine
 from app.models.rbac import APIKey, AuditLog, InvitationToken
 from app.models.tenant import Tenant, User, UserRole
-from app.models.warehouse import StockEventType, StockLedger, Warehouse
+from app.models.warehouse import StockEventType, StockLedger, StockOnHand, Warehouse
 from app.models.sales_order import SalesOrder, SalesOrderLine
 from app.models.workflow import Workflow, WorkflowAction, WorkflowExecution, TriggerType, ActionType, ExecutionStatus
 from app.models.webhook import Webhook, WebhookDelivery
@@ -15,7 +15,7 @@ from app.models.serial import SerialNumber, SerialStatus
 __all__ = [
     "Tenant", "User", "UserRole",
     "ItemType", "SKU",
-    "Warehouse", "StockLedger", "StockEventType",
+    "Warehouse", "StockLedger", "StockOnHand", "StockEventType",
     "Location", "TransferOrder", "TransferOrderLine", "TransferStatus",
     "InvitationToken", "APIKey", "AuditLog",
     "BOM", "BOMLine",
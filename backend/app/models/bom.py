@@ -1,39 +1,42 @@
 """NEXUS IMS — BOM and BOMLine models (Block 5)."""
 import uuid
-from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin
 
 
-class BOM(Base):
+class BOM(TenantMixin, CreatedAtMixin, Base):
     """Bill of Materials — defines the component recipe for a finished SKU."""
 
     __tablename__ = "boms"
+    __table_args__ = (
+        Index("ix_boms_tenant_finished_sku", "tenant_id", "finished_sku_id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     finished_sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="CASCADE"))
     version: Mapped[int] = mapped_column(default=1)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     landed_cost: Mapped[Decimal] = mapped_column(Numeric(12, 4), default=0)
     landed_cost_description: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
-    lines: Mapped[list["BOMLine"]] = relationship("BOMLine", back_populates="bom", cascade="all, delete-orphan", lazy="selectin")
+    lines: Mapped[list["BOMLine"]] = relationship("BOMLine", back_populates="bom", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True)
 
 
 class BOMLine(Base):
     """A single component line within a BOM."""
 
     __tablename__ = "bom_lines"
+    __table_args__ = (
+        Index("ix_bom_lines_bom_id", "bom_id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     bom_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("boms.id", ondelete="CASCADE"))
     component_sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"))
     quantity: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
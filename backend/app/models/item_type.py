@@ -1,48 +1,58 @@
 """NEXUS IMS — ItemType and SKU models (Block 1)."""
 import uuid
-from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, Computed, ForeignKey, Index, Numeric, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, TimestampMixin
 
 
-class ItemType(Base):
+class ItemType(TenantMixin, TimestampMixin, Base):
     """Polymorphic item type with JSONB attribute schema."""
 
     __tablename__ = "item_types"
+    __table_args__ = (
+        Index("ix_item_types_tenant_code", "tenant_id", "code"),
+        Index("ix_item_types_tenant_live", "tenant_id", "code", postgresql_where=text("is_archived = false")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str] = mapped_column(String(100), nullable=False)
     attribute_schema: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
     version: Mapped[int] = mapped_column(default=1)
     is_archived: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
     skus: Mapped[list["SKU"]] = relationship("SKU", back_populates="item_type")
 
 
-class SKU(Base):
+class SKU(TenantMixin, TimestampMixin, Base):
     """SKU with polymorphic attributes validated against item_type.attribute_schema."""
 
     __tablename__ = "skus"
-
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    __table_args__ = (
+        Index("ix_skus_tenant_code", "tenant_id", "sku_code"),
+        Index("ix_skus_tenant_live", "tenant_id", "sku_code", postgresql_where=text("is_archived = false")),
+        Index("ix_skus_item_type_id", "item_type_id"),
+        # jsonb_path_ops: serves attributes @> {...} only, at about half the size of jsonb_ops
+        Index("ix_skus_attributes_gin", "attributes", postgresql_using="gin", postgresql_ops={"attributes": "jsonb_path_ops"}),
+        Index("ix_skus_tenant_expiry", "tenant_id", "attr_expiry_date", postgresql_where=text("attr_expiry_date IS NOT NULL")),
+        # Rows are updated in place; 20% free space per page keeps new versions on-page (HOT)
+        {"postgresql_with": {"fillfactor": 80}},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     sku_code: Mapped[str] = mapped_column(String(100), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     item_type_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("item_types.id", ondelete="RESTRICT"))
     attributes: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    # Hot attribute key lifted into a plain column so range filters use a B-tree; ISO dates
+    # sort correctly as text (a ::date cast is not immutable, so it can't be generated)
+    attr_expiry_date: Mapped[str | None] = mapped_column(String, Computed("attributes->>'expiry_date'", persisted=True))
     reorder_point: Mapped[Decimal | None] = mapped_column(Numeric(18, 4), nullable=True)
     unit_cost: Mapped[Decimal | None] = mapped_column(Numeric(18, 4), nullable=True)
     is_archived: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
     item_type: Mapped["ItemType"] = relationship("ItemType", back_populates="skus")
@@ -4,11 +4,12 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, FetchedValue, ForeignKey, Index, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin, TimestampMixin
+from app.db.types import Ltree, enum_check
 
 
 class LocationType(str, Enum):
@@ -24,21 +25,27 @@ class TransferStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
-class Location(Base):
+class Location(TenantMixin, TimestampMixin, Base):
     """Location with zone > aisle > bin hierarchy."""
 
     __tablename__ = "locations"
+    __table_args__ = (
+        Index("ix_locations_tenant_warehouse_code", "tenant_id", "warehouse_id", "code"),
+        Index("ix_locations_parent_id", "parent_id"),
+        Index("ix_locations_path_gist", "path", postgresql_using="gist"),
+        enum_check("location_type", LocationType, "ck_locations_location_type"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="CASCADE"))
     parent_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("locations.id", ondelete="SET NULL"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str] = mapped_column(String(100), nullable=False)
     location_type: Mapped[str] = mapped_column(String(20), nullable=False)  # ZONE|AISLE|BIN
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    # Materialized root-to-self path of hyphen-less ids, kept by the trg_locations_path
+    # triggers so subtree and ancestor lookups are one GiST index scan
+    path: Mapped[str] = mapped_column(Ltree, server_default=FetchedValue(), server_onupdate=FetchedValue())
 
     parent: Mapped["Location | None"] = relationship(
         "Location", remote_side="Location.id", back_populates="children"
@@ -46,33 +53,38 @@ class Location(Base):
     children: Mapped[list["Location"]] = relationship("Location", back_populates="parent")
 
 
-class TransferOrder(Base):
+class TransferOrder(TenantMixin, CreatedAtMixin, Base):
     """Transfer order between warehouses."""
 
     __tablename__ = "transfer_orders"
+    __table_args__ = (
+        Index("ix_transfer_orders_tenant_created", "tenant_id", "created_at"),
+        Index("ix_transfer_orders_tenant_status", "tenant_id", "status"),
+        enum_check("status", TransferStatus, "ck_transfer_orders_status"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     from_warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"))
     to_warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"))
     status: Mapped[str] = mapped_column(String(20), default=TransferStatus.PENDING.value)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
     received_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    lines: Mapped[list["TransferOrderLine"]] = relationship("TransferOrderLine", back_populates="transfer_order")
+    lines: Mapped[list["TransferOrderLine"]] = relationship("TransferOrderLine", back_populates="transfer_order", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True)
 
 
-class TransferOrderLine(Base):
+class TransferOrderLine(CreatedAtMixin, Base):
     """Line item in transfer order."""
 
     __tablename__ = "transfer_order_lines"
+    __table_args__ = (
+        Index("ix_transfer_order_lines_transfer_order_id", "transfer_order_id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     transfer_order_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("transfer_orders.id", ondelete="CASCADE"))
     sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"))
     quantity_requested: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False)
     quantity_received: Mapped[Decimal | None] = mapped_column(Numeric(18, 4), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
     transfer_order: Mapped["TransferOrder"] = relationship("TransferOrder", back_populates="lines")
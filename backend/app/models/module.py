@@ -3,11 +3,12 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin
+from app.db.types import enum_check
 
 
 class ModuleExtensionType(str, Enum):
@@ -15,49 +16,48 @@ class ModuleExtensionType(str, Enum):
     ACTION = "ACTION"
 
 
-class ModuleInstall(Base):
+class ModuleInstall(TenantMixin, Base):
     """Tracks which modules are installed in which tenant."""
     
     __tablename__ = "module_installs"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     module_slug: Mapped[str] = mapped_column(String(255), nullable=False)
     version: Mapped[str] = mapped_column(String(50), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     permissions_granted: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
-    installed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    installed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Ensure one active installation of a module slug per tenant
     __table_args__ = (
-        {"schema": "public"}
+        Index("ix_module_installs_tenant_slug_active", "tenant_id", "module_slug", postgresql_where=text("is_active = true")),
+        {"schema": "public"},
     )
 
 
-class ModuleAttributeType(Base):
+class ModuleAttributeType(TenantMixin, CreatedAtMixin, Base):
     """Registers new polymorphic attribute types provided by a module."""
     
     __tablename__ = "module_attribute_types"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     module_slug: Mapped[str] = mapped_column(String(255), nullable=False)
     item_type_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("item_types.id", ondelete="CASCADE"), nullable=True) # Nullable if global attribute
     key: Mapped[str] = mapped_column(String(100), nullable=False)
     schema_def: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
 
-class ModuleWorkflowExtension(Base):
+class ModuleWorkflowExtension(TenantMixin, CreatedAtMixin, Base):
     """Registers new triggers and actions for the workflow engine provided by a module."""
     
     __tablename__ = "module_workflow_extensions"
+    __table_args__ = (
+        enum_check("extension_type", ModuleExtensionType, "ck_module_workflow_extensions_type"),
+    )
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     module_slug: Mapped[str] = mapped_column(String(255), nullable=False)
     extension_type: Mapped[str] = mapped_column(String(50), nullable=False) # TRIGGER or ACTION
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     schema_def: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
@@ -1,14 +1,14 @@
 """NEXUS IMS — PurchaseOrder and PurchaseOrderLine models (Block 5)."""
 import uuid
-from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import ForeignKey, Index, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin, TimestampMixin
+from app.db.types import enum_check
 
 
 class POStatus(str, Enum):
@@ -19,35 +19,41 @@ class POStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
-class PurchaseOrder(Base):
+class PurchaseOrder(TenantMixin, TimestampMixin, Base):
     """Purchase Order — represents an inbound procurement from a supplier."""
 
     __tablename__ = "purchase_orders"
-
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    __table_args__ = (
+        Index("ix_purchase_orders_tenant_created", "tenant_id", "created_at"),
+        Index("ix_purchase_orders_tenant_status", "tenant_id", "status"),
+        enum_check("status", POStatus, "ck_purchase_orders_status"),
+        # Rows are updated in place; 20% free space per page keeps new versions on-page (HOT)
+        {"postgresql_with": {"fillfactor": 80}},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     supplier_name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default=POStatus.DRAFT.value)
     warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"))
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
-    lines: Mapped[list["PurchaseOrderLine"]] = relationship("PurchaseOrderLine", back_populates="purchase_order", cascade="all, delete-orphan", lazy="selectin")
+    lines: Mapped[list["PurchaseOrderLine"]] = relationship("PurchaseOrderLine", back_populates="purchase_order", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True)
 
 
-class PurchaseOrderLine(Base):
+class PurchaseOrderLine(CreatedAtMixin, Base):
     """A single line item on a Purchase Order."""
 
     __tablename__ = "purchase_order_lines"
+    __table_args__ = (
+        Index("ix_purchase_order_lines_po_id", "po_id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     po_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("purchase_orders.id", ondelete="CASCADE"))
     sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"))
     quantity_ordered: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
     quantity_received: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False, default=Decimal("0"))
     unit_cost: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
     purchase_order: Mapped["PurchaseOrder"] = relationship("PurchaseOrder", back_populates="lines")
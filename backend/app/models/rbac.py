@@ -3,33 +3,47 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid_extensions import uuid7
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin
+from app.db.types import enum_check
+from app.models.tenant import UserRoleEnum
 
 
-class InvitationToken(Base):
+class InvitationToken(TenantMixin, CreatedAtMixin, Base):
     __tablename__ = "invitation_tokens"
+    __table_args__ = (
+        Index("ix_invitation_tokens_tenant_email", "tenant_id", "email"),
+        enum_check("role", UserRoleEnum, "ck_invitation_tokens_role"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), nullable=False)
     warehouse_scope: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
-    token_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False, unique=True)  # raw SHA-256
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     accepted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
 
-class APIKey(Base):
+class APIKey(TenantMixin, CreatedAtMixin, Base):
     __tablename__ = "api_keys"
+    __table_args__ = (
+        Index("ix_api_keys_tenant_active", "tenant_id", "created_at", postgresql_where=text("is_active = true")),
+        # Auth hot path: prefix lookup answered by an index-only scan (see authenticate_by_api_key)
+        Index(
+            "ix_api_keys_prefix_active_covering",
+            "key_prefix",
+            postgresql_where=text("is_active = true"),
+            postgresql_include=["key_hash", "id", "tenant_id", "created_by"],
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     key_prefix: Mapped[str] = mapped_column(String(12), nullable=False)
     key_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
@@ -37,17 +51,25 @@ class APIKey(Base):
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
 
-class AuditLog(Base):
+class AuditLog(TenantMixin, Base):
     __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_tenant_created", "tenant_id", "created_at"),
+        # Rows arrive in created_at order, so per-range min/max is tight and the index tiny
+        Index("ix_audit_log_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Monthly partitions, pre-created by app.tasks.partition_tasks
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    # Time-ordered UUIDv7 so appends land on the right edge of the PK index (Postgres 16 has
+    # no native uuidv7(); the server default only covers raw SQL inserts)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     actor_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     action: Mapped[str] = mapped_column(String(100), nullable=False)
     target_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
     target_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     payload: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    # Part of the PK because the table is partitioned on it
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
@@ -1,40 +1,48 @@
 """NEXUS IMS — Sales Order models (Block 8)."""
 import uuid
-from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import ForeignKey, Index, Numeric, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, TimestampMixin
 
+if TYPE_CHECKING:
+    from app.models.item_type import SKU
 
-class SalesOrder(Base):
+
+class SalesOrder(TenantMixin, TimestampMixin, Base):
     """Outbound customer order."""
 
     __tablename__ = "sales_orders"
+    __table_args__ = (
+        Index("ix_sales_orders_tenant_status", "tenant_id", "status"),
+        # Rows are updated in place; 20% free space per page keeps new versions on-page (HOT)
+        {"postgresql_with": {"fillfactor": 80}},
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     customer_name: Mapped[str] = mapped_column(String(255), nullable=False)
     order_reference: Mapped[str | None] = mapped_column(String(100), nullable=True)
     status: Mapped[str] = mapped_column(String(50), default="PENDING")  # PENDING, PROCESSING, SHIPPED, CANCELLED
     shipping_address: Mapped[str | None] = mapped_column(Text, nullable=True)
     
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
-    lines: Mapped[list["SalesOrderLine"]] = relationship("SalesOrderLine", back_populates="order", cascade="all, delete-orphan")
+    lines: Mapped[list["SalesOrderLine"]] = relationship("SalesOrderLine", back_populates="order", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True)
 
 
 class SalesOrderLine(Base):
     """Line item for a SalesOrder."""
 
     __tablename__ = "sales_order_lines"
+    __table_args__ = (
+        Index("ix_sales_order_lines_sales_order_id", "sales_order_id"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     sales_order_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("sales_orders.id", ondelete="CASCADE"))
     sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"))
     
@@ -43,3 +51,5 @@ class SalesOrderLine(Base):
     fulfilled_qty: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False, default=0)
 
     order: Mapped["SalesOrder"] = relationship("SalesOrder", back_populates="lines")
+    # Not loaded unless a query asks for it (GET /sales-orders?expand=sku)
+    sku: Mapped["SKU"] = relationship("SKU", lazy="noload")
@@ -1,13 +1,14 @@
 """NEXUS IMS — Serial Number model (Phase 3B)."""
 import uuid
-from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from uuid_extensions import uuid7
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, TimestampMixin
+from app.db.types import enum_check
 
 
 class SerialStatus(str, Enum):
@@ -18,17 +19,29 @@ class SerialStatus(str, Enum):
     WRITE_OFF = "WRITE_OFF"
 
 
-class SerialNumber(Base):
+SERIAL_UNIQUE_CONSTRAINT = "uq_serial_numbers_tenant_serial_sku"
+
+
+class SerialNumber(TenantMixin, TimestampMixin, Base):
     """Tracks unique seralized items."""
     __tablename__ = "serial_numbers"
+    __table_args__ = (
+        # serial_number leads after tenant so scans look a code up without knowing the SKU;
+        # sku_id keeps the existing per-SKU uniqueness rule
+        UniqueConstraint("tenant_id", "serial_number", "sku_id", name=SERIAL_UNIQUE_CONSTRAINT),
+        Index("ix_serial_numbers_tenant_sku_status", "tenant_id", "sku_id", "status"),
+        Index("ix_serial_numbers_tenant_status", "tenant_id", "status"),
+        enum_check("status", SerialStatus, "ck_serial_numbers_status"),
+        # Rows are updated in place; 20% free space per page keeps new versions on-page (HOT)
+        {"postgresql_with": {"fillfactor": 80}},
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    # Time-ordered UUIDv7 so appends land on the right edge of the PK index (Postgres 16 has
+    # no native uuidv7(); the server default only covers raw SQL inserts)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"), nullable=False)
     warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"), nullable=False)
     
     serial_number: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default=SerialStatus.IN_STOCK.value)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
@@ -4,11 +4,13 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
+from uuid_extensions import uuid7
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, TimestampMixin
+from app.db.types import MinorUnits
 
 
 class StockEventType(str, Enum):
@@ -27,36 +29,72 @@ class StockEventType(str, Enum):
     RESERVE_IN = "RESERVE_IN"
 
 
-class Warehouse(Base):
+class Warehouse(TenantMixin, TimestampMixin, Base):
     """Warehouse (Block 3 expands with locations)."""
 
     __tablename__ = "warehouses"
+    __table_args__ = (
+        Index("ix_warehouses_tenant_code", "tenant_id", "code"),
+        Index("ix_warehouses_tenant_active", "tenant_id", "code", postgresql_where=text("is_active = true")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str] = mapped_column(String(100), nullable=False)
     address: Mapped[str | None] = mapped_column(Text, nullable=True)
     timezone: Mapped[str] = mapped_column(String(50), default="UTC")
     is_active: Mapped[bool] = mapped_column(default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
 
-class StockLedger(Base):
+class StockLedger(TenantMixin, Base):
     """Append-only stock ledger. No UPDATE or DELETE."""
 
     __tablename__ = "stock_ledger"
+    __table_args__ = (
+        Index("ix_stock_ledger_tenant_sku_warehouse", "tenant_id", "sku_id", "warehouse_id"),
+        Index("ix_stock_ledger_tenant_created", "tenant_id", "created_at", "id"),
+        Index("ix_stock_ledger_reference_id", "reference_id"),
+        # Rows arrive in created_at order, so per-range min/max is tight and the index tiny
+        Index("ix_stock_ledger_created_brin", "created_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Monthly partitions, pre-created by app.tasks.partition_tasks
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    # Time-ordered UUIDv7 so appends land on the right edge of the PK index (Postgres 16 has
+    # no native uuidv7(); the server default only covers raw SQL inserts)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("gen_random_uuid()"))
     sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"))
     warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"))
     location_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("locations.id", ondelete="SET NULL"), nullable=True)
     event_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    quantity_delta: Mapped[Decimal] = mapped_column(Numeric(18, 4), nullable=False)
+    quantity_delta: Mapped[Decimal] = mapped_column(MinorUnits, nullable=False)
     reference_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     actor_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
     reason_code: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    # Part of the PK because the table is partitioned on it
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+
+    # Transient, not a column: stock balance right after this event, set by LedgerService.post_event
+    balance_after = None
+
+
+class StockOnHand(Base):
+    """
+    Current balance per (tenant, SKU, warehouse): the running SUM of stock_ledger, kept by
+    the trg_stock_on_hand trigger on every ledger insert. The ledger stays authoritative.
+    """
+
+    __tablename__ = "stock_on_hand"
+    __table_args__ = (
+        Index("ix_stock_on_hand_tenant_warehouse", "tenant_id", "warehouse_id"),
+        # Every ledger insert rewrites a row and quantity is unindexed, so updates are HOT
+        # as long as the page has room
+        {"postgresql_with": {"fillfactor": 70}},
+    )
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    sku_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("skus.id", ondelete="RESTRICT"), primary_key=True)
+    warehouse_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("warehouses.id", ondelete="RESTRICT"), primary_key=True)
+    quantity: Mapped[Decimal] = mapped_column(MinorUnits, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
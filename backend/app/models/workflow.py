@@ -3,11 +3,11 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum as SAEnum, FetchedValue, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, TenantMixin, CreatedAtMixin, TimestampMixin
 
 
 class TriggerType(str, Enum):
@@ -27,6 +27,10 @@ class ActionType(str, Enum):
     NOTIFY_USER = "NOTIFY_USER"
 
 
+# Upper bound on stored execution error text; longer messages are truncated by the task
+ERROR_MESSAGE_MAX_LEN = 16384
+
+
 class ExecutionStatus(str, Enum):
     PENDING = "PENDING"
     RUNNING = "RUNNING"
@@ -35,48 +39,87 @@ class ExecutionStatus(str, Enum):
     SKIPPED = "SKIPPED"
 
 
-class Workflow(Base):
+class Workflow(TenantMixin, TimestampMixin, Base):
     __tablename__ = "workflows"
-
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    tenant_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"))
+    __table_args__ = (
+        # WorkflowEngine.evaluate: tenant + trigger among active workflows, on every ledger event
+        Index("ix_workflows_dispatch", "tenant_id", "trigger_type", postgresql_where=text("is_active = true")),
+        # "workflows using action_type X": actions_json @> [{"action_type": X}]
+        Index(
+            "ix_workflows_actions_gin",
+            "actions_json",
+            postgresql_using="gin",
+            postgresql_ops={"actions_json": "jsonb_path_ops"},
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     trigger_type: Mapped[str] = mapped_column(String(50), nullable=False)
     trigger_config: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
-    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    # Ordered copy of the actions ({id, sequence_order, action_type, action_config}) kept by the
+    # trg_workflow_actions_json trigger so execution reads one row; never written by the ORM
+    actions_json: Mapped[list[dict]] = mapped_column(JSONB, nullable=False, server_default=text("'[]'::jsonb"), server_onupdate=FetchedValue())
 
-    actions: Mapped[list["WorkflowAction"]] = relationship("WorkflowAction", back_populates="workflow", cascade="all, delete-orphan", order_by="WorkflowAction.sequence_order")
-    executions: Mapped[list["WorkflowExecution"]] = relationship("WorkflowExecution", back_populates="workflow", cascade="all, delete-orphan")
+    actions: Mapped[list["WorkflowAction"]] = relationship("WorkflowAction", back_populates="workflow", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True, order_by="WorkflowAction.sequence_order")
+    # Unbounded history: never eager-loaded; query WorkflowExecution directly instead
+    executions: Mapped[list["WorkflowExecution"]] = relationship("WorkflowExecution", back_populates="workflow", cascade="all, delete-orphan", passive_deletes=True)
 
 
-class WorkflowAction(Base):
+class WorkflowAction(CreatedAtMixin, Base):
     __tablename__ = "workflow_actions"
+    __table_args__ = (
+        # Workflow.actions selectin and the actions_json trigger filter on workflow_id and
+        # order by sequence_order
+        Index("ix_workflow_actions_workflow_seq", "workflow_id", "sequence_order"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     workflow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workflows.id", ondelete="CASCADE"))
     sequence_order: Mapped[int] = mapped_column(Integer, nullable=False)
     action_type: Mapped[str] = mapped_column(String(50), nullable=False)
     action_config: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
 
     workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="actions")
 
 
 class WorkflowExecution(Base):
     __tablename__ = "workflow_executions"
-
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # jsonb_path_ops: serves trigger_payload @> {...} only, at about half the size of jsonb_ops
+        Index(
+            "ix_workflow_executions_payload_gin",
+            "trigger_payload",
+            postgresql_using="gin",
+            postgresql_ops={"trigger_payload": "jsonb_path_ops"},
+        ),
+        # Per-workflow history page: WHERE workflow_id = ? ORDER BY started_at DESC LIMIT n
+        Index("ix_workflow_executions_workflow_started", "workflow_id", "started_at"),
+        # Rows arrive in started_at order, so per-range min/max is tight and the index tiny
+        Index("ix_workflow_executions_started_brin", "started_at", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        CheckConstraint(
+            f"length(error_message) <= {ERROR_MESSAGE_MAX_LEN}",
+            name="ck_workflow_executions_error_message_length",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     workflow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workflows.id", ondelete="CASCADE"))
     trigger_event_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default=ExecutionStatus.PENDING.value)
+    # Native enum: a closed, system-written set on the largest workflow table. trigger_type and
+    # action_type stay strings because ledger event types and module extensions add values.
+    status: Mapped[ExecutionStatus] = mapped_column(
+        SAEnum(ExecutionStatus, name="workflow_execution_status", native_enum=True),
+        nullable=False,
+        default=ExecutionStatus.PENDING,
+    )
     trigger_payload: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     conditions_result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     actions_results: Mapped[list | None] = mapped_column(JSONB, nullable=True)
-    error_message: Mapped[str | None] = mapped_column(String, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default="now()")
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     workflow: Mapped["Workflow"] = relationship("Workflow", back_populates="executions")
@@ -1,4 +1,5 @@
 """NEXUS IMS — Expiry Tracker Module (Phase 3B)."""
+import functools
 import logging
 
 from app.sdk.module import BaseModule, NexusContext
@@ -17,7 +18,9 @@ class ExpiryTrackerModule(BaseModule):
     """
     
     @classmethod
+    @functools.cache
     def get_manifest(cls) -> ModuleManifest:
+        """Built once per class; the manifest is static, so every caller shares one instance."""
         return ModuleManifest(
             name="Expiry Date Tracker",
             slug="expiry-tracker",
@@ -47,11 +50,9 @@ class ExpiryTrackerModule(BaseModule):
     @classmethod
     async def on_install(cls, ctx: NexusContext) -> None:
         """Called when module is installed for a tenant."""
-        logger.info(f"ExpiryTrackerModule installed for tenant {ctx.tenant_id}")
-        pass
+        logger.info("ExpiryTrackerModule installed for tenant %s", ctx.tenant_id)
 
     @classmethod
     async def on_uninstall(cls, ctx: NexusContext) -> None:
         """Called when module is uninstalled."""
-        logger.info(f"ExpiryTrackerModule uninstalled for tenant {ctx.tenant_id}")
-        pass
+        logger.info("ExpiryTrackerModule uninstalled for tenant %s", ctx.tenant_id)
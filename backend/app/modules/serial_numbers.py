@@ -1,5 +1,6 @@
 """NEXUS IMS — Serial Numbers Module (Phase 3B)."""
 import uuid
+import functools
 import logging
 
 from app.sdk.module import BaseModule, NexusContext
@@ -20,7 +21,9 @@ class SerialNumbersModule(BaseModule):
     """
     
     @classmethod
+    @functools.cache
     def get_manifest(cls) -> ModuleManifest:
+        """Built once per class; the manifest is static, so every caller shares one instance."""
         return ModuleManifest(
             name="Unit Serialization Tracking",
             slug="serial-numbers",
@@ -55,12 +58,10 @@ class SerialNumbersModule(BaseModule):
     @classmethod
     async def on_install(cls, ctx: NexusContext) -> None:
         """Called when module is installed for a tenant."""
-        logger.info(f"SerialNumbersModule installed for tenant {ctx.tenant_id}")
-        pass
+        logger.info("SerialNumbersModule installed for tenant %s", ctx.tenant_id)
 
     @classmethod
     async def on_uninstall(cls, ctx: NexusContext) -> None:
         """Called when module is uninstalled."""
-        logger.info(f"SerialNumbersModule uninstalled for tenant {ctx.tenant_id}")
+        logger.info("SerialNumbersModule uninstalled for tenant %s", ctx.tenant_id)
         # Could delete all serial_numbers for this tenant here, but we will preserve data.
-        pass
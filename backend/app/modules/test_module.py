@@ -26,12 +26,14 @@ manifest = ModuleManifest(
 )
 
 class TestExpiryModule(BaseModule):
-    
+
+    REQUIRED_PERMISSIONS = frozenset({"ledger:write", "sku:read"})
+
     @classmethod
     async def on_install(cls, ctx: NexusContext) -> None:
         # Verify context is loaded
         assert ctx.module_slug == "test-expiry"
-        assert "ledger:write" in ctx.permissions
+        await super().on_install(ctx)
         
     @classmethod
     async def on_uninstall(cls, ctx: NexusContext) -> None:
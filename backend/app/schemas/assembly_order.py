@@ -4,16 +4,18 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import Numeric12
+
 
 class AssemblyOrderCreate(BaseModel):
     bom_id: UUID
     warehouse_id: UUID
-    planned_qty: Decimal = Field(..., gt=0, description="Planned production quantity")
+    planned_qty: Numeric12 = Field(..., gt=0, description="Planned production quantity")
 
 
 class AssemblyOrderComplete(BaseModel):
-    produced_qty: Decimal = Field(..., ge=0, description="Actual produced quantity")
-    waste_qty: Decimal = Field(Decimal("0"), ge=0, description="Quantity wasted during production")
+    produced_qty: Numeric12 = Field(..., ge=0, description="Actual produced quantity")
+    waste_qty: Numeric12 = Field(Decimal("0"), ge=0, description="Quantity wasted during production")
     waste_reason: str | None = Field(None, max_length=1000)
 
 
@@ -32,5 +34,4 @@ class AssemblyOrderResponse(BaseModel):
     started_at: str
     completed_at: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
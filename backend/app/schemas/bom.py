@@ -4,16 +4,18 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import Numeric12
+
 
 class BOMLineCreate(BaseModel):
     component_sku_id: UUID
-    quantity: Decimal = Field(..., gt=0, description="Quantity of component per finished unit")
+    quantity: Numeric12 = Field(..., gt=0, description="Quantity of component per finished unit")
     unit: str | None = Field(None, max_length=50)
 
 
 class BOMCreate(BaseModel):
     finished_sku_id: UUID
-    landed_cost: Decimal = Field(Decimal("0"), ge=0, description="Fixed overhead cost for BOM")
+    landed_cost: Numeric12 = Field(Decimal("0"), ge=0, description="Fixed overhead cost for BOM")
     landed_cost_description: str | None = Field(None, max_length=255)
     lines: list[BOMLineCreate] = Field(..., min_length=1)
 
@@ -24,8 +26,7 @@ class BOMLineResponse(BaseModel):
     quantity: Decimal
     unit: str | None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class BOMResponse(BaseModel):
@@ -38,10 +39,15 @@ class BOMResponse(BaseModel):
     lines: list[BOMLineResponse]
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+
+class ComponentShortage(BaseModel):
+    required: Decimal
+    available: Decimal
+    shortage: Decimal
 
 
 class BOMAvailabilityResponse(BaseModel):
     is_available: bool
-    shortages: dict[UUID, dict] # component_sku_id -> {required, available, shortage}
+    shortages: dict[UUID, ComponentShortage]  # keyed by component_sku_id
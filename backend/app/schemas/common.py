@@ -1,10 +1,19 @@
 """NEXUS IMS — Common response envelope (Block 1.3)."""
-from typing import Any, Generic, TypeVar
+from decimal import Decimal
+from typing import Annotated, Any, Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PlainSerializer
 
 T = TypeVar("T")
 
+# Request-side decimals bounded to their NUMERIC(p, 4) column: out-of-range or over-precise
+# values are rejected by pydantic-core's decimal validator with a 422, not at INSERT.
+Numeric12 = Annotated[Decimal, Field(max_digits=12, decimal_places=4)]
+Numeric18 = Annotated[Decimal, Field(max_digits=18, decimal_places=4)]
+
+# Response-side quantity: Decimal in Python, a JSON number on the wire (clients type it as number)
+JsonNumber = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
 
 class Meta(BaseModel):
     """Pagination and metadata."""
@@ -1,5 +1,7 @@
 """NEXUS IMS — Location and Transfer schemas (Block 3)."""
+from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -9,7 +11,7 @@ class LocationCreate(BaseModel):
     warehouse_id: UUID
     name: str
     code: str
-    location_type: str  # ZONE | AISLE | BIN
+    location_type: Literal["ZONE", "AISLE", "BIN"]
     parent_id: UUID | None = None
 
 
@@ -52,12 +54,12 @@ class TransferResponse(BaseModel):
     from_warehouse_id: UUID
     to_warehouse_id: UUID
     status: str
-    created_at: str | None
-    received_at: str | None
+    created_at: datetime | None
+    received_at: datetime | None
     lines: list[TransferLineResponse] = []
 
     model_config = {"from_attributes": True}
 
 
 class TransferReceiveRequest(BaseModel):
-    line_quantities: dict[str, float] | None = None  # line_id -> qty_received
+    line_quantities: dict[UUID, Decimal] | None = None  # line_id -> qty_received
@@ -0,0 +1,58 @@
+"""NEXUS IMS — msgspec request bodies for hot POST/PUT routes (Block 5)."""
+import re
+from decimal import Decimal
+from typing import Annotated, Literal
+from uuid import UUID
+
+import msgspec
+
+# Cheap shape check standing in for EmailStr; full deliverability checks are not needed here.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Mirrors the ck_users_role CHECK so bad roles fail at decode, not at INSERT
+Role = Literal["ADMIN", "MANAGER", "FLOOR_ASSOCIATE"]
+
+
+class InviteRequestMsg(msgspec.Struct):
+    email: str
+    role: Role
+    warehouse_scope: list[str] | None = None  # list of warehouse UUID strings
+
+    def __post_init__(self) -> None:
+        if not _EMAIL_RE.match(self.email):
+            raise ValueError("value is not a valid email address")
+
+
+class AcceptInvitationRequestMsg(msgspec.Struct):
+    token: str
+    password: str
+    full_name: str | None = None
+
+
+class UpdateRoleRequestMsg(msgspec.Struct):
+    role: Role
+    warehouse_scope: list[str] | None = None
+
+
+class TransferLineCreateMsg(msgspec.Struct):
+    sku_id: UUID
+    quantity_requested: Decimal  # accepts JSON numbers and numeric strings
+
+
+class TransferCreateMsg(msgspec.Struct):
+    from_warehouse_id: UUID
+    to_warehouse_id: UUID
+    lines: list[TransferLineCreateMsg]
+
+
+class LedgerImportLineMsg(msgspec.Struct):
+    sku_id: UUID
+    warehouse_id: UUID
+    quantity_delta: Decimal
+    location_id: UUID | None = None
+    notes: str | None = None
+
+
+class LedgerImportMsg(msgspec.Struct):
+    reason_code: str  # applied to every event, e.g. CYCLE_COUNT for an inventory sync
+    events: Annotated[list[LedgerImportLineMsg], msgspec.Meta(min_length=1, max_length=5000)]
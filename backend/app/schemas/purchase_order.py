@@ -4,11 +4,13 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import Numeric12
+
 
 class POLineCreate(BaseModel):
     sku_id: UUID
-    quantity_ordered: Decimal = Field(..., gt=0)
-    unit_cost: Decimal = Field(..., ge=0)
+    quantity_ordered: Numeric12 = Field(..., gt=0)
+    unit_cost: Numeric12 = Field(..., ge=0)
 
 
 class POCreate(BaseModel):
@@ -20,7 +22,7 @@ class POCreate(BaseModel):
 
 class POReceiveLine(BaseModel):
     po_line_id: UUID
-    quantity_received: Decimal = Field(..., gt=0)
+    quantity_received: Numeric12 = Field(..., gt=0)
 
 
 class POReceiveRequest(BaseModel):
@@ -34,8 +36,7 @@ class POLineResponse(BaseModel):
     quantity_received: Decimal
     unit_cost: Decimal
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class POResponse(BaseModel):
@@ -47,5 +48,4 @@ class POResponse(BaseModel):
     lines: list[POLineResponse]
     created_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
@@ -6,27 +6,30 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.common import Numeric18
 from app.schemas.sku import SKUResponse
 
 # --- Lines ---
 
 class SalesOrderLineCreate(BaseModel):
     sku_id: UUID
-    quantity: Decimal = Field(..., gt=0)
-    unit_price: Decimal = Field(default=0, ge=0)
+    quantity: Numeric18 = Field(..., gt=0)
+    unit_price: Numeric18 = Field(default=0, ge=0)
 
 
-class SalesOrderLineResponse(BaseModel):
+class SalesOrderLineResponseLite(BaseModel):
     id: UUID
     sales_order_id: UUID
     sku_id: UUID
     quantity: Decimal
     unit_price: Decimal
     fulfilled_qty: Decimal
-    sku: SKUResponse | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
+
+
+class SalesOrderLineResponseWithSKU(SalesOrderLineResponseLite):
+    sku: SKUResponse | None = None
 
 
 # --- Orders ---
@@ -35,10 +38,10 @@ class SalesOrderCreate(BaseModel):
     customer_name: str = Field(..., min_length=1, max_length=255)
     order_reference: str | None = Field(default=None, max_length=100)
     shipping_address: str | None = None
-    lines: list[SalesOrderLineCreate] = Field(..., min_items=1)
+    lines: list[SalesOrderLineCreate] = Field(..., min_length=1)
 
 
-class SalesOrderResponse(BaseModel):
+class _SalesOrderFields(BaseModel):
     id: UUID
     tenant_id: UUID
     customer_name: str
@@ -49,10 +52,16 @@ class SalesOrderResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    lines: list[SalesOrderLineResponse] = []
+    model_config = {"from_attributes": True}
+
+
+class SalesOrderResponseLite(_SalesOrderFields):
+    """List view: lines without the nested SKU."""
+    lines: list[SalesOrderLineResponseLite] = []
+
 
-    class Config:
-        from_attributes = True
+class SalesOrderResponse(_SalesOrderFields):
+    lines: list[SalesOrderLineResponseWithSKU] = []
 
 
 class SalesOrderAllocateRequest(BaseModel):
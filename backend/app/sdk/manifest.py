@@ -1,3 +1,5 @@
+import functools
+import os
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -5,19 +7,31 @@ from pydantic import BaseModel, ConfigDict, Field
 
 class ManifestPermission(BaseModel):
     """A permission required by the module."""
+
+    # Frozen: manifests are cached and shared, and hashable entries can go in sets
+    model_config = ConfigDict(frozen=True)
+
     resource: str = Field(..., description="The resource namespace, e.g., 'ledger', 'sku'")
     action: str = Field(..., description="The action required, e.g., 'read', 'write'")
     reason: str = Field(..., description="Human-readable reason for needing this permission.")
 
+    @property
+    def key(self) -> str:
+        """The granted-permission string, e.g. 'ledger:write'."""
+        return f"{self.resource}:{self.action}"
+
 
 class ManifestAttribute(BaseModel):
     """A polymorphic attribute schema definition to be injected into the system."""
+
+    model_config = ConfigDict(frozen=True)
+
     key: str = Field(..., description="The dictionary key for this attribute, e.g. 'expiry_date'")
     name: str = Field(..., description="Human-readable name.")
     type: str = Field(..., description="Type of the field: string, integer, date, boolean, etc.")
     required: bool = Field(default=False)
     description: str | None = None
-    target_item_type_codes: list[str] = Field(default_factory=list, description="Optional. Apply globally if empty.")
+    target_item_type_codes: tuple[str, ...] = Field(default=(), description="Optional. Apply globally if empty.")
 
 
 class ManifestEvent(BaseModel):
@@ -45,5 +59,15 @@ class ModuleManifest(BaseModel):
 
     @classmethod
     def from_file(cls, filepath: str) -> "ModuleManifest":
-        with open(filepath, "r", encoding="utf-8") as f:
-            return cls.model_validate_json(f.read())
+        """
+        Load and validate a manifest file. Cached per (path, mtime), so repeat loads of an
+        unchanged file return the same instance and an edited file is re-read.
+        """
+        return _load_manifest(os.path.abspath(filepath), os.stat(filepath).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_manifest(path: str, mtime_ns: int) -> ModuleManifest:
+    with open(path, "rb") as f:
+        # pydantic-core parses the bytes directly; no intermediate Python dict
+        return ModuleManifest.model_validate_json(f.read())
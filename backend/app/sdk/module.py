@@ -15,16 +15,18 @@ class NexusContext:
     Modules use this to interact with Nexus services safely.
     It enforces tenant isolation and module-specific permissions.
     """
-    
+
+    __slots__ = ("_db", "tenant_id", "module_slug", "permissions", "ledger", "skus")
+
     def __init__(self, db: AsyncSession, tenant_id: uuid.UUID, module_slug: str, permissions: list[str]):
         self._db = db
         self.tenant_id = tenant_id
         self.module_slug = module_slug
-        self.permissions = permissions
-        
+        # frozenset: require_permission runs before every facade call
+        self.permissions = frozenset(permissions)
+
         # Initialize restricted service facades (to be built out as needed)
         self.ledger = _LedgerFacade(self)
-        self.ledger = _LedgerFacade(self)
         self.skus = _SKUFacade(self)
 
     @property
@@ -32,6 +34,10 @@ class NexusContext:
         """Grants modules access to the underlying database session."""
         return self._db
 
+    def has_permission(self, permission: str) -> bool:
+        """Returns whether the module was granted the permission string."""
+        return permission in self.permissions
+
     def require_permission(self, permission: str):
         """Checks if the module has the required permission string (e.g., 'ledger:write')."""
         if permission not in self.permissions:
@@ -42,7 +48,9 @@ class NexusContext:
 
 class _LedgerFacade:
     """Restricted ledger methods for modules."""
-    
+
+    __slots__ = ("ctx",)
+
     def __init__(self, ctx: NexusContext):
         self.ctx = ctx
         
@@ -56,7 +64,9 @@ class _LedgerFacade:
 
 class _SKUFacade:
     """Restricted SKU methods for modules."""
-    
+
+    __slots__ = ("ctx",)
+
     def __init__(self, ctx: NexusContext):
         self.ctx = ctx
         
@@ -71,14 +81,22 @@ class BaseModule:
     Base class that all Nexus internal and external modules must extend.
     Provides lifecycle hooks and event handlers.
     """
-    
+
+    # Permissions the module cannot run without; checked by the default on_install
+    REQUIRED_PERMISSIONS: frozenset[str] = frozenset()
+
     @classmethod
     async def on_install(cls, ctx: NexusContext) -> None:
         """
         Called when the module is installed into a tenant.
         Use this to run migrations, set up default configurations, etc.
+        Overrides should call super() so REQUIRED_PERMISSIONS is enforced.
         """
-        pass
+        if not cls.REQUIRED_PERMISSIONS.issubset(ctx.permissions):
+            missing = ", ".join(sorted(cls.REQUIRED_PERMISSIONS - ctx.permissions))
+            raise PermissionDeniedError(
+                f"Module '{ctx.module_slug}' lacks the required permission: {missing}"
+            )
         
     @classmethod
     async def on_uninstall(cls, ctx: NexusContext) -> None:
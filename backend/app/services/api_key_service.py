@@ -1,13 +1,17 @@
 """NEXUS IMS — APIKeyService — Block 4."""
+import hashlib
 import logging
 import secrets
 from datetime import datetime, timezone
 from uuid import UUID
 
 import bcrypt
-from sqlalchemy import select
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.redis import API_KEY_CACHE_TTL, api_key_cache_key, api_key_index_key, get_redis
 from app.models.rbac import APIKey
 
 logger = logging.getLogger(__name__)
@@ -31,6 +35,10 @@ def _verify_key(raw_key: str, key_hash: str) -> bool:
         return False
 
 
+def _key_digest(raw_key: str) -> str:
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
 class APIKeyService:
     """API key creation, listing, revocation, and authentication."""
 
@@ -72,10 +80,9 @@ class APIKeyService:
 
     @staticmethod
     async def revoke_api_key(db: AsyncSession, key_id: UUID, tenant_id: UUID) -> APIKey | None:
-        result = await db.execute(
+        api_key = await db.scalar(
             select(APIKey).where(APIKey.id == key_id, APIKey.tenant_id == tenant_id)
         )
-        api_key = result.scalar_one_or_none()
         if not api_key:
             return None
         api_key.is_active = False
@@ -87,24 +94,73 @@ class APIKeyService:
     async def authenticate_by_api_key(
         db: AsyncSession,
         raw_key: str,
-    ) -> APIKey | None:
-        """Find active key matching raw_key. Updates last_used_at on hit."""
+    ) -> Row | None:
+        """
+        Find active key matching raw_key; returns its (id, tenant_id, created_by, key_hash).
+        Only columns carried by ix_api_keys_prefix_active_covering are selected so the lookup
+        is an index-only scan; last_used_at is bumped with a direct UPDATE on hit.
+        """
         if not raw_key or len(raw_key) < 12:
             return None
 
         prefix = raw_key[:_KEY_PREFIX_LEN + 4]
         result = await db.execute(
-            select(APIKey).where(
+            select(APIKey.id, APIKey.tenant_id, APIKey.created_by, APIKey.key_hash).where(
                 APIKey.key_prefix == prefix,
                 APIKey.is_active.is_(True),
             )
         )
-        candidates = list(result.scalars().all())
 
-        for api_key in candidates:
-            if _verify_key(raw_key, api_key.key_hash):
-                api_key.last_used_at = datetime.now(timezone.utc)
-                await db.flush()
-                return api_key
+        for candidate in result.all():
+            if _verify_key(raw_key, candidate.key_hash):
+                await db.execute(
+                    update(APIKey)
+                    .where(APIKey.id == candidate.id)
+                    .values(last_used_at=datetime.now(timezone.utc))
+                )
+                return candidate
 
         return None
+
+    # ── Identity cache (Redis) ────────────────────────────────────────────────
+    # A hit skips the DB lookup and bcrypt verify; last_used_at is then only bumped on
+    # misses, i.e. at most once per API_KEY_CACHE_TTL. Redis errors degrade to the DB path.
+
+    @staticmethod
+    async def get_cached_identity(raw_key: str) -> dict | None:
+        """{"id", "tenant_id", "created_by"} of a recently verified key, or None."""
+        try:
+            r = await get_redis()
+            cached = await r.get(api_key_cache_key(_key_digest(raw_key)))
+        except RedisError as exc:
+            logger.warning("API key cache read failed: %s", exc)
+            return None
+        return orjson.loads(cached) if cached is not None else None
+
+    @staticmethod
+    async def cache_identity(raw_key: str, api_key: Row) -> dict:
+        """Cache a verified key's identity (keyed by sha256, never the raw key) and return it."""
+        identity = {
+            "id": str(api_key.id),
+            "tenant_id": str(api_key.tenant_id),
+            "created_by": str(api_key.created_by) if api_key.created_by else None,
+        }
+        digest = _key_digest(raw_key)
+        try:
+            r = await get_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.setex(api_key_cache_key(digest), API_KEY_CACHE_TTL, orjson.dumps(identity))
+                pipe.setex(api_key_index_key(identity["id"]), API_KEY_CACHE_TTL, digest)
+                await pipe.execute()
+        except RedisError as exc:
+            logger.warning("API key cache write failed: %s", exc)
+        return identity
+
+    @staticmethod
+    async def invalidate_cached_identity(key_id: UUID) -> None:
+        """Drop a key's cached identity so revocation takes effect immediately."""
+        r = await get_redis()
+        index = api_key_index_key(str(key_id))
+        digest = await r.get(index)
+        if digest is not None:
+            await r.delete(api_key_cache_key(digest), index)
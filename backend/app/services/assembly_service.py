@@ -3,14 +3,14 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models.assembly import AssemblyOrder
 from app.models.bom import BOM, BOMLine
 from app.models.item_type import SKU
-from app.models.warehouse import StockLedger
+from app.models.warehouse import StockLedger, StockOnHand
 from app.services.ledger_service import LedgerService
 
 
@@ -64,19 +64,17 @@ class AssemblyService:
         db.add(bom)
         await db.flush()
 
-        # 5. Create lines
-        bom_lines = []
-        for line in lines:
-            bom_line = BOMLine(
-                bom_id=bom.id,
-                component_sku_id=uuid.UUID(str(line["component_sku_id"])),
-                quantity=Decimal(str(line["quantity"])),
-                unit=line.get("unit"),
-            )
-            db.add(bom_line)
-            bom_lines.append(bom_line)
-        
-        await db.flush()
+        # 5. Create lines in one multi-row INSERT
+        if lines:
+            await db.execute(insert(BOMLine), [
+                {
+                    "bom_id": bom.id,
+                    "component_sku_id": uuid.UUID(str(line["component_sku_id"])),
+                    "quantity": Decimal(str(line["quantity"])),
+                    "unit": line.get("unit"),
+                }
+                for line in lines
+            ])
         return bom
         
     @staticmethod
@@ -90,24 +88,36 @@ class AssemblyService:
         db: AsyncSession,
         tenant_id: uuid.UUID,
         bom_id: uuid.UUID,
-        planned_qty: Decimal
+        planned_qty: Decimal,
+        warehouse_id: uuid.UUID | None = None,
     ) -> dict[uuid.UUID, dict]:
         """
         Check if sufficient component stock exists for the planned quantity.
+        Stock is summed across the tenant unless warehouse_id limits it to one warehouse.
         Returns a dictionary of shortages. Empty dict means all good.
         """
         bom = await AssemblyService.get_bom(db, tenant_id, bom_id)
         if not bom:
             raise HTTPException(status_code=404, detail="BOM not found")
             
+        # Stock of every component in one grouped read of stock_on_hand
+        stmt = (
+            select(StockOnHand.sku_id, func.sum(StockOnHand.quantity))
+            .where(
+                StockOnHand.tenant_id == tenant_id,
+                StockOnHand.sku_id.in_({line.component_sku_id for line in bom.lines}),
+            )
+            .group_by(StockOnHand.sku_id)
+        )
+        if warehouse_id is not None:
+            stmt = stmt.where(StockOnHand.warehouse_id == warehouse_id)
+        result = await db.execute(stmt)
+        stock = dict(result.all())
+
         shortages = {}
         for line in bom.lines:
             required_qty = line.quantity * planned_qty
-            # Get total stock across all locations in tenant (or we could scope to warehouse)
-            # For simplicity, scope to tenant total availability first
-            current_stock = await LedgerService.get_stock_level(
-                db, tenant_id, line.component_sku_id, warehouse_id=None
-            )
+            current_stock = stock.get(line.component_sku_id) or Decimal("0")
             if current_stock < required_qty:
                 shortages[line.component_sku_id] = {
                     "required": required_qty,
@@ -129,8 +139,10 @@ class AssemblyService:
         if not bom or not bom.is_active:
             raise HTTPException(status_code=400, detail="Active BOM not found")
             
-        # 1. Check availability
-        shortages = await AssemblyService.check_availability(db, tenant_id, bom_id, planned_qty)
+        # 1. Check availability in the warehouse the components are consumed from
+        shortages = await AssemblyService.check_availability(
+            db, tenant_id, bom_id, planned_qty, warehouse_id=warehouse_id
+        )
         if shortages:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
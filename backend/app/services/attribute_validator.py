@@ -1,7 +1,10 @@
 """NEXUS IMS — Attribute validation against item_type.attribute_schema (Block 1.2)."""
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
+from cachetools import LRUCache
+
 # Schema field types: text, number, date, boolean, enum
 VALID_TYPES = {"text", "number", "date", "boolean", "enum"}
 
@@ -15,58 +18,87 @@ class AttributeValidationError(Exception):
         super().__init__(message)
 
 
-def _coerce_value(val: Any, field_type: str, options: list[str] | None) -> Any:
-    """Coerce input to expected type."""
-    if val is None:
-        return None
-    if field_type == "text":
-        return str(val) if not isinstance(val, str) else val
-    if field_type == "number":
-        if isinstance(val, (int, float, Decimal)):
-            return Decimal(str(val))
-        if isinstance(val, str):
-            try:
-                return Decimal(val)
-            except Exception:
-                raise AttributeValidationError(f"Invalid number: {val}")
-        raise AttributeValidationError(f"Cannot convert to number: {val}")
-    if field_type == "date":
-        return str(val)  # Store as ISO string; caller can validate format
-    if field_type == "boolean":
-        if isinstance(val, bool):
-            return val
-        if isinstance(val, str):
-            return val.lower() in ("true", "1", "yes")
-        return bool(val)
-    if field_type == "enum":
+def _coerce_text(val: Any) -> Any:
+    return str(val) if not isinstance(val, str) else val
+
+
+def _coerce_number(val: Any) -> Any:
+    if isinstance(val, (int, float, Decimal)):
+        return Decimal(str(val))
+    if isinstance(val, str):
+        try:
+            return Decimal(val)
+        except Exception:
+            raise AttributeValidationError(f"Invalid number: {val}")
+    raise AttributeValidationError(f"Cannot convert to number: {val}")
+
+
+def _coerce_date(val: Any) -> Any:
+    return str(val)  # Store as ISO string; caller can validate format
+
+
+def _coerce_boolean(val: Any) -> Any:
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, str):
+        return val.lower() in ("true", "1", "yes")
+    return bool(val)
+
+
+def _enum_coercer(options: list[str] | None) -> Callable[[Any], Any]:
+    allowed = frozenset(options) if options else None
+
+    def _coerce_enum(val: Any) -> Any:
         s = str(val)
-        if options and s not in options:
+        if allowed is not None and s not in allowed:
             raise AttributeValidationError(f"Value must be one of {options}")
         return s
-    return val
 
+    return _coerce_enum
 
-def validate_attributes(attributes: dict, attribute_schema: list[dict]) -> dict:
+
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "text": _coerce_text,
+    "number": _coerce_number,
+    "date": _coerce_date,
+    "boolean": _coerce_boolean,
+}
+
+# (field name, coercer, required) per valid field, plus the errors for invalid field types
+CompiledSchema = tuple[tuple[tuple[str, Callable[[Any], Any], bool], ...], dict[str, str]]
+
+
+def compile_schema(attribute_schema: list[dict]) -> CompiledSchema:
     """
-    Validate attributes against item_type.attribute_schema.
-    Schema: [{name, type, required, options?}]
-    Returns validated/coerced attributes. Raises AttributeValidationError on failure.
+    Resolve each field definition to its coercer once, so validation is a flat loop
+    with no per-call type dispatch or option-list scans.
     """
-    field_errors: dict[str, str] = {}
-    result: dict[str, Any] = {}
-
+    fields: list[tuple[str, Callable[[Any], Any], bool]] = []
+    schema_errors: dict[str, str] = {}
     for field_def in attribute_schema:
         name = field_def.get("name")
         if not name:
             continue
         field_type = field_def.get("type", "text")
-        required = field_def.get("required", False)
-        options = field_def.get("options")
-
         if field_type not in VALID_TYPES:
-            field_errors[name] = f"Invalid schema type: {field_type}"
+            schema_errors[name] = f"Invalid schema type: {field_type}"
             continue
+        coerce = _enum_coercer(field_def.get("options")) if field_type == "enum" else _COERCERS[field_type]
+        fields.append((name, coerce, field_def.get("required", False)))
+    return tuple(fields), schema_errors
+
+
+# Compiled schemas keyed by (item_type id, version); update_schema bumps the version
+_compiled: LRUCache = LRUCache(maxsize=1024)
 
+
+def validate_compiled(attributes: dict, compiled: CompiledSchema) -> dict:
+    """Validate attributes against a compiled schema. Raises AttributeValidationError on failure."""
+    fields, schema_errors = compiled
+    field_errors = dict(schema_errors)
+    result: dict[str, Any] = {}
+
+    for name, coerce, required in fields:
         val = attributes.get(name)
         if val is None or (isinstance(val, str) and val.strip() == ""):
             if required:
@@ -74,7 +106,7 @@ def validate_attributes(attributes: dict, attribute_schema: list[dict]) -> dict:
             continue
 
         try:
-            result[name] = _coerce_value(val, field_type, options)
+            result[name] = coerce(val)
         except AttributeValidationError as e:
             field_errors[name] = e.message
 
@@ -82,3 +114,21 @@ def validate_attributes(attributes: dict, attribute_schema: list[dict]) -> dict:
         raise AttributeValidationError("Attribute validation failed", field_errors)
 
     return result
+
+
+def validate_attributes(attributes: dict, attribute_schema: list[dict]) -> dict:
+    """
+    Validate attributes against item_type.attribute_schema.
+    Schema: [{name, type, required, options?}]
+    Returns validated/coerced attributes. Raises AttributeValidationError on failure.
+    """
+    return validate_compiled(attributes, compile_schema(attribute_schema))
+
+
+def validate_item_attributes(attributes: dict, item_type: Any) -> dict:
+    """validate_attributes against an ItemType, reusing its compiled schema across calls."""
+    key = (item_type.id, item_type.version)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = compile_schema(item_type.attribute_schema)
+    return validate_compiled(attributes, compiled)
@@ -67,10 +67,9 @@ class BOMService:
         bom_id: UUID,
     ) -> BOM | None:
         """Get single BOM with lines (selectin loaded)."""
-        result = await db.execute(
+        return await db.scalar(
             select(BOM).where(BOM.id == bom_id, BOM.tenant_id == tenant_id)
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def update_bom(
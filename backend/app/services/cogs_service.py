@@ -25,14 +25,13 @@ class COGSService:
 
         Result: {sku_id, quantity, total_cogs, bom_id, line_breakdown: [{component_sku_id, qty, unit_cost, line_total}]}
         """
-        result = await db.execute(
+        bom = await db.scalar(
             select(BOM).where(
                 BOM.tenant_id == tenant_id,
                 BOM.sku_id == sku_id,
                 BOM.is_active.is_(True),
             ).order_by(BOM.created_at.desc()).limit(1)
         )
-        bom = result.scalar_one_or_none()
         if not bom:
             return None
 
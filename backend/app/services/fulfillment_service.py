@@ -2,7 +2,7 @@
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,8 +22,7 @@ class FulfillmentService:
             .where(SalesOrder.id == order_id, SalesOrder.tenant_id == tenant_id)
             .options(selectinload(SalesOrder.lines))
         )
-        res = await db.execute(stmt)
-        return res.scalar_one_or_none()
+        return await db.scalar(stmt)
 
     @staticmethod
     async def create_sales_order(
@@ -47,18 +46,18 @@ class FulfillmentService:
         db.add(order)
         await db.flush()
 
-        for line in lines_data:
-            ol = SalesOrderLine(
-                sales_order_id=order.id,
-                sku_id=line["sku_id"],
-                quantity=Decimal(str(line["quantity"])),
-                unit_price=Decimal(str(line.get("unit_price", 0))),
-                fulfilled_qty=0,
-            )
-            db.add(ol)
-
-        await db.flush()
-        await db.refresh(order)
+        # One multi-row INSERT (insertmanyvalues) instead of a unit-of-work object per line
+        if lines_data:
+            await db.execute(insert(SalesOrderLine), [
+                {
+                    "sales_order_id": order.id,
+                    "sku_id": line["sku_id"],
+                    "quantity": Decimal(str(line["quantity"])),
+                    "unit_price": Decimal(str(line.get("unit_price", 0))),
+                    "fulfilled_qty": 0,
+                }
+                for line in lines_data
+            ])
         return await FulfillmentService.get_by_id(db, order.id, tenant_id)
 
     @staticmethod
@@ -25,21 +25,19 @@ class ItemTypeService:
 
     @staticmethod
     async def get_by_id(db: AsyncSession, id: UUID, tenant_id: UUID) -> ItemType | None:
-        result = await db.execute(
+        return await db.scalar(
             select(ItemType).where(ItemType.id == id, ItemType.tenant_id == tenant_id)
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def get_by_code(db: AsyncSession, tenant_id: UUID, code: str) -> ItemType | None:
-        result = await db.execute(
+        return await db.scalar(
             select(ItemType).where(
                 ItemType.tenant_id == tenant_id,
                 ItemType.code == code,
                 ItemType.is_archived == False,
             )
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def create_item_type(
@@ -1,15 +1,27 @@
-"""NEXUS IMS — LedgerService (Block 2): post_event, get_stock_level (cache-aside), get_transaction_history."""
+"""NEXUS IMS — LedgerService (Block 2): post_event, append_events, get_stock_level (cache-aside), get_transaction_history."""
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.redis import get_redis, stock_cache_key, STOCK_CACHE_TTL
-from app.models.warehouse import StockLedger, StockEventType
+from app.db.types import QUANTITY_FACTOR
+from app.models.item_type import SKU
+from app.models.warehouse import StockLedger, StockEventType, StockOnHand, Warehouse
 from app.services.warehouse_service import WarehouseService
 
 
+_EXPORT_COLUMNS = (
+    "id", "sku_id", "warehouse_id", "location_id", "event_type",
+    f"(quantity_delta::numeric / {QUANTITY_FACTOR})::numeric(18, 4) AS quantity_delta",
+    "reference_id", "actor_id", "notes", "reason_code", "created_at",
+)
+
+
 class LedgerService:
     """Immutable stock ledger with Redis cache-aside."""
 
@@ -20,20 +32,20 @@ class LedgerService:
         sku_id: UUID,
         warehouse_id: UUID,
     ) -> Decimal:
-        """Get current stock. Redis cache-aside, 30s TTL."""
+        """Get current stock from stock_on_hand. Redis cache-aside, 30s TTL."""
         r = await get_redis()
         key = stock_cache_key(str(tenant_id), str(sku_id), str(warehouse_id))
         cached = await r.get(key)
         if cached is not None:
             return Decimal(cached)
 
-        result = await db.execute(
-            select(func.coalesce(func.sum(StockLedger.quantity_delta), 0)).where(
-                StockLedger.sku_id == sku_id,
-                StockLedger.warehouse_id == warehouse_id,
+        level = await db.scalar(
+            select(StockOnHand.quantity).where(
+                StockOnHand.tenant_id == tenant_id,
+                StockOnHand.sku_id == sku_id,
+                StockOnHand.warehouse_id == warehouse_id,
             )
-        )
-        level = result.scalar_one()
+        ) or Decimal(0)
         await r.setex(key, STOCK_CACHE_TTL, str(level))
         return Decimal(str(level))
 
@@ -52,7 +64,10 @@ class LedgerService:
         notes: str | None = None,
         reason_code: str | None = None,
     ) -> StockLedger:
-        """Append ledger event. Validates warehouse, checks negative stock, invalidates cache."""
+        """
+        Append ledger event. Validates warehouse, checks negative stock, invalidates cache.
+        The resulting balance is returned on ``ev.balance_after`` so callers need no re-read.
+        """
         warehouse = await WarehouseService.get_by_id(db, warehouse_id, tenant_id)
         if not warehouse:
             raise ValueError("Warehouse not found or inactive")
@@ -77,6 +92,7 @@ class LedgerService:
         db.add(ev)
         await db.flush()
         await db.refresh(ev)
+        ev.balance_after = new_balance
 
         # Invalidate Redis cache
         r = await get_redis()
@@ -97,6 +113,58 @@ class LedgerService:
 
         return ev
 
+    @staticmethod
+    async def append_events(
+        db: AsyncSession,
+        tenant_id: UUID,
+        event_type: StockEventType | str,
+        events: list[dict],
+        *,
+        actor_id: UUID | None = None,
+    ) -> int:
+        """
+        Bulk append for imports / inventory sync: one batched INSERT instead of post_event's
+        lookups and single-row INSERT per event. Each dict carries sku_id, warehouse_id,
+        quantity_delta, location_id, notes and reason_code. Negative stock is still rejected
+        by the stock_ledger trigger; workflows are not evaluated and no balances are returned.
+        """
+        if not events:
+            return 0
+        warehouse_ids = {e["warehouse_id"] for e in events}
+        sku_ids = {e["sku_id"] for e in events}
+        found_warehouses = set(await db.scalars(
+            select(Warehouse.id).where(
+                Warehouse.tenant_id == tenant_id,
+                Warehouse.id.in_(warehouse_ids),
+                Warehouse.is_active == True,
+            )
+        ))
+        if found_warehouses != warehouse_ids:
+            raise ValueError("Warehouse not found or inactive")
+        found_skus = set(await db.scalars(
+            select(SKU.id).where(SKU.tenant_id == tenant_id, SKU.id.in_(sku_ids))
+        ))
+        if found_skus != sku_ids:
+            raise ValueError("SKU not found")
+
+        event_type = event_type.value if isinstance(event_type, StockEventType) else event_type
+        rows = [
+            {**e, "tenant_id": tenant_id, "event_type": event_type, "actor_id": actor_id}
+            for e in events
+        ]
+        try:
+            await db.execute(insert(StockLedger), rows)
+        except DBAPIError as exc:
+            if "Negative stock not allowed" in str(exc.orig):
+                raise ValueError(str(exc.orig).splitlines()[0]) from exc
+            raise
+
+        r = await get_redis()
+        await r.delete(*{
+            stock_cache_key(str(tenant_id), str(e["sku_id"]), str(e["warehouse_id"])) for e in events
+        })
+        return len(rows)
+
     @staticmethod
     async def get_transaction_history(
         db: AsyncSession,
@@ -110,45 +178,90 @@ class LedgerService:
         date_to: str | None = None,
         page: int = 1,
         page_size: int = 50,
+        before: tuple[datetime, UUID] | None = None,
     ) -> tuple[list[tuple[StockLedger, Decimal]], int]:
-        """Paginated transaction history with running balance."""
-        q = select(StockLedger).where(StockLedger.tenant_id == tenant_id)
-        count_q = select(func.count(StockLedger.id)).where(StockLedger.tenant_id == tenant_id)
+        """Paginated transaction history with running balance.
+
+        ``before`` is a keyset cursor (created_at, id) of the last row already seen; when given,
+        the page starts strictly after it and ``page`` is ignored, so deep pages cost the same as
+        the first. The returned total then counts the rows remaining after the cursor.
+        """
+        q = select(StockLedger, func.count().over().label("total")).where(
+            StockLedger.tenant_id == tenant_id
+        )
         if sku_id:
             q = q.where(StockLedger.sku_id == sku_id)
-            count_q = count_q.where(StockLedger.sku_id == sku_id)
         if warehouse_id:
             q = q.where(StockLedger.warehouse_id == warehouse_id)
-            count_q = count_q.where(StockLedger.warehouse_id == warehouse_id)
         if event_type:
             q = q.where(StockLedger.event_type == event_type)
-            count_q = count_q.where(StockLedger.event_type == event_type)
         if actor_id:
             q = q.where(StockLedger.actor_id == actor_id)
-            count_q = count_q.where(StockLedger.actor_id == actor_id)
         if date_from:
             q = q.where(StockLedger.created_at >= date_from)
-            count_q = count_q.where(StockLedger.created_at >= date_from)
         if date_to:
             q = q.where(StockLedger.created_at <= date_to)
-            count_q = count_q.where(StockLedger.created_at <= date_to)
 
-        total = (await db.execute(count_q)).scalar_one()
-        q = q.order_by(StockLedger.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
-        result = await db.execute(q)
-        rows = list(result.scalars().all())
+        offset = 0
+        if before is not None:
+            q = q.where(tuple_(StockLedger.created_at, StockLedger.id) < tuple_(*before))
+        else:
+            offset = (page - 1) * page_size
+        q = q.order_by(StockLedger.created_at.desc(), StockLedger.id.desc())
+        result = await db.execute(q.offset(offset).limit(page_size))
+        page_rows = result.all()
+        rows = [r[0] for r in page_rows]
+        if page_rows:
+            total = page_rows[0].total
+        elif offset == 0:
+            total = 0
+        else:
+            # Page past the end: no row carries the window total, so count separately
+            total = await db.scalar(
+                select(func.count()).select_from(q.with_only_columns(StockLedger.id).subquery())
+            )
 
         # Running balance per row (simplified: sum up to this row for same sku+warehouse)
         out: list[tuple[StockLedger, Decimal]] = []
         for r in rows:
-            bal_result = await db.execute(
+            bal = await db.scalar(
                 select(func.coalesce(func.sum(StockLedger.quantity_delta), 0)).where(
                     StockLedger.sku_id == r.sku_id,
                     StockLedger.warehouse_id == r.warehouse_id,
                     StockLedger.created_at <= r.created_at,
                 )
             )
-            bal = bal_result.scalar_one()
             out.append((r, Decimal(str(bal))))
 
         return out, total
+
+    @staticmethod
+    async def copy_history_csv(
+        db: AsyncSession,
+        tenant_id: UUID,
+        output: Callable[[bytes], Awaitable[None]],
+        *,
+        sku_id: UUID | None = None,
+        warehouse_id: UUID | None = None,
+        event_type: str | None = None,
+    ) -> None:
+        """
+        Stream the tenant's ledger as CSV via COPY on the raw asyncpg connection.
+        Rows never become ORM objects: Postgres writes CSV chunks that go straight to ``output``.
+        """
+        where = ["tenant_id = $1"]
+        args: list = [tenant_id]
+        filters = (("sku_id", sku_id), ("warehouse_id", warehouse_id), ("event_type", event_type))
+        for column, value in filters:
+            if value is not None:
+                args.append(value)
+                where.append(f"{column} = ${len(args)}")
+        query = (
+            f"SELECT {', '.join(_EXPORT_COLUMNS)} FROM stock_ledger "
+            f"WHERE {' AND '.join(where)} ORDER BY created_at, id"
+        )
+        raw = await (await db.connection()).get_raw_connection()
+        await raw.driver_connection.copy_from_query(
+            query, *args, output=output, format="csv", header=True
+        )
+
@@ -1,9 +1,9 @@
 """NEXUS IMS — LocationService (Block 3.2)."""
 from uuid import UUID
 
-from sqlalchemy import select
-
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.location import Location
 
@@ -13,14 +13,13 @@ class LocationService:
 
     @staticmethod
     async def get_by_id(db: AsyncSession, id: UUID, tenant_id: UUID) -> Location | None:
-        result = await db.execute(
+        return await db.scalar(
             select(Location).where(
                 Location.id == id,
                 Location.tenant_id == tenant_id,
                 Location.is_active == True,
             )
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def list_by_warehouse(
@@ -47,21 +46,45 @@ class LocationService:
     @staticmethod
     async def get_location_path(db: AsyncSession, id: UUID, tenant_id: UUID) -> list[str]:
         """Return full path as list of names: Zone > Aisle > Bin."""
-        loc = await LocationService.get_by_id(db, id, tenant_id)
-        if not loc:
-            return []
-        path = [loc.name]
-        current = loc
-        while current.parent_id:
-            result = await db.execute(
-                select(Location).where(Location.id == current.parent_id)
+        target = aliased(Location)
+        result = await db.scalars(
+            select(Location.name)
+            .join(target, Location.path.ancestor_of(target.path))
+            .where(
+                target.id == id,
+                target.tenant_id == tenant_id,
+                target.is_active == True,
+                Location.tenant_id == tenant_id,
             )
-            parent = result.scalar_one_or_none()
-            if not parent:
-                break
-            path.insert(0, parent.name)
-            current = parent
-        return path
+            .order_by(func.nlevel(Location.path))
+        )
+        return list(result.all())
+
+    @staticmethod
+    async def list_descendants(
+        db: AsyncSession,
+        tenant_id: UUID,
+        id: UUID,
+        location_type: str | None = None,
+        include_inactive: bool = False,
+    ) -> list[Location]:
+        """Every location below ``id`` at any depth (e.g. all bins in a zone), in one query."""
+        root_path = (
+            select(Location.path)
+            .where(Location.id == id, Location.tenant_id == tenant_id)
+            .scalar_subquery()
+        )
+        q = select(Location).where(
+            Location.tenant_id == tenant_id,
+            Location.path.descendant_of(root_path),
+            Location.id != id,
+        )
+        if location_type:
+            q = q.where(Location.location_type == location_type)
+        if not include_inactive:
+            q = q.where(Location.is_active == True)
+        result = await db.execute(q.order_by(Location.path))
+        return list(result.scalars().all())
 
     @staticmethod
     async def create(
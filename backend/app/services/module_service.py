@@ -48,9 +48,10 @@ class ModuleService:
             raise HTTPException(status_code=400, detail=f"Module {manifest.slug} is already installed.")
             
         # Validate that granted_permissions covers what the manifest actually asks for
-        requested_perms = [f"{p.resource}:{p.action}" for p in manifest.permissions]
-        for rp in requested_perms:
-            if rp not in granted_permissions:
+        granted = set(granted_permissions)
+        for p in manifest.permissions:
+            rp = p.key
+            if rp not in granted:
                 raise HTTPException(status_code=403, detail=f"Missing required module permission: {rp}")
 
         # Create installation record
@@ -2,7 +2,7 @@
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.purchase_order import POStatus, PurchaseOrder, PurchaseOrderLine
@@ -23,7 +23,12 @@ class PurchaseOrderService:
         notes: str | None = None,
         created_by: UUID | None = None,
     ) -> PurchaseOrder:
-        """Create a new PO with lines in DRAFT status."""
+        """Create a new PO with lines in DRAFT status.
+
+        Lines are attached in memory rather than keyed by a flushed po.id, so a single flush
+        inserts the PO and then every line in one batched INSERT, with no refresh round-trip.
+        """
+        zero = Decimal("0")
         po = PurchaseOrder(
             tenant_id=tenant_id,
             supplier_name=supplier_name,
@@ -31,22 +36,18 @@ class PurchaseOrderService:
             status=POStatus.DRAFT.value,
             notes=notes,
             created_by=created_by,
+            lines=[
+                PurchaseOrderLine(
+                    sku_id=line_data["sku_id"],
+                    quantity_ordered=Decimal(str(line_data["quantity_ordered"])),
+                    quantity_received=zero,
+                    unit_cost=Decimal(str(line_data["unit_cost"])),
+                )
+                for line_data in lines
+            ],
         )
         db.add(po)
         await db.flush()
-
-        for line_data in lines:
-            line = PurchaseOrderLine(
-                po_id=po.id,
-                sku_id=line_data["sku_id"],
-                quantity_ordered=Decimal(str(line_data["quantity_ordered"])),
-                quantity_received=Decimal("0"),
-                unit_cost=Decimal(str(line_data["unit_cost"])),
-            )
-            db.add(line)
-
-        await db.flush()
-        await db.refresh(po)
         return po
 
     @staticmethod
@@ -58,13 +59,12 @@ class PurchaseOrderService:
         page_size: int = 50,
     ) -> tuple[list[PurchaseOrder], int]:
         """Paginated list of POs for tenant."""
-        from sqlalchemy import func
         q = select(PurchaseOrder).where(PurchaseOrder.tenant_id == tenant_id)
         count_q = select(func.count(PurchaseOrder.id)).where(PurchaseOrder.tenant_id == tenant_id)
         if status:
             q = q.where(PurchaseOrder.status == status)
             count_q = count_q.where(PurchaseOrder.status == status)
-        total = (await db.execute(count_q)).scalar_one()
+        total = await db.scalar(count_q)
         q = q.order_by(PurchaseOrder.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
         result = await db.execute(q)
         return list(result.scalars().all()), total
@@ -76,13 +76,12 @@ class PurchaseOrderService:
         po_id: UUID,
     ) -> PurchaseOrder | None:
         """Get single PO with lines (selectin loaded)."""
-        result = await db.execute(
+        return await db.scalar(
             select(PurchaseOrder).where(
                 PurchaseOrder.id == po_id,
                 PurchaseOrder.tenant_id == tenant_id,
             )
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def receive_po(
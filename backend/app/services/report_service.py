@@ -1,4 +1,5 @@
 """NEXUS IMS — ReportService (Block 6): Dashboard KPIs, stock valuation, low-stock alerts."""
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from uuid import UUID
 
@@ -6,9 +7,11 @@ from sqlalchemy import func, select, case, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.item_type import SKU, ItemType
-from app.models.warehouse import StockLedger, Warehouse
+from app.models.warehouse import StockLedger, StockOnHand, Warehouse
 from app.models.location import TransferOrder
+from app.models.tenant import User
 from app.core.redis import get_redis
+from app.db.types import from_minor
 
 
 DASHBOARD_CACHE_KEY = "dashboard:{tenant_id}"
@@ -25,34 +28,34 @@ class ReportService:
     ) -> dict:
         """KPI payload: total SKUs, stock value, low-stock count, pending transfers, recent tx count."""
         # Total active SKUs
-        total_skus = (await db.execute(
+        total_skus = await db.scalar(
             select(func.count(SKU.id)).where(SKU.tenant_id == tenant_id, SKU.is_archived == False)
-        )).scalar_one()
+        )
 
         # Total stock value: SUM(stock_level * unit_cost) grouped by SKU+warehouse
         stock_value_q = (
             select(
                 func.coalesce(
-                    func.sum(StockLedger.quantity_delta * SKU.unit_cost), 0
+                    from_minor(func.sum(StockOnHand.quantity * SKU.unit_cost)), 0
                 )
             )
-            .join(SKU, StockLedger.sku_id == SKU.id)
-            .where(StockLedger.tenant_id == tenant_id, SKU.unit_cost.isnot(None))
+            .join(SKU, StockOnHand.sku_id == SKU.id)
+            .where(StockOnHand.tenant_id == tenant_id, SKU.unit_cost.isnot(None))
         )
-        total_stock_value = (await db.execute(stock_value_q)).scalar_one()
+        total_stock_value = await db.scalar(stock_value_q)
 
         # Low-stock SKUs (at or below reorder_point)
         # Subquery: current stock per SKU
         stock_sub = (
             select(
-                StockLedger.sku_id,
-                func.sum(StockLedger.quantity_delta).label("total_stock"),
+                StockOnHand.sku_id,
+                from_minor(func.sum(StockOnHand.quantity)).label("total_stock"),
             )
-            .where(StockLedger.tenant_id == tenant_id)
-            .group_by(StockLedger.sku_id)
+            .where(StockOnHand.tenant_id == tenant_id)
+            .group_by(StockOnHand.sku_id)
             .subquery()
         )
-        low_stock_count = (await db.execute(
+        low_stock_count = await db.scalar(
             select(func.count(SKU.id))
             .outerjoin(stock_sub, SKU.id == stock_sub.c.sku_id)
             .where(
@@ -61,33 +64,32 @@ class ReportService:
                 SKU.reorder_point.isnot(None),
                 func.coalesce(stock_sub.c.total_stock, 0) <= SKU.reorder_point,
             )
-        )).scalar_one()
+        )
 
         # Pending transfers
-        pending_transfers = (await db.execute(
+        pending_transfers = await db.scalar(
             select(func.count(TransferOrder.id)).where(
                 TransferOrder.tenant_id == tenant_id,
                 TransferOrder.status.in_(["PENDING", "IN_TRANSIT"]),
             )
-        )).scalar_one()
+        )
 
         # Recent transactions (last 24h)
-        from datetime import datetime, timedelta, timezone
         cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-        recent_tx_count = (await db.execute(
+        recent_tx_count = await db.scalar(
             select(func.count(StockLedger.id)).where(
                 StockLedger.tenant_id == tenant_id,
                 StockLedger.created_at >= cutoff,
             )
-        )).scalar_one()
+        )
 
         # Active warehouses
-        active_warehouses = (await db.execute(
+        active_warehouses = await db.scalar(
             select(func.count(Warehouse.id)).where(
                 Warehouse.tenant_id == tenant_id,
                 Warehouse.is_active == True,
             )
-        )).scalar_one()
+        )
 
         return {
             "total_skus": total_skus,
@@ -113,13 +115,11 @@ class ReportService:
                 SKU.unit_cost,
                 Warehouse.id.label("warehouse_id"),
                 Warehouse.code.label("warehouse_code"),
-                func.coalesce(func.sum(StockLedger.quantity_delta), 0).label("stock_level"),
+                StockOnHand.quantity.label("stock_level"),
             )
-            .join(StockLedger, StockLedger.sku_id == SKU.id)
-            .join(Warehouse, StockLedger.warehouse_id == Warehouse.id)
-            .where(SKU.tenant_id == tenant_id, SKU.is_archived == False)
-            .group_by(SKU.id, SKU.sku_code, SKU.name, SKU.unit_cost, Warehouse.id, Warehouse.code)
-            .having(func.sum(StockLedger.quantity_delta) > 0)
+            .join(StockOnHand, StockOnHand.sku_id == SKU.id)
+            .join(Warehouse, StockOnHand.warehouse_id == Warehouse.id)
+            .where(SKU.tenant_id == tenant_id, SKU.is_archived == False, StockOnHand.quantity > 0)
             .order_by(SKU.sku_code, Warehouse.code)
         )
         if warehouse_id:
@@ -148,11 +148,11 @@ class ReportService:
         """SKUs at or below reorder_point with current stock levels."""
         stock_sub = (
             select(
-                StockLedger.sku_id,
-                func.sum(StockLedger.quantity_delta).label("total_stock"),
+                StockOnHand.sku_id,
+                from_minor(func.sum(StockOnHand.quantity)).label("total_stock"),
             )
-            .where(StockLedger.tenant_id == tenant_id)
-            .group_by(StockLedger.sku_id)
+            .where(StockOnHand.tenant_id == tenant_id)
+            .group_by(StockOnHand.sku_id)
             .subquery()
         )
         q = (
@@ -200,7 +200,7 @@ class ReportService:
             select(
                 StockLedger.event_type,
                 func.count(StockLedger.id).label("count"),
-                func.sum(func.abs(StockLedger.quantity_delta)).label("total_qty"),
+                from_minor(func.sum(func.abs(StockLedger.quantity_delta))).label("total_qty"),
             )
             .where(StockLedger.tenant_id == tenant_id)
             .group_by(StockLedger.event_type)
@@ -232,7 +232,6 @@ class ReportService:
         limit: int = 20,
     ) -> list[dict]:
         """Last N ledger events for activity feed."""
-        from app.models.tenant import User
         q = (
             select(
                 StockLedger.id,
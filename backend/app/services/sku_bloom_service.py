@@ -0,0 +1,75 @@
+"""NEXUS IMS — SKUBloomService (Block 5): Redis bitmap Bloom filter of sku_codes for scanner misses."""
+import hashlib
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import SKU_BLOOM_TTL, get_redis, sku_bloom_key
+from app.models.item_type import SKU
+
+# 2^20 bits (128 KB) per tenant with 10 probes keeps false positives well under 0.1% up to
+# ~50k SKUs. Bit 0 is reserved as the "built from DB" marker and never used as a probe.
+BLOOM_BITS = 1 << 20
+BLOOM_HASHES = 10
+
+
+def _positions(sku_code: str) -> list[int]:
+    """Double-hashing probe positions for sku_code, all in 1..BLOOM_BITS-1."""
+    digest = hashlib.blake2b(sku_code.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [1 + (h1 + i * h2) % (BLOOM_BITS - 1) for i in range(BLOOM_HASHES)]
+
+
+class SKUBloomService:
+    """
+    Per-tenant Bloom filter of sku_codes on a plain Redis bitmap (no RedisBloom module needed).
+    A negative answer is definitive, so scanner typos are rejected without touching Postgres.
+    """
+
+    @staticmethod
+    async def might_exist(db: AsyncSession, tenant_id: UUID, sku_code: str) -> bool:
+        """False only if sku_code is definitely not a SKU of this tenant."""
+        r = await get_redis()
+        key = sku_bloom_key(str(tenant_id))
+        args: list = ["GET", "u1", 0]
+        for pos in _positions(sku_code):
+            args += ["GET", "u1", pos]
+        bits = await r.execute_command("BITFIELD", key, *args)
+        if not bits[0]:
+            await SKUBloomService.rebuild(db, tenant_id)
+            return True
+        return all(bits[1:])
+
+    @staticmethod
+    async def add(tenant_id: UUID, sku_code: str) -> None:
+        """Record a new sku_code. Safe before the filter is built; the build merges with it."""
+        r = await get_redis()
+        args: list = []
+        for pos in _positions(sku_code):
+            args += ["SET", "u1", pos, 1]
+        await r.execute_command("BITFIELD", sku_bloom_key(str(tenant_id)), *args)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, tenant_id: UUID) -> None:
+        """
+        Build the filter from the SKUs table in one scan and OR it into Redis, so codes
+        added concurrently are kept. Expires after SKU_BLOOM_TTL to shed archived codes.
+        """
+        result = await db.execute(select(SKU.sku_code).where(SKU.tenant_id == tenant_id))
+        buf = bytearray(BLOOM_BITS // 8)
+        buf[0] |= 0x80  # built marker (Redis bit 0 is the MSB of byte 0)
+        for (code,) in result:
+            for pos in _positions(code):
+                buf[pos >> 3] |= 0x80 >> (pos & 7)
+
+        r = await get_redis()
+        key = sku_bloom_key(str(tenant_id))
+        tmp = f"{key}:build"
+        async with r.pipeline(transaction=True) as pipe:
+            pipe.set(tmp, bytes(buf), ex=60)
+            pipe.bitop("OR", key, key, tmp)
+            pipe.delete(tmp)
+            pipe.expire(key, SKU_BLOOM_TTL)
+            await pipe.execute()
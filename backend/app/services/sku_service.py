@@ -1,4 +1,5 @@
 """NEXUS IMS — SKUService (Block 1.2)."""
+from datetime import date
 from decimal import Decimal
 from uuid import UUID
 
@@ -6,8 +7,9 @@ from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.item_type import ItemType, SKU
-from app.services.attribute_validator import AttributeValidationError, validate_attributes
+from app.services.attribute_validator import AttributeValidationError, validate_item_attributes
 from app.services.item_type_service import ItemTypeService
+from app.services.sku_bloom_service import SKUBloomService
 
 
 class SKUService:
@@ -21,56 +23,57 @@ class SKUService:
         item_type_id: UUID | None = None,
         search: str | None = None,
         low_stock: bool | None = None,
+        expires_before: date | None = None,
         include_archived: bool = False,
         page: int = 1,
         page_size: int = 50,
     ) -> tuple[list[SKU], int]:
-        q = select(SKU).where(SKU.tenant_id == tenant_id)
-        count_q = select(func.count(SKU.id)).where(SKU.tenant_id == tenant_id)
+        # COUNT(*) OVER () rides along with the page so total and rows come back in one trip
+        q = select(SKU, func.count().over().label("total")).where(SKU.tenant_id == tenant_id)
 
         if not include_archived:
             q = q.where(SKU.is_archived == False)
-            count_q = count_q.where(SKU.is_archived == False)
         if item_type_id:
             q = q.where(SKU.item_type_id == item_type_id)
-            count_q = count_q.where(SKU.item_type_id == item_type_id)
         if search:
             search_term = f"%{search}%"
             q = q.where(or_(SKU.sku_code.ilike(search_term), SKU.name.ilike(search_term)))
-            count_q = count_q.where(or_(SKU.sku_code.ilike(search_term), SKU.name.ilike(search_term)))
 
         # low_stock: requires reorder_point and stock level; defer to Block 2
         # For now, low_stock=True filters SKUs with reorder_point set (can't compare to stock yet)
         if low_stock is True:
             q = q.where(SKU.reorder_point.isnot(None))
-            count_q = count_q.where(SKU.reorder_point.isnot(None))
-
-        # Count
-        count_result = await db.execute(count_q)
-        total = count_result.scalar_one()
-
-        q = q.order_by(SKU.sku_code).offset((page - 1) * page_size).limit(page_size)
-        result = await db.execute(q)
-        items = list(result.scalars().all())
-        return items, total
+        if expires_before:
+            q = q.where(SKU.attr_expiry_date < expires_before.isoformat())
+
+        offset = (page - 1) * page_size
+        result = await db.execute(q.order_by(SKU.sku_code).offset(offset).limit(page_size))
+        rows = result.all()
+        if rows:
+            return [r[0] for r in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+        # Page past the end: no row carries the window total, so count separately
+        total = await db.scalar(
+            select(func.count()).select_from(q.with_only_columns(SKU.id).subquery())
+        )
+        return [], total
 
     @staticmethod
     async def get_by_id(db: AsyncSession, id: UUID, tenant_id: UUID) -> SKU | None:
-        result = await db.execute(
+        return await db.scalar(
             select(SKU).where(SKU.id == id, SKU.tenant_id == tenant_id)
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def get_by_code(db: AsyncSession, tenant_id: UUID, sku_code: str) -> SKU | None:
-        result = await db.execute(
+        return await db.scalar(
             select(SKU).where(
                 SKU.tenant_id == tenant_id,
                 SKU.sku_code == sku_code,
                 SKU.is_archived == False,
             )
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def create_sku(
@@ -86,7 +89,7 @@ class SKUService:
         item_type = await ItemTypeService.get_by_id(db, item_type_id, tenant_id)
         if not item_type:
             raise ValueError("Item type not found")
-        validated_attrs = validate_attributes(attributes, item_type.attribute_schema)
+        validated_attrs = validate_item_attributes(attributes, item_type)
 
         sku = SKU(
             tenant_id=tenant_id,
@@ -100,6 +103,7 @@ class SKUService:
         db.add(sku)
         await db.flush()
         await db.refresh(sku)
+        await SKUBloomService.add(tenant_id, sku_code)
         return sku
 
     @staticmethod
@@ -127,7 +131,7 @@ class SKUService:
             item_type = await ItemTypeService.get_by_id(db, sku.item_type_id, tenant_id)
             if not item_type:
                 raise ValueError("Item type not found")
-            sku.attributes = validate_attributes(attributes, item_type.attribute_schema)
+            sku.attributes = validate_item_attributes(attributes, item_type)
 
         await db.flush()
         await db.refresh(sku)
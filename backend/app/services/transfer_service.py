@@ -1,8 +1,10 @@
 """NEXUS IMS — TransferService (Block 3.2)."""
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -43,6 +45,7 @@ class TransferService:
         db.add(order)
         await db.flush()
 
+        line_rows = []
         for line in lines:
             sku_id = line["sku_id"]
             qty = Decimal(str(line["quantity_requested"]))
@@ -52,14 +55,14 @@ class TransferService:
                 reference_id=order.id, actor_id=created_by,
                 notes=f"Transfer to {twh.code}",
             )
-            db.add(TransferOrderLine(
-                transfer_order_id=order.id,
-                sku_id=sku_id,
-                quantity_requested=qty,
-            ))
-
-        await db.flush()
-        await db.refresh(order)
+            line_rows.append({"transfer_order_id": order.id, "sku_id": sku_id, "quantity_requested": qty})
+
+        # All lines in one multi-row INSERT once every TRANSFER_OUT has been accepted
+        if line_rows:
+            await db.execute(insert(TransferOrderLine), line_rows)
+        # Load lines in the same refresh: the caller serializes them, and a lazy load
+        # after this point would be an implicit (and, under asyncio, illegal) extra query
+        await db.refresh(order, ["created_at", "received_at", "lines"])
         return order
 
     @staticmethod
@@ -70,7 +73,7 @@ class TransferService:
         line_quantities: dict[UUID, Decimal] | None = None,  # line_id -> qty_received
     ) -> TransferOrder | None:
         """Post TRANSFER_IN events on destination. Can be partial receipt."""
-        result = await db.execute(
+        order = await db.scalar(
             select(TransferOrder)
             .where(
                 TransferOrder.id == transfer_order_id,
@@ -79,7 +82,6 @@ class TransferService:
             )
             .options(selectinload(TransferOrder.lines))
         )
-        order = result.scalar_one_or_none()
         if not order:
             return None
 
@@ -93,7 +95,6 @@ class TransferService:
             )
             line.quantity_received = qty_received
 
-        from datetime import datetime, timezone
         order.status = TransferStatus.RECEIVED.value
         order.received_at = datetime.now(timezone.utc)
         await db.flush()
@@ -107,7 +108,7 @@ class TransferService:
         tenant_id: UUID,
     ) -> TransferOrder | None:
         """Reverse TRANSFER_OUT by posting TRANSFER_IN on source (return)."""
-        result = await db.execute(
+        order = await db.scalar(
             select(TransferOrder)
             .where(
                 TransferOrder.id == transfer_order_id,
@@ -116,7 +117,6 @@ class TransferService:
             )
             .options(selectinload(TransferOrder.lines))
         )
-        order = result.scalar_one_or_none()
         if not order:
             return None
 
@@ -135,14 +135,20 @@ class TransferService:
         return order
 
     @staticmethod
-    async def list_transfers(
+    async def iter_transfers(
         db: AsyncSession,
         tenant_id: UUID,
         *,
         status: str | None = None,
         warehouse_id: UUID | None = None,
-    ) -> list[TransferOrder]:
-        q = select(TransferOrder).where(TransferOrder.tenant_id == tenant_id)
+        batch_size: int = 100,
+    ) -> AsyncIterator[list[TransferOrder]]:
+        """Yield transfer orders (lines selectin-loaded per batch) from a server-side cursor."""
+        q = (
+            select(TransferOrder)
+            .options(selectinload(TransferOrder.lines))
+            .where(TransferOrder.tenant_id == tenant_id)
+        )
         if status:
             q = q.where(TransferOrder.status == status)
         if warehouse_id:
@@ -150,6 +156,7 @@ class TransferService:
                 (TransferOrder.from_warehouse_id == warehouse_id) |
                 (TransferOrder.to_warehouse_id == warehouse_id)
             )
-        q = q.order_by(TransferOrder.created_at.desc())
-        result = await db.execute(q.options(selectinload(TransferOrder.lines)))
-        return list(result.scalars().all())
+        q = q.order_by(TransferOrder.created_at.desc()).execution_options(yield_per=batch_size)
+        result = await db.stream(q)
+        async for batch in result.scalars().partitions():
+            yield batch
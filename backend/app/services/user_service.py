@@ -2,12 +2,15 @@
 import hashlib
 import logging
 import secrets
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
+import anyio
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import get_password_hash as hash_password
 from app.models.rbac import InvitationToken
 from app.models.tenant import User
 
@@ -20,9 +23,9 @@ class UserService:
     INVITATION_TTL_HOURS = 24
 
     @staticmethod
-    def _hash_token(raw_token: str) -> str:
-        """SHA-256 hash for invitation token storage (not bcrypt — tokens are long/random)."""
-        return hashlib.sha256(raw_token.encode()).hexdigest()
+    def _hash_token(raw_token: str) -> bytes:
+        """Raw SHA-256 digest for invitation token storage (not bcrypt — tokens are long/random)."""
+        return hashlib.sha256(raw_token.encode()).digest()
 
     @staticmethod
     async def invite_user(
@@ -50,8 +53,8 @@ class UserService:
             expires_at=expires_at,
             created_by=invited_by,
         )
+        # No flush: the INSERT goes out with the caller's audit row on commit.
         db.add(invite)
-        await db.flush()
 
         # Log token for development — replace with SendGrid call in production
         logger.warning(
@@ -69,33 +72,31 @@ class UserService:
         full_name: str | None = None,
     ) -> User:
         """Validate token, create user, mark token accepted."""
-        from app.core.security import get_password_hash as hash_password
 
         token_hash = UserService._hash_token(raw_token)
         now = datetime.now(timezone.utc)
 
-        result = await db.execute(
+        invite = await db.scalar(
             select(InvitationToken).where(
                 InvitationToken.token_hash == token_hash,
                 InvitationToken.accepted_at.is_(None),
                 InvitationToken.expires_at > now,
             )
         )
-        invite = result.scalar_one_or_none()
         if not invite:
             raise ValueError("Invitation token is invalid or expired")
 
         # Check if user with this email already exists in the tenant
-        existing = await db.execute(
+        if await db.scalar(
             select(User).where(User.tenant_id == invite.tenant_id, User.email == invite.email)
-        )
-        if existing.scalar_one_or_none():
+        ):
             raise ValueError("A user with this email already exists")
 
         user = User(
             tenant_id=invite.tenant_id,
             email=invite.email,
-            hashed_password=hash_password(password),
+            # bcrypt is deliberately slow; keep it off the event loop
+            hashed_password=await anyio.to_thread.run_sync(hash_password, password),
             full_name=full_name,
             role=invite.role,
             warehouse_scope=invite.warehouse_scope,
@@ -109,24 +110,26 @@ class UserService:
         return user
 
     @staticmethod
-    async def list_users(
+    async def iter_users(
         db: AsyncSession,
         tenant_id: UUID,
         include_inactive: bool = False,
-    ) -> list[User]:
+        batch_size: int = 100,
+    ) -> AsyncIterator[list[User]]:
+        """Yield the tenant's users in batches from a server-side cursor."""
         q = select(User).where(User.tenant_id == tenant_id)
         if not include_inactive:
             q = q.where(User.is_active.is_(True))
-        q = q.order_by(User.created_at.desc())
-        result = await db.execute(q)
-        return list(result.scalars().all())
+        q = q.order_by(User.created_at.desc()).execution_options(yield_per=batch_size)
+        result = await db.stream(q)
+        async for batch in result.scalars().partitions():
+            yield batch
 
     @staticmethod
     async def get_user(db: AsyncSession, user_id: UUID, tenant_id: UUID) -> User | None:
-        result = await db.execute(
+        return await db.scalar(
             select(User).where(User.id == user_id, User.tenant_id == tenant_id)
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def update_user_role(
@@ -139,11 +142,11 @@ class UserService:
         user = await UserService.get_user(db, user_id, tenant_id)
         if not user:
             return None
+        # Every changed column is set client-side, so there is nothing to refresh; the
+        # UPDATE is left pending and flushed with the caller's audit row on commit.
         user.role = role
         user.warehouse_scope = warehouse_scope
         user.updated_at = datetime.now(timezone.utc)
-        await db.flush()
-        await db.refresh(user)
         return user
 
     @staticmethod
@@ -153,6 +156,4 @@ class UserService:
             return None
         user.is_active = False
         user.updated_at = datetime.now(timezone.utc)
-        await db.flush()
-        await db.refresh(user)
         return user
@@ -2,10 +2,10 @@
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.warehouse import StockLedger, Warehouse
+from app.models.warehouse import StockOnHand, Warehouse
 
 
 class WarehouseService:
@@ -13,14 +13,13 @@ class WarehouseService:
 
     @staticmethod
     async def get_by_id(db: AsyncSession, id: UUID, tenant_id: UUID) -> Warehouse | None:
-        result = await db.execute(
+        return await db.scalar(
             select(Warehouse).where(
                 Warehouse.id == id,
                 Warehouse.tenant_id == tenant_id,
                 Warehouse.is_active == True,
             )
         )
-        return result.scalar_one_or_none()
 
     @staticmethod
     async def list_active(db: AsyncSession, tenant_id: UUID) -> list[Warehouse]:
@@ -39,12 +38,11 @@ class WarehouseService:
     ) -> list[tuple[UUID, Decimal]]:
         """Returns list of (sku_id, quantity) for all SKUs with stock at warehouse."""
         result = await db.execute(
-            select(StockLedger.sku_id, func.coalesce(func.sum(StockLedger.quantity_delta), 0))
+            select(StockOnHand.sku_id, StockOnHand.quantity)
             .where(
-                StockLedger.tenant_id == tenant_id,
-                StockLedger.warehouse_id == warehouse_id,
+                StockOnHand.tenant_id == tenant_id,
+                StockOnHand.warehouse_id == warehouse_id,
+                StockOnHand.quantity > 0,
             )
-            .group_by(StockLedger.sku_id)
-            .having(func.sum(StockLedger.quantity_delta) > 0)
         )
         return [(row[0], Decimal(str(row[1]))) for row in result.all()]
@@ -1,12 +1,29 @@
 """NEXUS IMS — Workflow Engine (Block 9)."""
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from app.models.workflow import Workflow
 
 
+# Compiled trigger predicates keyed by (workflow.id, updated_at); a config edit that bumps
+# updated_at naturally misses the cache. Bounded LRU, per process.
+_PREDICATE_CACHE: OrderedDict[tuple, Callable[[dict], bool]] = OrderedDict()
+_PREDICATE_CACHE_SIZE = 1024
+
+
+def _always(payload: dict) -> bool:
+    return True
+
+
+def _never(payload: dict) -> bool:
+    return False
+
+
 class ConditionEvaluator:
     """Evaluates JSONB trigger conditions against a payload."""
 
@@ -23,60 +40,100 @@ class ConditionEvaluator:
             ]
         }
         """
+        return ConditionEvaluator.compile(conditions)(payload)
+
+    @staticmethod
+    def for_workflow(workflow: Workflow) -> Callable[[dict], bool]:
+        """Compiled predicate for workflow.trigger_config, cached per (id, updated_at)."""
+        key = (workflow.id, workflow.updated_at)
+        predicate = _PREDICATE_CACHE.get(key)
+        if predicate is None:
+            predicate = ConditionEvaluator.compile(workflow.trigger_config)
+            _PREDICATE_CACHE[key] = predicate
+            if len(_PREDICATE_CACHE) > _PREDICATE_CACHE_SIZE:
+                _PREDICATE_CACHE.popitem(last=False)
+        else:
+            _PREDICATE_CACHE.move_to_end(key)
+        return predicate
+
+    @staticmethod
+    def compile(conditions: dict) -> Callable[[dict], bool]:
+        """
+        Walk the condition tree once and return a predicate over payloads. Field paths are
+        pre-split and comparison operands pre-converted, so evaluation is plain calls.
+        """
         if not conditions:
-            return True  # No conditions = run always
+            return _always  # No conditions = run always
 
         op = conditions.get("operator", "AND").upper()
         sub_conditions = conditions.get("conditions", [])
 
         if not sub_conditions:
-            return True
+            return _always
 
         if op == "AND":
-            return all(ConditionEvaluator._eval_single(c, payload) for c in sub_conditions)
+            preds = tuple(ConditionEvaluator._compile_single(c) for c in sub_conditions)
+            return lambda payload: all(p(payload) for p in preds)
         elif op == "OR":
-            return any(ConditionEvaluator._eval_single(c, payload) for c in sub_conditions)
-        return False
+            preds = tuple(ConditionEvaluator._compile_single(c) for c in sub_conditions)
+            return lambda payload: any(p(payload) for p in preds)
+        return _never
 
     @staticmethod
-    def _eval_single(condition: dict, payload: dict) -> bool:
+    def _compile_single(condition: dict) -> Callable[[dict], bool]:
         if "operator" in condition and "conditions" in condition:
-            return ConditionEvaluator.evaluate(condition, payload)
+            return ConditionEvaluator.compile(condition)
 
         field = condition.get("field")
         operator = condition.get("operator")
         expected_value = condition.get("value")
 
         if not field or not operator:
-            return False
+            return _never
+
+        path = tuple(field.split("."))
 
         # Nested generic get
-        actual_value = payload
-        for part in field.split("."):
-            if isinstance(actual_value, dict):
-                actual_value = actual_value.get(part)
-            else:
-                actual_value = None
-                break
-
-        if actual_value is None and operator != "not_equals":
-            return False
-
-        try:
-            if operator == "equals":
-                return actual_value == expected_value
-            elif operator == "not_equals":
-                return actual_value != expected_value
-            elif operator == "greater_than":
-                return float(actual_value) > float(expected_value)
-            elif operator == "less_than":
-                return float(actual_value) < float(expected_value)
-            elif operator == "contains":
-                return str(expected_value).lower() in str(actual_value).lower()
-            else:
-                return False
-        except (ValueError, TypeError):
-            return False
+        def resolve(payload: dict) -> Any:
+            value = payload
+            for part in path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(part)
+            return value
+
+        if operator == "equals":
+            def pred(payload: dict) -> bool:
+                actual = resolve(payload)
+                return actual is not None and actual == expected_value
+        elif operator == "not_equals":
+            def pred(payload: dict) -> bool:
+                return resolve(payload) != expected_value
+        elif operator in ("greater_than", "less_than"):
+            try:
+                bound = float(expected_value)
+            except (ValueError, TypeError):
+                return _never
+            greater = operator == "greater_than"
+
+            def pred(payload: dict) -> bool:
+                actual = resolve(payload)
+                if actual is None:
+                    return False
+                try:
+                    actual = float(actual)
+                except (ValueError, TypeError):
+                    return False
+                return actual > bound if greater else actual < bound
+        elif operator == "contains":
+            needle = str(expected_value).lower()
+
+            def pred(payload: dict) -> bool:
+                actual = resolve(payload)
+                return actual is not None and needle in str(actual).lower()
+        else:
+            return _never
+        return pred
 
 
 class WorkflowEngine:
@@ -89,7 +146,9 @@ class WorkflowEngine:
         Returns a list of workflow lengths that were dispatched.
         """
         # Get active workflows matching tenant and trigger type
-        stmt = select(Workflow).where(
+        # Only trigger_config is needed here (actions run in the Celery task), so skip the
+        # selectin load of Workflow.actions on this per-ledger-event path
+        stmt = select(Workflow).options(lazyload(Workflow.actions)).where(
             Workflow.tenant_id == tenant_id,
             Workflow.trigger_type == trigger_type,
             Workflow.is_active == True,
@@ -102,7 +161,7 @@ class WorkflowEngine:
         from app.tasks.workflow_tasks import execute_workflow
 
         for workflow in workflows:
-            passed = ConditionEvaluator.evaluate(workflow.trigger_config, payload)
+            passed = ConditionEvaluator.for_workflow(workflow)(payload)
             if passed:
                 # Dispatch celery task
                 execute_workflow.delay(str(workflow.id), payload)
@@ -0,0 +1,34 @@
+"""NEXUS IMS — Partition maintenance Celery task.
+
+- ensure_partitions:  Celery Beat runs daily — pre-creates upcoming monthly partitions of
+                      stock_ledger and audit_log so inserts never land outside a range.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+from app.db.session import task_session
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = ("stock_ledger", "audit_log")
+MONTHS_AHEAD = 2
+
+
+@celery_app.task
+def ensure_partitions() -> None:
+    asyncio.run(_ensure_partitions_async())
+
+
+async def _ensure_partitions_async() -> None:
+    async with task_session() as db:
+        for table in PARTITIONED_TABLES:
+            # ensure_monthly_partitions() is defined by migration 0017 and is idempotent
+            await db.execute(
+                text("SELECT ensure_monthly_partitions(:table, now(), :ahead)"),
+                {"table": table, "ahead": MONTHS_AHEAD},
+            )
+        await db.commit()
+    logger.info("Partitions ensured %d months ahead for %s", MONTHS_AHEAD, ", ".join(PARTITIONED_TABLES))
@@ -41,7 +41,8 @@ def refresh_dashboard_cache(self):
     """Refresh dashboard KPI cache for all tenants. Run by Celery Beat every 60s."""
     from sqlalchemy.orm import Session
     from app.models.item_type import SKU
-    from app.models.warehouse import StockLedger, Warehouse
+    from app.models.warehouse import StockOnHand, Warehouse
+    from app.db.types import from_minor
     from app.models.location import TransferOrder, TransferStatus
     from app.models.tenant import Tenant
 
@@ -64,11 +65,11 @@ def refresh_dashboard_cache(self):
                     # Inventory value
                     stock_sub = (
                         select(
-                            StockLedger.sku_id,
-                            func.sum(StockLedger.quantity_delta).label("qty"),
+                            StockOnHand.sku_id,
+                            from_minor(func.sum(StockOnHand.quantity)).label("qty"),
                         )
-                        .where(StockLedger.tenant_id == tenant_id)
-                        .group_by(StockLedger.sku_id)
+                        .where(StockOnHand.tenant_id == tenant_id)
+                        .group_by(StockOnHand.sku_id)
                         .subquery()
                     )
                     valuation = db.execute(
@@ -121,7 +122,8 @@ def generate_csv_export(self, job_id: str, tenant_id_str: str, report_type: str)
     """Generate CSV export and store download content in Redis (24h TTL)."""
     from sqlalchemy.orm import Session
     from app.models.item_type import SKU
-    from app.models.warehouse import StockLedger, Warehouse
+    from app.models.warehouse import StockLedger, StockOnHand, Warehouse
+    from app.db.types import from_minor
 
     engine = _sync_engine()
     r = _sync_redis()
@@ -136,12 +138,11 @@ def generate_csv_export(self, job_id: str, tenant_id_str: str, report_type: str)
                 writer.writerow(["SKU Code", "SKU Name", "Warehouse", "Quantity", "Unit Cost", "Line Value"])
                 stock_sub = (
                     select(
-                        StockLedger.sku_id,
-                        StockLedger.warehouse_id,
-                        func.sum(StockLedger.quantity_delta).label("qty"),
+                        StockOnHand.sku_id,
+                        StockOnHand.warehouse_id,
+                        from_minor(StockOnHand.quantity).label("qty"),
                     )
-                    .where(StockLedger.tenant_id == tenant_id)
-                    .group_by(StockLedger.sku_id, StockLedger.warehouse_id)
+                    .where(StockOnHand.tenant_id == tenant_id)
                     .subquery()
                 )
                 rows = db.execute(
@@ -181,12 +182,11 @@ def generate_csv_export(self, job_id: str, tenant_id_str: str, report_type: str)
                 writer.writerow(["SKU Code", "SKU Name", "Warehouse", "Current Stock", "Reorder Point", "Deficit"])
                 stock_sub = (
                     select(
-                        StockLedger.sku_id,
-                        StockLedger.warehouse_id,
-                        func.sum(StockLedger.quantity_delta).label("qty"),
+                        StockOnHand.sku_id,
+                        StockOnHand.warehouse_id,
+                        from_minor(StockOnHand.quantity).label("qty"),
                     )
-                    .where(StockLedger.tenant_id == tenant_id)
-                    .group_by(StockLedger.sku_id, StockLedger.warehouse_id)
+                    .where(StockOnHand.tenant_id == tenant_id)
                     .subquery()
                 )
                 rows = db.execute(
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 
 import httpx
 
-from app.db.session import async_session_factory
+from app.db.session import task_session
 from app.models.webhook import Webhook, WebhookDelivery
 from app.worker import celery_app
 
@@ -31,7 +31,7 @@ def deliver_webhook(self, delivery_id: str) -> None:
 
 
 async def _deliver_webhook_async(task, delivery_id: str) -> None:
-    async with async_session_factory() as db:
+    async with task_session() as db:
         # Fetch delivery and webhook config
         from sqlalchemy import select
         from sqlalchemy.orm import selectinload
@@ -2,8 +2,8 @@
 import json
 import logging
 
-from app.db.session import async_session_factory
-from app.models.workflow import ActionType, WorkflowAction, WorkflowExecution, ExecutionStatus
+from app.db.session import task_session
+from app.models.workflow import ERROR_MESSAGE_MAX_LEN, ActionType, Workflow, WorkflowExecution, ExecutionStatus
 from app.worker import celery_app
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ def execute_workflow(self, workflow_id: str, payload: dict) -> list[dict]:
 
 
 async def _execute_workflow_async(workflow_id: str, payload: dict) -> list[dict]:
-    async with async_session_factory() as db:
+    async with task_session() as db:
         from sqlalchemy import select
 
         # Create Execution Record
@@ -33,40 +33,40 @@ async def _execute_workflow_async(workflow_id: str, payload: dict) -> list[dict]
         db.add(execution)
         await db.commit()
 
-        # Fetch Actions
-        stmt = select(WorkflowAction).where(WorkflowAction.workflow_id == workflow_id).order_by(WorkflowAction.sequence_order)
-        result = await db.execute(stmt)
-        actions = result.scalars().all()
+        # Fetch Actions: the trigger-maintained copy on the workflow row, already ordered
+        actions = await db.scalar(select(Workflow.actions_json).where(Workflow.id == workflow_id)) or []
 
         results = []
         has_failure = False
 
         for action in actions:
+            action_type, action_config = action["action_type"], action["action_config"]
             action_result = {
-                "action_id": str(action.id),
-                "type": action.action_type,
+                "action_id": action["id"],
+                "type": action_type,
                 "status": "SUCCESS",
                 "error": None
             }
             try:
                 # Dispatch to specific action handlers
-                if action.action_type == ActionType.PRINT_LABEL:
-                    await _handle_print_label(action.action_config, payload)
-                elif action.action_type == ActionType.SEND_EMAIL:
-                    await _handle_send_email(action.action_config, payload)
-                elif action.action_type == ActionType.WEBHOOK:
-                    await _handle_webhook(action.action_config, payload)
-                elif action.action_type == ActionType.FLAG_FOR_REVIEW:
-                    await _handle_flag_review(action.action_config, payload, db)
-                elif action.action_type == ActionType.NOTIFY_USER:
-                    await _handle_notify_user(action.action_config, payload, db)
+                if action_type == ActionType.PRINT_LABEL:
+                    await _handle_print_label(action_config, payload)
+                elif action_type == ActionType.SEND_EMAIL:
+                    await _handle_send_email(action_config, payload)
+                elif action_type == ActionType.WEBHOOK:
+                    await _handle_webhook(action_config, payload)
+                elif action_type == ActionType.FLAG_FOR_REVIEW:
+                    await _handle_flag_review(action_config, payload, db)
+                elif action_type == ActionType.NOTIFY_USER:
+                    await _handle_notify_user(action_config, payload, db)
                 else:
-                    raise ValueError(f"Unknown action type: {action.action_type}")
+                    raise ValueError(f"Unknown action type: {action_type}")
 
             except Exception as e:
-                logger.error(f"Action {action.action_type} failed: {e}")
+                logger.error(f"Action {action_type} failed: {e}")
                 action_result["status"] = "FAILED"
-                action_result["error"] = str(e)
+                action_result["error"] = str(e)[:ERROR_MESSAGE_MAX_LEN]
+                execution.error_message = action_result["error"]
                 has_failure = True
                 # Decide if we stop on first failure or continue. Block 9 spec implies stop sequence.
                 results.append(action_result)
@@ -30,7 +30,8 @@ celery_app.conf.update(
         "app.tasks", 
         "app.tasks.report_tasks",
         "app.tasks.workflow_tasks",
-        "app.tasks.webhook_tasks"
+        "app.tasks.webhook_tasks",
+        "app.tasks.partition_tasks",
     ],
 )
 
@@ -40,4 +41,8 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.report_tasks.refresh_dashboard_cache",
         "schedule": 60.0,  # every 60 seconds
     },
+    "ensure-partitions-daily": {
+        "task": "app.tasks.partition_tasks.ensure_partitions",
+        "schedule": 86400.0,  # daily; partitions are kept two months ahead
+    },
 }
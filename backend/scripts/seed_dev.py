@@ -41,9 +41,8 @@ async def seed():
         tenant_id = tenant_result.scalar_one()
 
         # Create dev user (password: dev123)
-        from passlib.context import CryptContext
-        pwd = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
-        hashed = pwd.hash("dev123")
+        import bcrypt
+        hashed = bcrypt.hashpw(b"dev123", bcrypt.gensalt(rounds=10)).decode()
 
         await session.execute(
             text("""